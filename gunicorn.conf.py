@@ -36,7 +36,7 @@ worker_tmp_dir = "/dev/shm"  # Use shared memory for temp files
 
 # Timeout settings
 timeout = 30
-keepalive = 2
+keepalive = 75  # Outlive the proxy's idle keep-alive so it can reuse connections
 graceful_timeout = 30
 
 # Logging
@@ -63,6 +63,17 @@ raw_env = [
     "WERKZEUG_RUN_MAIN=true",
 ]
 
+# With preload_app the master imports the app, and with it opens the
+# database, before forking; close it there and give each worker its own
+# connections, since SQLite handles must not cross a fork
+def when_ready(server):
+    from src.database.database_manager import get_db_manager
+    get_db_manager().close()
+
+def post_fork(server, worker):
+    from src.database.database_manager import get_db_manager
+    get_db_manager().reopen()
+
 # SSL (uncomment for HTTPS)
 # keyfile = "/path/to/keyfile"
 # certfile = "/path/to/certfile"
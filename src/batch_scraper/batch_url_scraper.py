@@ -10,20 +10,25 @@ import time
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from itertools import islice
+from urllib.parse import urlparse
+from typing import List, Dict, Any, Iterable, Iterator, Optional
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 import threading
 
+import orjson
+import requests
+
 try:
     # Try relative imports first (when running as package)
     from ..crawler.alopecosa_crawler import AlopecosaCrawler
     from ..database.database_manager import db_manager
-    from ..utils.config import CRAWLER_CONFIG
+    from ..utils.config import CRAWLER_CONFIG, EXCLUDED_EXTENSION_PATTERN
 except ImportError:
     # Fall back to absolute imports (when running from project root)
     from src.crawler.alopecosa_crawler import AlopecosaCrawler
     from src.database.database_manager import db_manager
-    from src.utils.config import CRAWLER_CONFIG
+    from src.utils.config import CRAWLER_CONFIG, EXCLUDED_EXTENSION_PATTERN
 
 # Configure logging
 logging.basicConfig(
@@ -32,22 +37,51 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Micro-batches scraped concurrently by scrape_urls_async
+MAX_BATCHES_IN_FLIGHT = 4
+
+def iter_microbatches(urls: Iterable[str], batch_size: int = 32) -> Iterator[List[str]]:
+    """Split URLs into lists of at most batch_size, without materializing them all"""
+    urls = iter(urls)
+    while True:
+        batch = list(islice(urls, batch_size))
+        if not batch:
+            return
+        yield batch
+
+def unique_urls(urls: List[str]) -> List[str]:
+    """URLs in first-seen order with exact duplicates dropped"""
+    unique = list(dict.fromkeys(urls))
+    if len(unique) < len(urls):
+        logger.info(f"Skipping {len(urls) - len(unique)} duplicate URLs")
+    return unique
+
 class BatchURLScraper:
     """Batch scraper for processing multiple URLs"""
     
-    def __init__(self, max_workers: int = 3, delay_between_crawls: float = 2.0):
+    def __init__(self, max_workers: int = 3, delay_between_crawls: float = 2.0,
+                 per_host_limit: int = 2):
         """
         Initialize the batch scraper
         
         Args:
             max_workers: Maximum number of concurrent crawlers
-            delay_between_crawls: Delay between starting new crawls (seconds)
+            delay_between_crawls: Delay between starting new crawls of the same host (seconds)
+            per_host_limit: Maximum concurrent crawls of any one host
         """
         self.max_workers = max_workers
         self.delay_between_crawls = delay_between_crawls
+        self.per_host_limit = per_host_limit
+        self._host_semaphores = {}
+        self._host_next_start = {}
         self.results = {}
         self.errors = {}
         self.lock = threading.Lock()
+        self._batch_executor = None
+        
+        # One connection pool for every crawl this scraper runs, so repeated
+        # batches against the same hosts reuse keep-alive connections
+        self.session = requests.Session()
         
         # Ensure database is initialized
         try:
@@ -102,8 +136,8 @@ class BatchURLScraper:
                             urls.append(row[0].strip())
             
             elif file_type == 'json':
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
+                with open(file_path, 'rb') as f:
+                    data = orjson.loads(f.read())
                     if isinstance(data, list):
                         urls = [str(url) for url in data if url]
                     elif isinstance(data, dict) and 'urls' in data:
@@ -165,6 +199,30 @@ class BatchURLScraper:
         logger.info(f"Created sample URL files in {sample_dir}/")
         return sample_dir
     
+    def _host_semaphore(self, url: str) -> threading.Semaphore:
+        """Return the semaphore limiting concurrent crawls of url's host"""
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            semaphore = self._host_semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.Semaphore(self.per_host_limit)
+                self._host_semaphores[host] = semaphore
+            return semaphore
+    
+    def _wait_for_host_turn(self, url: str):
+        """Space out crawl starts of url's host by delay_between_crawls"""
+        if self.delay_between_crawls <= 0:
+            return
+        
+        host = urlparse(url).netloc.lower()
+        with self.lock:
+            now = time.monotonic()
+            start_at = max(now, self._host_next_start.get(host, 0.0))
+            self._host_next_start[host] = start_at + self.delay_between_crawls
+        
+        if start_at > now:
+            time.sleep(start_at - now)
+    
     def scrape_single_url(self, url: str, config: dict) -> Dict[str, Any]:
         """
         Scrape a single URL with the given configuration
@@ -176,7 +234,7 @@ class BatchURLScraper:
         Returns:
             Dictionary containing scrape results and metadata
         """
-        start_time = time.time()
+        start_time = time.monotonic()
         result = {
             'url': url,
             'success': False,
@@ -189,27 +247,46 @@ class BatchURLScraper:
             'results': []
         }
         
+        # Files such as PDFs or images would be rejected by the crawler anyway;
+        # skip them before paying for a crawler and its robots.txt fetch
+        if EXCLUDED_EXTENSION_PATTERN.search(url):
+            result.update({
+                'end_time': datetime.now(),
+                'error': 'Excluded file type',
+                'crawl_duration': time.monotonic() - start_time
+            })
+            logger.info(f"Skipping {url}: excluded file type")
+            return result
+        
         try:
-            logger.info(f"Starting crawl of {url}")
-            
-            # Create crawler instance with proper configuration
-            crawler = AlopecosaCrawler(
-                base_url=url,
-                max_depth=config.get('default_max_depth', 3),
-                max_pages=config.get('default_max_pages', 100),
-                delay_range=config.get('default_delay_range', (1, 3))
-            )
-            
-            # Run the crawl
-            results = crawler.crawl()
+            # Politeness is enforced per host, so workers crawling different
+            # sites never wait on each other
+            with self._host_semaphore(url):
+                self._wait_for_host_turn(url)
+                logger.info(f"Starting crawl of {url}")
+                
+                # Create crawler instance with proper configuration
+                crawler = AlopecosaCrawler(
+                    base_url=url,
+                    max_depth=config.get('default_max_depth', 3),
+                    max_pages=config.get('default_max_pages', 100),
+                    delay_range=config.get('default_delay_range', (1, 3)),
+                    visited_bloom_capacity=config.get('visited_bloom_capacity'),
+                    visited_bloom_error_rate=config.get('visited_bloom_error_rate', 0.001),
+                    session=self.session
+                )
+                
+                # Run the crawl
+                results = crawler.crawl()
             
             # Calculate statistics
             end_time = datetime.now()
-            crawl_duration = time.time() - start_time
+            crawl_duration = time.monotonic() - start_time
             
-            # Store results in database
+            # Store results in database; the background writer batches the
+            # sessions of concurrent workers into shared transactions
             try:
-                session_id = db_manager.store_crawl_results(
+                session_id = db_manager.enqueue_results(
                     session_name=f"Batch Crawl - {url}",
                     base_url=url,
                     max_depth=config.get('default_max_depth', 3),
@@ -218,7 +295,7 @@ class BatchURLScraper:
                     start_time=result['start_time'],
                     end_time=end_time,
                     status='completed'
-                )
+                ).result()
                 result['session_id'] = session_id
                 logger.info(f"Stored results in database with session ID: {session_id}")
             except Exception as e:
@@ -242,7 +319,7 @@ class BatchURLScraper:
             result.update({
                 'end_time': end_time,
                 'error': str(e),
-                'crawl_duration': time.time() - start_time
+                'crawl_duration': time.monotonic() - start_time
             })
             logger.error(f"Failed to crawl {url}: {e}")
         
@@ -259,10 +336,59 @@ class BatchURLScraper:
         Returns:
             Dictionary containing all scrape results
         """
+        self.scrape_batch(urls, config)
+        
+        # Generate summary
+        summary = self._generate_summary()
+        logger.info(f"Batch scrape completed: {summary['successful']} successful, {summary['failed']} failed")
+        
+        return {
+            'summary': summary,
+            'results': self.results,
+            'errors': self.errors
+        }
+    
+    def scrape_urls_async(self, urls: List[str], config: dict = None) -> Future:
+        """
+        Scrape a micro-batch of URLs in the background
+        
+        Args:
+            urls: URLs in this batch
+            config: Crawler configuration dictionary (uses default if None)
+        
+        Returns:
+            Future resolving to this batch's results keyed by URL. Only the
+            per-URL summaries are kept on the scraper, so memory stays bounded
+            by the batches in flight rather than by the whole URL list.
+        """
+        with self.lock:
+            if self._batch_executor is None:
+                self._batch_executor = ThreadPoolExecutor(
+                    max_workers=MAX_BATCHES_IN_FLIGHT,
+                    thread_name_prefix='batch'
+                )
+        return self._batch_executor.submit(self.scrape_batch, urls, config, False)
+    
+    def scrape_batch(self, urls: List[str], config: dict = None,
+                     keep_pages: bool = True) -> Dict[str, Dict[str, Any]]:
+        """
+        Scrape a list of URLs using thread pool and record the outcomes
+        
+        Args:
+            urls: List of URLs to scrape
+            config: Crawler configuration dictionary (uses default if None)
+            keep_pages: Keep crawled pages in self.results, not just summaries
+        
+        Returns:
+            Results of this call keyed by URL, including crawled pages
+            when keep_pages is set
+        """
         if config is None:
             config = CRAWLER_CONFIG.copy()
         
+        urls = unique_urls(urls)
         logger.info(f"Starting batch scrape of {len(urls)} URLs with {self.max_workers} workers")
+        batch_results = {}
         
         # Create thread pool
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
@@ -277,44 +403,64 @@ class BatchURLScraper:
                 url = future_to_url[future]
                 try:
                     result = future.result()
-                    
-                    with self.lock:
-                        if result['success']:
-                            self.results[url] = result
-                        else:
-                            self.errors[url] = result
-                    
-                    # Add delay between crawls to be respectful
-                    time.sleep(self.delay_between_crawls)
-                    
                 except Exception as e:
-                    logger.error(f"Unexpected error processing {url}: {e}")
-                    with self.lock:
-                        self.errors[url] = {
-                            'url': url,
-                            'success': False,
-                            'error': f"Unexpected error: {e}",
-                            'start_time': datetime.now(),
-                            'end_time': datetime.now()
-                        }
+                    result = e
+                self.record_outcome(url, result, batch_results, keep_pages)
         
-        # Generate summary
-        summary = self._generate_summary()
-        logger.info(f"Batch scrape completed: {summary['successful']} successful, {summary['failed']} failed")
+        return batch_results
+    
+    def record_outcome(self, url: str, result, batch_results: Dict[str, Dict[str, Any]],
+                       keep_pages: bool, remember: bool = True):
+        """
+        File one URL's result (or the exception it raised) in batch_results
+        and, if remember is set, under results or errors; crawled pages are
+        dropped from both unless keep_pages is set
         
-        return {
-            'summary': summary,
-            'results': self.results,
-            'errors': self.errors
-        }
+        Long-lived scrapers that only need each batch's own outcomes pass
+        remember=False, so results and errors do not grow across batches.
+        """
+        if isinstance(result, BaseException):
+            logger.error(f"Unexpected error processing {url}: {result}")
+            failed_at = datetime.now()
+            error = {
+                'url': url,
+                'success': False,
+                'error': f"Unexpected error: {result}",
+                'start_time': failed_at,
+                'end_time': failed_at
+            }
+            batch_results[url] = error
+            if remember:
+                with self.lock:
+                    self.errors[url] = error
+            return
+        
+        recorded = result if keep_pages else {k: v for k, v in result.items() if k != 'results'}
+        batch_results[url] = recorded
+        if not remember:
+            return
+        with self.lock:
+            if result['success']:
+                self.results[url] = recorded
+            else:
+                self.errors[url] = recorded
+    
+    def summarize_batch(self, batch_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """Summary statistics for the results returned by one scrape_batch call"""
+        successful = {url: r for url, r in batch_results.items() if r['success']}
+        failed = {url: r for url, r in batch_results.items() if not r['success']}
+        return self._generate_summary(successful, failed)
     
-    def _generate_summary(self) -> Dict[str, Any]:
-        """Generate summary statistics from batch scrape"""
-        successful = len(self.results)
-        failed = len(self.errors)
-        total_pages = sum(r['pages_crawled'] for r in self.results.values())
-        total_links = sum(r['links_found'] for r in self.results.values())
-        total_duration = sum(r.get('crawl_duration', 0) for r in self.results.values())
+    def _generate_summary(self, results: Dict[str, Dict[str, Any]] = None,
+                          errors: Dict[str, Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Generate summary statistics from batch scrape (all recorded outcomes by default)"""
+        results = self.results if results is None else results
+        errors = self.errors if errors is None else errors
+        successful = len(results)
+        failed = len(errors)
+        total_pages = sum(r['pages_crawled'] for r in results.values())
+        total_links = sum(r['links_found'] for r in results.values())
+        total_duration = sum(r.get('crawl_duration', 0) for r in results.values())
         
         return {
             'total_urls': successful + failed,
@@ -434,7 +580,7 @@ def main():
         '--delay',
         type=float,
         default=2.0,
-        help='Delay between starting new crawls in seconds (default: 2.0)'
+        help='Delay between starting new crawls of the same host in seconds (default: 2.0)'
     )
     parser.add_argument(
         '--max-depth',
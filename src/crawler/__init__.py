@@ -2,6 +2,20 @@
 Crawler package for Alopecosa Fabrilis Web Crawler
 """
 
-from .alopecosa_crawler import AlopecosaCrawler, CrawlResult
+from .alopecosa_crawler import (
+    AlopecosaCrawler, CrawlResult, ShardedCrawler, canonicalize_url, crawl_shard, sharded_crawl
+)
+from .bloom_filter import BloomFilter, ScalableBloomFilter
+from .http_cache import CachingSession
 
-__all__ = ['AlopecosaCrawler', 'CrawlResult']
+__all__ = [
+    'AlopecosaCrawler',
+    'BloomFilter',
+    'CachingSession',
+    'CrawlResult',
+    'ScalableBloomFilter',
+    'ShardedCrawler',
+    'canonicalize_url',
+    'crawl_shard',
+    'sharded_crawl'
+]
@@ -11,13 +11,20 @@ import time
 import hashlib
 import re
 from typing import Set, Dict, List, Optional, Tuple
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from collections import defaultdict, deque
 
 # Import the original crawler
 from .alopecosa_crawler import AlopecosaCrawler, CrawlResult
 
+try:
+    # Try relative imports first (when running as package)
+    from ..utils.ai_dispatcher import AIOHTTP_AVAILABLE, call_openai_sync
+except ImportError:
+    # Fall back to absolute imports (when running from project root)
+    from src.utils.ai_dispatcher import AIOHTTP_AVAILABLE, call_openai_sync
+
 # For embeddings and similarity (optional - can work without)
 try:
     from sklearn.feature_extraction.text import TfidfVectorizer
@@ -26,6 +33,20 @@ try:
 except ImportError:
     SKLEARN_AVAILABLE = False
 
+# Packed embedding storage for similarity lookups (optional)
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Faster JSON parsing for AI responses (optional - falls back to json)
+try:
+    import orjson
+    json_loads = orjson.loads
+except ImportError:
+    json_loads = json.loads
+
 # OpenAI integration
 try:
     import openai
@@ -49,6 +70,59 @@ class AIAnalysis:
     embedding: Optional[List[float]] = None
 
 
+class EmbeddingIndex:
+    """
+    Embeddings stored unit-normalized as float16 rows of one matrix, so a
+    similarity lookup is a single matrix-vector product instead of a
+    Python loop over lists of 1536 floats. float16 moves cosine similarity
+    by about 1e-3, which doesn't matter against a 0.9 threshold.
+    """
+    
+    def __init__(self):
+        self.items = []
+        self._matrix = None
+    
+    def __len__(self) -> int:
+        return len(self.items)
+    
+    @staticmethod
+    def _normalize(embedding) -> Optional['np.ndarray']:
+        if not NUMPY_AVAILABLE or embedding is None or len(embedding) == 0:
+            return None
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else None
+    
+    def add(self, embedding, item):
+        """Store an embedding with the item to return when it is the best match"""
+        vector = self._normalize(embedding)
+        if vector is None:
+            return
+        
+        size = len(self.items)
+        if self._matrix is None:
+            self._matrix = np.empty((16, vector.shape[0]), dtype=np.float16)
+        elif vector.shape[0] != self._matrix.shape[1]:
+            return
+        elif size == self._matrix.shape[0]:
+            # Grow geometrically so appends stay amortized O(1)
+            self._matrix = np.concatenate([self._matrix, np.empty_like(self._matrix)])
+        
+        self._matrix[size] = vector
+        self.items.append(item)
+    
+    def best_match(self, embedding) -> Tuple[Optional[object], float]:
+        """Return the most similar stored item and its cosine similarity"""
+        vector = self._normalize(embedding)
+        if vector is None or not self.items or vector.shape[0] != self._matrix.shape[1]:
+            return None, 0.0
+        
+        # Accumulate in float32: float16 matmul has no BLAS fast path
+        similarities = self._matrix[:len(self.items)].astype(np.float32) @ vector
+        best = int(similarities.argmax())
+        return self.items[best], float(similarities[best])
+
+
 @dataclass
 class SmartCrawlResult(CrawlResult):
     """Enhanced crawl result with AI analysis"""
@@ -93,12 +167,20 @@ class AIEnhancedCrawler(AlopecosaCrawler):
         self.crawl_objective = crawl_objective or "General web crawling for information discovery"
         self.target_topics = target_topics or []
         
-        # AI-enhanced attributes
-        self.content_embeddings = {}
+        # AI-enhanced attributes; page embeddings are indexed by URL for
+        # near-duplicate detection
+        self.content_embeddings = EmbeddingIndex()
         self.content_hashes = set()
         self.topic_model = None
         self.relevance_threshold = 0.6
         self.quality_threshold = 0.7
+        self.similarity_threshold = 0.9
+        
+        # Analyses reused for repeated or near-identical pages: exact matches
+        # by content key, near-duplicates by embedding similarity
+        self.analysis_cache = {}
+        self.analysis_cache_embeddings = EmbeddingIndex()
+        self.analysis_cache_hits = 0
         
         # Smart prioritization
         self.url_priorities = defaultdict(float)
@@ -139,14 +221,7 @@ class AIEnhancedCrawler(AlopecosaCrawler):
                     Focus on terms that would appear in web content about this topic.
                     """
                     
-                    response = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=150,
-                        temperature=0.3
-                    )
-                    
-                    keyword_text = response.choices[0].message.content.strip()
+                    keyword_text = self._complete_chat(prompt, max_tokens=150, temperature=0.3)
                     keywords[topic] = [kw.strip() for kw in keyword_text.split(',')]
                     
                     self.logger.info(f"Extracted {len(keywords[topic])} keywords for topic: {topic}")
@@ -160,6 +235,24 @@ class AIEnhancedCrawler(AlopecosaCrawler):
             
         return keywords
 
+    def _complete_chat(self, prompt: str, max_tokens: int, temperature: float) -> str:
+        """
+        Send one chat completion and return the reply text. With aiohttp
+        installed the request goes through the shared dispatcher, so keyword
+        extraction, page analysis and URL scoring share one rate limit
+        """
+        if AIOHTTP_AVAILABLE:
+            return call_openai_sync(prompt, model="gpt-3.5-turbo", max_tokens=max_tokens,
+                                    temperature=temperature, api_key=self.openai_api_key)
+        
+        response = self.client.chat.completions.create(
+            model="gpt-3.5-turbo",
+            messages=[{"role": "user", "content": prompt}],
+            max_tokens=max_tokens,
+            temperature=temperature
+        )
+        return response.choices[0].message.content.strip()
+
     def _extract_keywords_fallback(self) -> Dict[str, List[str]]:
         """Fallback keyword extraction without AI"""
         keywords = {}
@@ -185,7 +278,22 @@ class AIEnhancedCrawler(AlopecosaCrawler):
         if not self.use_ai:
             return self._analyze_content_fallback(content, title, url)
         
+        cache_key = self._analysis_cache_key(content, title)
+        cached = self.analysis_cache.get(cache_key)
+        if cached:
+            self.analysis_cache_hits += 1
+            return cached
+        
         try:
+            # Embed first so a near-duplicate page can reuse an earlier analysis
+            embedding = self._create_content_embedding(content[:1000])
+            similar = self._find_similar_analysis(embedding)
+            if similar:
+                self.analysis_cache_hits += 1
+                analysis = replace(similar, embedding=embedding)
+                self.analysis_cache[cache_key] = analysis
+                return analysis
+            
             # Create analysis prompt
             prompt = f"""
             Analyze the following web content for a web crawler with this objective: "{self.crawl_objective}"
@@ -208,26 +316,20 @@ class AIEnhancedCrawler(AlopecosaCrawler):
             }}
             """
             
-            response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=400,
-                temperature=0.2
-            )
+            analysis_text = self._complete_chat(prompt, max_tokens=400, temperature=0.2)
             
-            analysis_text = response.choices[0].message.content.strip()
-            
-            # Parse JSON response
+            # Parse JSON response; models often wrap it in prose or code
+            # fences, so parse just the outermost object in a single pass
+            start, end = analysis_text.find('{'), analysis_text.rfind('}')
             try:
-                analysis_data = json.loads(analysis_text)
-            except json.JSONDecodeError:
+                analysis_data = json_loads(analysis_text[start:end + 1] if 0 <= start < end else analysis_text)
+                if not isinstance(analysis_data, dict):
+                    raise ValueError("analysis is not a JSON object")
+            except ValueError:
                 # Fallback parsing if JSON is malformed
                 analysis_data = self._parse_analysis_fallback(analysis_text)
             
-            # Create embedding for semantic search
-            embedding = self._create_content_embedding(content[:1000])
-            
-            return AIAnalysis(
+            analysis = AIAnalysis(
                 relevance_score=float(analysis_data.get('relevance_score', 0.5)),
                 quality_score=float(analysis_data.get('quality_score', 0.5)),
                 category=analysis_data.get('category', 'unknown'),
@@ -239,10 +341,26 @@ class AIEnhancedCrawler(AlopecosaCrawler):
                 embedding=embedding
             )
             
+            self.analysis_cache[cache_key] = analysis
+            self.analysis_cache_embeddings.add(embedding, analysis)
+            return analysis
+            
         except Exception as e:
             self.logger.error(f"Error in AI content analysis: {e}")
             return self._analyze_content_fallback(content, title, url)
 
+    def _analysis_cache_key(self, content: str, title: str) -> str:
+        """Key an analysis by everything the prompt depends on apart from the URL"""
+        key_text = '\x1f'.join([self.crawl_objective, ','.join(self.target_topics), title or '', content[:2000]])
+        return hashlib.sha256(key_text.encode('utf-8')).hexdigest()
+
+    def _find_similar_analysis(self, embedding: List[float]) -> Optional[AIAnalysis]:
+        """Return a cached analysis whose page embedding is within similarity_threshold"""
+        analysis, similarity = self.analysis_cache_embeddings.best_match(embedding)
+        if analysis is not None and similarity >= self.similarity_threshold:
+            return analysis
+        return None
+
     def _analyze_content_fallback(self, content: str, title: str, url: str) -> AIAnalysis:
         """Fallback content analysis without AI"""
         # Simple heuristics-based analysis
@@ -358,20 +476,15 @@ class AIEnhancedCrawler(AlopecosaCrawler):
                     Respond with only a number between 0.0 and 1.0.
                     """
                     
-                    response = self.client.chat.completions.create(
-                        model="gpt-3.5-turbo",
-                        messages=[{"role": "user", "content": prompt}],
-                        max_tokens=10,
-                        temperature=0.1
-                    )
+                    reply = self._complete_chat(prompt, max_tokens=10, temperature=0.1)
                     
                     try:
-                        ai_score = float(response.choices[0].message.content.strip())
+                        ai_score = float(reply)
                         base_score = (base_score + ai_score) / 2
-                    except (ValueError, AttributeError):
+                    except ValueError:
                         pass
                 except Exception as e:
-                    self.logger.debug(f"AI URL prioritization failed: {e}")
+                    self.logger.debug("AI URL prioritization failed: %s", e)
             
             return max(0.0, min(1.0, base_score))
             
@@ -379,7 +492,7 @@ class AIEnhancedCrawler(AlopecosaCrawler):
             self.logger.error(f"Error calculating URL priority: {e}")
             return 0.5
 
-    def _is_duplicate_content(self, content: str) -> Tuple[bool, str]:
+    def _is_duplicate_content(self, content: str, embedding: List[float] = None) -> Tuple[bool, str]:
         """Check if content is duplicate using hashing and similarity"""
         # Create content hash
         content_hash = hashlib.md5(content.encode()).hexdigest()
@@ -387,23 +500,16 @@ class AIEnhancedCrawler(AlopecosaCrawler):
         if content_hash in self.content_hashes:
             return True, content_hash
         
-        # Check semantic similarity if we have embeddings
-        if self.content_embeddings and self.use_ai:
-            current_embedding = self._create_content_embedding(content[:1000])
-            if current_embedding:
-                similarities = []
-                for url, embedding in self.content_embeddings.items():
-                    if embedding:
-                        try:
-                            similarity = cosine_similarity([current_embedding], [embedding])[0][0]
-                            similarities.append((url, similarity))
-                        except:
-                            continue
-                
-                # If very similar content exists, mark as duplicate
-                max_similarity = max(similarities, key=lambda x: x[1])[1] if similarities else 0
-                if max_similarity > 0.9:  # 90% similarity threshold
-                    return True, content_hash
+        # Check semantic similarity if we have embeddings, reusing the one
+        # computed during analysis when the caller has it
+        if len(self.content_embeddings) and self.use_ai:
+            if embedding is None:
+                embedding = self._create_content_embedding(content[:1000])
+            
+            # If very similar content exists, mark as duplicate
+            _, max_similarity = self.content_embeddings.best_match(embedding)
+            if max_similarity > self.similarity_threshold:
+                return True, content_hash
         
         # Fallback: simple text similarity using TF-IDF
         if not self.use_ai and SKLEARN_AVAILABLE and self.vectorizer:
@@ -456,7 +562,7 @@ class AIEnhancedCrawler(AlopecosaCrawler):
             return None
         
         # Perform AI analysis
-        start_ai_time = time.time()
+        start_ai_time = time.monotonic()
         
         ai_analysis = self._analyze_content_with_ai(
             basic_result.content, 
@@ -465,17 +571,17 @@ class AIEnhancedCrawler(AlopecosaCrawler):
         )
         
         # Check for duplicates
-        is_duplicate, content_hash = self._is_duplicate_content(basic_result.content)
+        is_duplicate, content_hash = self._is_duplicate_content(basic_result.content, ai_analysis.embedding)
         
         # Store embedding for future similarity checks
         if ai_analysis.embedding:
-            self.content_embeddings[url] = ai_analysis.embedding
+            self.content_embeddings.add(ai_analysis.embedding, url)
         
         # Calculate priority score
         priority_score = (ai_analysis.relevance_score + ai_analysis.quality_score) / 2
         
         # Track AI processing time
-        self.ai_analysis_time += time.time() - start_ai_time
+        self.ai_analysis_time += time.monotonic() - start_ai_time
         self.total_ai_calls += 1
         
         # Create enhanced result
@@ -670,7 +776,8 @@ class AIEnhancedCrawler(AlopecosaCrawler):
             'highly_relevant_pages': len([r for r in valid_results if r.ai_analysis.relevance_score > 0.8]),
             'duplicates_detected': len([r for r in self.results if r.is_duplicate]),
             'ai_processing_time': self.ai_analysis_time,
-            'ai_calls_made': self.total_ai_calls
+            'ai_calls_made': self.total_ai_calls,
+            'ai_cache_hits': self.analysis_cache_hits
         }
         
         # Calculate distributions
@@ -706,7 +813,7 @@ class AIEnhancedCrawler(AlopecosaCrawler):
                 'title': result.title,
                 'content': result.content,
                 'status_code': result.status_code,
-                'timestamp': result.timestamp.isoformat(),
+                'timestamp': result.iso_timestamp,
                 'priority_score': result.priority_score,
                 'is_duplicate': result.is_duplicate,
                 'content_hash': result.content_hash
@@ -6,31 +6,160 @@ This spider is known for its active hunting strategy and efficient terrain navig
 """
 
 import requests
+import asyncio
 import time
 import random
+import re
 import logging
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 from bs4 import BeautifulSoup
 from collections import deque
 import json
 import os
-from typing import Set, Dict, List, Optional
+import zlib
+import array
+from collections.abc import Mapping
+from typing import Callable, Set, Dict, List, Optional, Iterable
 import threading
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 
+try:
+    from .bloom_filter import ScalableBloomFilter
+except ImportError:
+    # Running this module directly as a script
+    from bloom_filter import ScalableBloomFilter
 
-@dataclass
+try:
+    # Try relative imports first (when running as package)
+    from ..utils.config import EXCLUDED_EXTENSION_PATTERN, PREFERRED_CONTENT_TYPES
+except ImportError:
+    # Fall back to absolute imports (when running from project root)
+    from src.utils.config import EXCLUDED_EXTENSION_PATTERN, PREFERRED_CONTENT_TYPES
+
+
+# Responses larger than this are abandoned mid-transfer
+MAX_RESPONSE_BYTES = 5 * 1024 * 1024
+
+# Charset declared in a Content-Type header, e.g. "text/html; charset=utf-8"
+CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+
+# Hrefs that can be resolved or dismissed without calling urljoin
+ABSOLUTE_URL_PATTERN = re.compile(r'^https?://', re.IGNORECASE)
+NON_NAVIGABLE_HREF = re.compile(r'^(?:#|javascript:|mailto:|tel:)', re.IGNORECASE)
+
+# Query parameters that only track the visitor and never change page content
+TRACKING_PARAMS = frozenset({
+    'utm_source', 'utm_medium', 'utm_campaign', 'utm_term', 'utm_content',
+    'gclid', 'fbclid'
+})
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so equivalent spellings collapse to a single key:
+    lowercase scheme and host, drop the fragment and tracking parameters,
+    sort the query string and strip the trailing slash from the path.
+    """
+    parts = urlsplit(url)
+    query = urlencode(sorted(
+        (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+        if key.lower() not in TRACKING_PARAMS
+    ))
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, query, ''))
+
+
+@dataclass(slots=True)
 class CrawlResult:
-    """Represents the result of crawling a single URL"""
+    """Represents the result of crawling a single URL (slotted: crawls hold many)"""
     url: str
     title: str
     content: str
     links: List[str]
     status_code: int
     crawl_time: float
-    timestamp: datetime
+    timestamp: float  # epoch seconds; formatted lazily at serialization
     metadata: Dict
+    
+    @property
+    def iso_timestamp(self) -> str:
+        """ISO 8601 rendering of the crawl timestamp"""
+        return datetime.fromtimestamp(self.timestamp).isoformat()
+
+
+class TerrainMap(Mapping):
+    """
+    Columnar store for the spider's terrain map.
+    
+    Each discovered URL is a row spread across packed parallel arrays, and
+    titles are interned in a shared pool, so an entry costs a few dozen bytes
+    instead of a full dict. Reads still behave like the original
+    ``{url: {'depth', 'link_count', 'title', 'discovered_at'}}`` mapping.
+    """
+    
+    def __init__(self):
+        self._index: Dict[str, int] = {}
+        self.urls: List[str] = []
+        self.depths = array.array('H')
+        self.link_counts = array.array('I')
+        self.discovered_at = array.array('d')
+        self.title_ids = array.array('I')
+        self._titles: List[str] = []
+        self._title_ids: Dict[str, int] = {}
+    
+    def add(self, url: str, depth: int, link_count: int, title: str, discovered_at: float):
+        """Record a crawled URL, overwriting any previous row for it"""
+        title_id = self._title_ids.get(title)
+        if title_id is None:
+            title_id = self._title_ids[title] = len(self._titles)
+            self._titles.append(title)
+        
+        row = self._index.get(url)
+        if row is not None:
+            self.depths[row] = depth
+            self.link_counts[row] = link_count
+            self.discovered_at[row] = discovered_at
+            self.title_ids[row] = title_id
+            return
+        
+        self._index[url] = len(self.urls)
+        self.urls.append(url)
+        self.depths.append(depth)
+        self.link_counts.append(link_count)
+        self.discovered_at.append(discovered_at)
+        self.title_ids.append(title_id)
+    
+    def __getitem__(self, url: str) -> Dict:
+        row = self._index[url]
+        return {
+            'depth': self.depths[row],
+            'link_count': self.link_counts[row],
+            'title': self._titles[self.title_ids[row]],
+            'discovered_at': self.discovered_at[row]
+        }
+    
+    def __contains__(self, url) -> bool:
+        return url in self._index
+    
+    def __iter__(self):
+        return iter(self.urls)
+    
+    def __len__(self) -> int:
+        return len(self.urls)
+    
+    def to_dict(self) -> Dict[str, Dict]:
+        """
+        Expand into plain dicts for JSON serialization, with discovered_at
+        formatted as an ISO timestamp as saved results always had it
+        """
+        terrain = {}
+        for url in self.urls:
+            entry = self[url]
+            entry['discovered_at'] = datetime.fromtimestamp(entry['discovered_at']).isoformat()
+            terrain[url] = entry
+        return terrain
 
 
 class AlopecosaCrawler:
@@ -49,10 +178,14 @@ class AlopecosaCrawler:
                  delay_range: tuple = (1, 3),
                  user_agent: str = None,
                  respect_robots: bool = True,
-                 allow_external_links: bool = False):
+                 allow_external_links: bool = False,
+                 session: Optional[requests.Session] = None,
+                 visited_bloom_capacity: Optional[int] = None,
+                 visited_bloom_error_rate: float = 0.001,
+                 on_page_done: Optional[Callable[[int, int], None]] = None):
         
         self.base_url = base_url
-        self.domain = urlparse(base_url).netloc
+        self.domain = urlparse(base_url).netloc.lower()
         self.max_depth = max_depth
         self.max_pages = max_pages
         self.delay_range = delay_range
@@ -61,27 +194,48 @@ class AlopecosaCrawler:
         
         # Spider-like behavior attributes
         self.hunting_mode = True  # Active hunting vs passive waiting
-        self.terrain_map = {}     # Map of discovered URLs and their relationships
+        self.terrain_map = TerrainMap()  # Map of discovered URLs and their relationships
         self.prey_scent = set()   # URLs that seem promising (high link density, etc.)
         self.explored_areas = set()  # Already visited URLs
         self.current_depth = 0
         
-        # Crawling state
-        self.session = requests.Session()
-        self.session.headers.update({
+        # Crawling state; a caller-supplied session lets several crawlers share
+        # one connection pool, so the User-Agent is sent per request rather
+        # than set on the (possibly shared) session
+        self.session = session if session is not None else requests.Session()
+        self.request_headers = {
             'User-Agent': user_agent or 'Alopecosa-Fabrilis-Crawler/1.0 (Spider-inspired Web Crawler)'
-        })
+        }
         
         # Results storage
         self.results: List[CrawlResult] = []
-        self.url_queue = deque([(base_url, 0)])  # (url, depth)
-        self.visited_urls: Set[str] = set()
+        self.url_queue = deque([(canonicalize_url(base_url), 0)])  # (url, depth)
+        if visited_bloom_capacity:
+            # Very large crawls trade a small chance of skipping an unvisited
+            # URL for a visited set that stays a few bytes per URL
+            self.visited_urls = ScalableBloomFilter(visited_bloom_capacity, visited_bloom_error_rate)
+        else:
+            self.visited_urls: Set[str] = set()
+        
+        # Called with (pages crawled, max pages) after each successful page
+        self.on_page_done = on_page_done
         
         # Adaptive behavior
         self.success_rate = 0.0
         self.avg_response_time = 0.0
         self.link_density_threshold = 5  # Minimum links to consider area "rich"
         
+        # Running aggregates so statistics never rescan self.results
+        self._agg_attempts = 0
+        self._agg_pages = 0
+        self._agg_links = 0
+        self._agg_time = 0.0
+        self._agg_ok = 0
+        self._state_lock = threading.Lock()
+        
+        # Earliest monotonic time the next request to each host may start
+        self._host_next_start: Dict[str, float] = {}
+        
         # Setup logging
         self._setup_logging()
         
@@ -89,6 +243,9 @@ class AlopecosaCrawler:
         if self.respect_robots:
             self._load_robots_txt()
         
+        # Specialize URL validation now that the configuration is final
+        self._is_allowed_url = self._build_url_filter()
+        
         # Test network connectivity
         self._test_network_connectivity()
     
@@ -108,7 +265,7 @@ class AlopecosaCrawler:
         """Test if the crawler can make HTTP requests"""
         try:
             self.logger.info("Testing network connectivity...")
-            test_response = self.session.get("https://httpbin.org/get", timeout=10)
+            test_response = self.session.get("https://httpbin.org/get", headers=self.request_headers, timeout=10)
             if test_response.status_code == 200:
                 self.logger.info("Network connectivity test passed")
             else:
@@ -121,7 +278,7 @@ class AlopecosaCrawler:
         """Load and parse robots.txt file"""
         try:
             robots_url = urljoin(self.base_url, '/robots.txt')
-            response = self.session.get(robots_url, timeout=10)
+            response = self.session.get(robots_url, headers=self.request_headers, timeout=10)
             if response.status_code == 200:
                 self.logger.info("Robots.txt loaded successfully")
                 # Simple robots.txt parsing - could be enhanced
@@ -132,44 +289,58 @@ class AlopecosaCrawler:
             self.logger.warning(f"Could not load robots.txt: {e}")
             self.robots_content = ""
     
-    def _is_allowed_url(self, url: str) -> bool:
-        """Check if URL is allowed according to robots.txt and domain restrictions"""
-        try:
-            parsed = urlparse(url)
-            
-            # Check if URL is valid
-            if not parsed.scheme or not parsed.netloc:
-                self.logger.debug(f"Invalid URL structure: {url}")
-                return False
-            
-            # Check domain restriction - be more lenient for subdomains
-            if not self.allow_external_links:
-                if parsed.netloc != self.domain and not parsed.netloc.endswith('.' + self.domain):
-                    self.logger.debug(f"Domain mismatch: {parsed.netloc} vs {self.domain}")
+    def _build_url_filter(self):
+        """
+        Build the URL validation predicate with this crawler's configuration
+        baked in. Domain, robots.txt and external-link settings are fixed
+        after __init__, so the returned closure skips the branches that can
+        never fire instead of re-reading them on every link.
+        """
+        logger = self.logger
+        domain = self.domain
+        subdomain_suffix = '.' + domain
+        check_domain = not self.allow_external_links
+        # Simplified robots.txt handling: any root Disallow blocks the crawl
+        blocked_by_robots = (self.respect_robots and 'Disallow: /' in getattr(self, 'robots_content', ''))
+        
+        def is_allowed_url(url: str) -> bool:
+            """Check if URL is allowed according to robots.txt and domain restrictions"""
+            try:
+                parsed = urlsplit(url)
+                
+                # Check if URL is valid
+                if not parsed.scheme or not parsed.netloc:
+                    logger.debug("Invalid URL structure: %s", url)
                     return False
-            
-            # Check robots.txt (simplified)
-            if self.respect_robots and self.robots_content:
-                if 'Disallow: /' in self.robots_content:
-                    self.logger.debug(f"Disallowed by robots.txt: {url}")
+                
+                # Check domain restriction - be more lenient for subdomains
+                if check_domain:
+                    netloc = parsed.netloc
+                    if netloc != domain and not netloc.endswith(subdomain_suffix):
+                        logger.debug("Domain mismatch: %s vs %s", netloc, domain)
+                        return False
+                
+                if blocked_by_robots:
+                    logger.debug("Disallowed by robots.txt: %s", url)
                     return False
-            
-            # Avoid common non-content URLs
-            excluded_extensions = {'.pdf', '.jpg', '.jpeg', '.png', '.gif', '.mp4', '.mp3', '.zip', '.rar', '.exe', '.css', '.js'}
-            if any(url.lower().endswith(ext) for ext in excluded_extensions):
-                self.logger.debug(f"Excluded extension: {url}")
-                return False
-            
-            # Avoid very long URLs
-            if len(url) > 2048:
-                self.logger.debug(f"URL too long: {url}")
+                
+                # Avoid common non-content URLs
+                if EXCLUDED_EXTENSION_PATTERN.search(url):
+                    logger.debug("Excluded extension: %s", url)
+                    return False
+                
+                # Avoid very long URLs
+                if len(url) > 2048:
+                    logger.debug("URL too long: %s", url)
+                    return False
+                
+                # Allow common content URLs
+                return True
+            except Exception as e:
+                logger.warning(f"Error validating URL {url}: {e}")
                 return False
-            
-            # Allow common content URLs
-            return True
-        except Exception as e:
-            self.logger.warning(f"Error validating URL {url}: {e}")
-            return False
+        
+        return is_allowed_url
     
     def _hunt_for_prey(self, soup: BeautifulSoup, current_url: str) -> List[str]:
         """
@@ -182,17 +353,21 @@ class AlopecosaCrawler:
             # Limit the number of links to process to prevent recursion
             link_elements = soup.find_all('a', href=True, limit=1000)
             
-            self.logger.debug(f"Found {len(link_elements)} link elements on {current_url}")
+            self.logger.debug("Found %s link elements on %s", len(link_elements), current_url)
             
             for link in link_elements:
                 try:
                     href = link.get('href')
-                    if not href:
+                    if not href or NON_NAVIGABLE_HREF.match(href):
                         continue
-                        
-                    absolute_url = urljoin(current_url, href)
                     
-                    self.logger.debug(f"Processing link: {href} -> {absolute_url}")
+                    # Absolute links need no resolution against the current page
+                    if ABSOLUTE_URL_PATTERN.match(href):
+                        absolute_url = canonicalize_url(href)
+                    else:
+                        absolute_url = canonicalize_url(urljoin(current_url, href))
+                    
+                    self.logger.debug("Processing link: %s -> %s", href, absolute_url)
                     
                     if not self._is_allowed_url(absolute_url):
                         continue
@@ -232,7 +407,7 @@ class AlopecosaCrawler:
             self.logger.error(f"Error in _hunt_for_prey for {current_url}: {e}")
             return []
         
-        self.logger.debug(f"Returning {len(links)} valid links from {current_url}")
+        self.logger.debug("Returning %s valid links from %s", len(links), current_url)
         return links
     
     def _adapt_hunting_strategy(self):
@@ -246,6 +421,21 @@ class AlopecosaCrawler:
             self.link_density_threshold = min(10, self.link_density_threshold + 1)
             self.logger.info(f"Adapting: Raising link density threshold to {self.link_density_threshold}")
     
+    def _wait_for_host_turn(self, url: str):
+        """
+        Space out request starts to url's host by a random delay_range gap.
+        Slots are reserved under the state lock, so pages fetched concurrently
+        by crawl_async queue up behind each other instead of sleeping in parallel
+        """
+        host = urlsplit(url).netloc
+        with self._state_lock:
+            now = time.monotonic()
+            start_at = max(now, self._host_next_start.get(host, 0.0))
+            self._host_next_start[host] = start_at + random.uniform(*self.delay_range)
+        
+        if start_at > now:
+            time.sleep(start_at - now)
+    
     def _crawl_page(self, url: str, depth: int) -> Optional[CrawlResult]:
         """Crawl a single page and extract information"""
         if url in self.visited_urls:
@@ -255,31 +445,54 @@ class AlopecosaCrawler:
         if not self._is_allowed_url(url):
             return None
         
-        self.visited_urls.add(url)
-        start_time = time.time()
+        with self._state_lock:
+            self.visited_urls.add(url)
+            self._agg_attempts += 1
+        crawled_at = time.time()
+        start_time = time.monotonic()
         
         try:
             # Spider-like behavior: random delay to avoid detection
-            delay = random.uniform(*self.delay_range)
-            time.sleep(delay)
+            self._wait_for_host_turn(url)
             
             self.logger.info(f"Crawling {url} at depth {depth}")
-            self.logger.debug(f"Making HTTP request to {url}")
-            response = self.session.get(url, timeout=15)
-            self.logger.debug(f"Response status: {response.status_code}, content length: {len(response.content)}")
+            self.logger.debug("Making HTTP request to %s", url)
+            with self.session.get(url, headers=self.request_headers, timeout=15, stream=True) as response:
+                if response.status_code != 200:
+                    self.logger.warning(f"Failed to crawl {url}: Status {response.status_code}")
+                    return None
+                
+                # Skip non-HTML responses before transferring their body
+                content_type = response.headers.get('Content-Type', '')
+                media_type = content_type.split(';', 1)[0].strip().lower()
+                if media_type and media_type not in PREFERRED_CONTENT_TYPES:
+                    self.logger.debug("Skipping non-HTML content at %s: %s", url, content_type)
+                    return None
+                
+                # Reject oversized responses up front when the server announces them
+                content_length = int(response.headers.get('Content-Length') or 0)
+                if content_length > MAX_RESPONSE_BYTES:
+                    self.logger.warning(f"Response too large for {url} ({content_length} bytes), skipping")
+                    return None
+                
+                # Stream the body and abort as soon as the size cap is exceeded
+                payload = bytearray()
+                for chunk in response.iter_content(chunk_size=65536):
+                    payload.extend(chunk)
+                    if len(payload) > MAX_RESPONSE_BYTES:
+                        self.logger.warning(f"Response too large for {url} (over {MAX_RESPONSE_BYTES} bytes), skipping")
+                        return None
             
-            # Check for very large responses that might cause recursion
-            if len(response.content) > 5 * 1024 * 1024:  # 5MB limit
-                self.logger.warning(f"Response too large for {url} ({len(response.content)} bytes), skipping")
-                return None
+            self.logger.debug("Response status: %s, content length: %s", response.status_code, len(payload))
             
-            if response.status_code != 200:
-                self.logger.warning(f"Failed to crawl {url}: Status {response.status_code}")
-                return None
+            # Never touch response.text: hand the parser raw bytes plus the
+            # declared charset so it can skip chardet-style encoding sniffing
+            charset_match = CHARSET_PATTERN.search(content_type)
+            from_encoding = charset_match.group(1) if charset_match else None
             
             # Parse HTML with safety measures to prevent recursion
             try:
-                soup = BeautifulSoup(response.content, 'html.parser')
+                soup = BeautifulSoup(bytes(payload), 'html.parser', from_encoding=from_encoding)
             except RecursionError as e:
                 self.logger.error(f"Recursion error parsing HTML for {url}: {e}")
                 return None
@@ -291,11 +504,6 @@ class AlopecosaCrawler:
             title = soup.find('title')
             title_text = title.get_text(strip=True) if title else "No Title"
             
-            # Safety check for very large content
-            if len(response.content) > 10 * 1024 * 1024:  # 10MB limit
-                self.logger.warning(f"Content too large for {url}, skipping")
-                return None
-            
             # Extract main content (simplified)
             content = ""
             main_content = soup.find('main') or soup.find('article') or soup.find('div', class_='content')
@@ -307,18 +515,12 @@ class AlopecosaCrawler:
                 if body:
                     content = body.get_text(strip=True)
             
-            # Hunt for links (spider behavior)
-            links = self._hunt_for_prey(soup, url)
-            
-            # Update terrain map
-            self.terrain_map[url] = {
-                'depth': depth,
-                'link_count': len(links),
-                'title': title_text,
-                'discovered_at': datetime.now().isoformat()
-            }
+            # Hunt for links (spider behavior). Relative hrefs resolve against
+            # the URL actually served, not the canonical key: canonicalization
+            # strips the trailing slash, so "b.html" on /a/ would become /b.html
+            links = self._hunt_for_prey(soup, response.url or url)
             
-            crawl_time = time.time() - start_time
+            crawl_time = time.monotonic() - start_time
             
             result = CrawlResult(
                 url=url,
@@ -327,7 +529,7 @@ class AlopecosaCrawler:
                 links=links,
                 status_code=response.status_code,
                 crawl_time=crawl_time,
-                timestamp=datetime.now(),
+                timestamp=crawled_at,
                 metadata={
                     'depth': depth,
                     'link_count': len(links),
@@ -335,7 +537,14 @@ class AlopecosaCrawler:
                 }
             )
             
-            self.results.append(result)
+            # Shared state is guarded so batched crawls can run pages concurrently
+            with self._state_lock:
+                self.terrain_map.add(url, depth, len(links), title_text, crawled_at)
+                self.results.append(result)
+                self._agg_pages += 1
+                self._agg_links += len(links)
+                self._agg_time += crawl_time
+                self._agg_ok += response.status_code == 200
             self.logger.info(f"Successfully crawled {url} in {crawl_time:.2f}s")
             
             return result
@@ -351,6 +560,7 @@ class AlopecosaCrawler:
         self.logger.info(f"Domain: {self.domain}")
         
         pages_crawled = 0
+        queued = {url for url, _ in self.url_queue}
         max_iterations = self.max_pages * 2  # Prevent infinite loops
         iteration_count = 0
         
@@ -365,37 +575,47 @@ class AlopecosaCrawler:
         while self.url_queue and pages_crawled < self.max_pages and iteration_count < max_iterations:
             iteration_count += 1
             current_url, depth = self.url_queue.popleft()
+            # queued only guards the frontier; once popped, visited_urls
+            # (possibly a Bloom filter) is the sole record of the URL
+            queued.discard(current_url)
             
-            self.logger.debug(f"Processing URL: {current_url} at depth {depth}")
+            self.logger.debug("Processing URL: %s at depth %s", current_url, depth)
             
             if depth > self.max_depth:
-                self.logger.debug(f"Skipping {current_url} - depth {depth} > max_depth {self.max_depth}")
+                self.logger.debug("Skipping %s - depth %s > max_depth %s", current_url, depth, self.max_depth)
                 continue
             
             result = self._crawl_page(current_url, depth)
+            if self._agg_attempts:
+                self.success_rate = self._agg_ok / self._agg_attempts
+            
             if result:
                 pages_crawled += 1
                 self.logger.info(f"Successfully crawled page {pages_crawled}/{self.max_pages}: {current_url}")
+                if self.on_page_done:
+                    self.on_page_done(pages_crawled, self.max_pages)
                 
                 # Add new URLs to queue (spider exploring new territory)
-                self.logger.debug(f"Adding {len(result.links)} links to queue from {current_url}")
+                self.logger.debug("Adding %s links to queue from %s", len(result.links), current_url)
                 for link in result.links:
-                    if link not in self.visited_urls and link not in [url for url, _ in self.url_queue]:
+                    if link not in self.visited_urls and link not in queued:
+                        queued.add(link)
                         self.url_queue.append((link, depth + 1))
-                        self.logger.debug(f"Added to queue: {link} at depth {depth + 1}")
+                        self.logger.debug("Added to queue: %s at depth %s", link, depth + 1)
                     else:
-                        self.logger.debug(f"Skipped duplicate: {link}")
+                        self.logger.debug("Skipped duplicate: %s", link)
                 
-                self.logger.debug(f"Queue size after adding links: {len(self.url_queue)}")
+                self.logger.debug("Queue size after adding links: %s", len(self.url_queue))
             else:
-                self.logger.debug(f"Failed to crawl: {current_url}")
+                self.logger.debug("Failed to crawl: %s", current_url)
                 
                 # Prioritize URLs with high prey scent (rich areas)
                 if self.prey_scent:
                     # Move some high-value URLs to front of queue
                     high_value_urls = list(self.prey_scent)[:3]
                     for url in high_value_urls:
-                        if url not in self.visited_urls and url not in [u for u, _ in self.url_queue]:
+                        if url not in self.visited_urls and url not in queued:
+                            queued.add(url)
                             self.url_queue.appendleft((url, depth + 1))
                     self.prey_scent.clear()
                 
@@ -414,6 +634,58 @@ class AlopecosaCrawler:
             self.logger.warning("Maximum iterations reached, stopping crawl to prevent infinite loop")
         return self.results
     
+    async def crawl_async(self, batch_size: int = 16) -> List[CrawlResult]:
+        """
+        Crawl the frontier in batches instead of one URL at a time.
+        
+        Up to ``batch_size`` queued URLs are fetched together with
+        ``asyncio.gather`` and every link they yield is enqueued in bulk
+        before the next batch. Request starts to any one host stay at least
+        a delay_range gap apart, so batching only overlaps slow responses
+        and parsing; it never sends a burst to one server.
+        """
+        self.logger.info(f"Starting batched Alopecosa Fabrilis crawler on {self.base_url}")
+        self.logger.info(f"Max depth: {self.max_depth}, Max pages: {self.max_pages}, Batch size: {batch_size}")
+        
+        pages_crawled = 0
+        queued = {url for url, _ in self.url_queue}
+        
+        while self.url_queue and pages_crawled < self.max_pages:
+            batch = []
+            batch_limit = min(batch_size, self.max_pages - pages_crawled)
+            while self.url_queue and len(batch) < batch_limit:
+                url, depth = self.url_queue.popleft()
+                queued.discard(url)
+                if depth <= self.max_depth:
+                    batch.append((url, depth))
+            
+            if not batch:
+                continue
+            
+            results = await asyncio.gather(
+                *(asyncio.to_thread(self._crawl_page, url, depth) for url, depth in batch),
+                return_exceptions=True
+            )
+            
+            for (url, depth), result in zip(batch, results):
+                if not isinstance(result, CrawlResult):
+                    continue
+                
+                pages_crawled += 1
+                if self.on_page_done:
+                    self.on_page_done(pages_crawled, self.max_pages)
+                for link in result.links:
+                    if link not in self.visited_urls and link not in queued:
+                        queued.add(link)
+                        self.url_queue.append((link, depth + 1))
+            
+            if self._agg_attempts:
+                self.success_rate = self._agg_ok / self._agg_attempts
+            self._adapt_hunting_strategy()
+        
+        self.logger.info(f"Batched crawling completed. Crawled {pages_crawled} pages.")
+        return self.results
+    
     def save_results(self, filename: str = None):
         """Save crawling results to a file"""
         if not filename:
@@ -430,7 +702,7 @@ class AlopecosaCrawler:
                 'links': result.links,
                 'status_code': result.status_code,
                 'crawl_time': result.crawl_time,
-                'timestamp': result.timestamp.isoformat(),
+                'timestamp': result.iso_timestamp,
                 'metadata': result.metadata
             })
         
@@ -443,7 +715,7 @@ class AlopecosaCrawler:
                     'pages_crawled': len(self.results),
                     'crawl_timestamp': datetime.now().isoformat()
                 },
-                'terrain_map': self.terrain_map,
+                'terrain_map': self.terrain_map.to_dict(),
                 'results': serializable_results
             }, f, indent=2, ensure_ascii=False)
         
@@ -454,21 +726,98 @@ class AlopecosaCrawler:
         if not self.results:
             return {}
         
-        total_links = sum(len(result.links) for result in self.results)
-        avg_links = total_links / len(self.results)
-        avg_crawl_time = sum(result.crawl_time for result in self.results) / len(self.results)
+        pages = self._agg_pages or 1
         
         return {
             'total_pages': len(self.results),
-            'total_links_discovered': total_links,
-            'average_links_per_page': avg_links,
-            'average_crawl_time': avg_crawl_time,
-            'success_rate': len([r for r in self.results if r.status_code == 200]) / len(self.results),
+            'total_links_discovered': self._agg_links,
+            'average_links_per_page': self._agg_links / pages,
+            'average_crawl_time': self._agg_time / pages,
+            'success_rate': self._agg_ok / pages,
             'terrain_coverage': len(self.terrain_map),
             'hunting_efficiency': len(self.prey_scent)
         }
 
 
+def shard_for_url(url: str, shard_count: int) -> int:
+    """
+    Map a URL to a shard by hashing its host. Uses CRC32 rather than hash()
+    so every worker process agrees on the assignment.
+    """
+    netloc = urlparse(url).netloc.lower()
+    return zlib.crc32(netloc.encode('utf-8')) % shard_count
+
+
+class ShardedCrawler(AlopecosaCrawler):
+    """
+    Crawler that owns a disjoint slice of the host space. Links whose host
+    hashes to another shard are dropped, so shards never share state.
+    """
+    
+    def __init__(self, base_url: str, shard_id: int, shard_count: int, **kwargs):
+        super().__init__(base_url, **kwargs)
+        self.shard_id = shard_id
+        self.shard_count = shard_count
+    
+    def _hunt_for_prey(self, soup: BeautifulSoup, current_url: str) -> List[str]:
+        links = super()._hunt_for_prey(soup, current_url)
+        return [link for link in links if shard_for_url(link, self.shard_count) == self.shard_id]
+
+
+def crawl_shard(shard_id: int, shard_count: int, seed_urls: Iterable[str], config: Dict) -> List[CrawlResult]:
+    """
+    Crawl every seed URL whose host belongs to this shard.
+    
+    Args:
+        shard_id: Index of this shard
+        shard_count: Total number of shards
+        seed_urls: All seed URLs; seeds owned by other shards are ignored
+        config: Keyword arguments passed to each crawler (max_depth, max_pages, ...)
+    
+    Returns:
+        Results from all seeds crawled by this shard
+    """
+    results = []
+    visited_urls: Set[str] = set()
+    
+    for seed_url in seed_urls:
+        if shard_for_url(seed_url, shard_count) != shard_id:
+            continue
+        
+        crawler = ShardedCrawler(seed_url, shard_id, shard_count, **config)
+        crawler.visited_urls = visited_urls  # Share dedup state across this shard's seeds
+        results.extend(crawler.crawl())
+    
+    return results
+
+
+def sharded_crawl(seed_urls: List[str], shard_count: int = None, config: Dict = None) -> List[CrawlResult]:
+    """
+    Crawl seed URLs across worker processes, one shard per process.
+    
+    Args:
+        seed_urls: Starting URLs to crawl
+        shard_count: Number of worker processes (defaults to the CPU count)
+        config: Keyword arguments passed to each crawler
+    
+    Returns:
+        Merged results from all shards
+    """
+    shard_count = shard_count or os.cpu_count() or 1
+    config = config or {}
+    
+    results = []
+    with ProcessPoolExecutor(max_workers=shard_count) as executor:
+        futures = [
+            executor.submit(crawl_shard, shard_id, shard_count, list(seed_urls), config)
+            for shard_id in range(shard_count)
+        ]
+        for future in futures:
+            results.extend(future.result())
+    
+    return results
+
+
 def main():
     """Main function to demonstrate the crawler"""
     import argparse
@@ -0,0 +1,92 @@
+#!/usr/bin/env python3
+"""
+Bloom filters for Alopecosa Fabrilis Web Crawler
+Compact probabilistic sets for visited-URL tracking on very large crawls,
+at roughly 10-15 bits per URL instead of a full string per entry
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    Fixed-capacity Bloom filter over strings.
+    
+    Membership tests never miss an added item; an item that was never added
+    is reported present with probability of about error_rate once the filter
+    holds capacity items.
+    """
+    
+    def __init__(self, capacity: int, error_rate: float = 0.001):
+        if capacity <= 0:
+            raise ValueError("capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("error_rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))
+        self.num_hashes = max(1, round(self.num_bits / capacity * math.log(2)))
+        self.bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str):
+        """Bit positions for item, by double hashing one 128-bit digest"""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'little')
+        h2 = int.from_bytes(digest[8:], 'little') | 1
+        return [(h1 + i * h2) % self.num_bits for i in range(self.num_hashes)]
+    
+    def add(self, item: str) -> bool:
+        """Add item; returns False if it was (probably) already present"""
+        added = False
+        for position in self._positions(item):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not self.bits[byte] & mask:
+                self.bits[byte] |= mask
+                added = True
+        
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, item: str) -> bool:
+        return all(self.bits[position >> 3] & (1 << (position & 7)) for position in self._positions(item))
+    
+    def __len__(self) -> int:
+        return self.count
+
+
+class ScalableBloomFilter:
+    """
+    Bloom filter that grows as items are added.
+    
+    When the current filter reaches capacity a larger one is chained on,
+    with a tighter error rate so the overall false-positive rate stays close
+    to error_rate however many filters are in use.
+    """
+    
+    GROWTH = 2
+    TIGHTENING = 0.5
+    
+    def __init__(self, initial_capacity: int = 100000, error_rate: float = 0.001):
+        self.error_rate = error_rate
+        self.filters = [BloomFilter(initial_capacity, error_rate * (1 - self.TIGHTENING))]
+    
+    def add(self, item: str) -> bool:
+        """Add item; returns False if it was (probably) already present"""
+        if item in self:
+            return False
+        
+        current = self.filters[-1]
+        if current.count >= current.capacity:
+            current = BloomFilter(current.capacity * self.GROWTH, current.error_rate * self.TIGHTENING)
+            self.filters.append(current)
+        return current.add(item)
+    
+    def __contains__(self, item: str) -> bool:
+        return any(item in bloom for bloom in reversed(self.filters))
+    
+    def __len__(self) -> int:
+        return sum(bloom.count for bloom in self.filters)
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Conditional-GET cache for Alopecosa Fabrilis Web Crawler
+A requests.Session that revalidates pages with ETag / Last-Modified and
+serves unchanged bodies from disk, so repeated crawls of the same site only
+transfer response headers.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import requests
+
+from .alopecosa_crawler import MAX_RESPONSE_BYTES
+
+logger = logging.getLogger(__name__)
+
+
+class CachingSession(requests.Session):
+    """
+    Session that sends If-None-Match / If-Modified-Since for pages it has
+    seen before and turns a 304 Not Modified into the stored 200 response.
+    
+    Only HTML responses that declare a Content-Length within
+    MAX_RESPONSE_BYTES are stored.
+    
+    The index maps each URL to its validators, content type and body file,
+    and is persisted to <cache_dir>/index.json by save() or close().
+    """
+    
+    def __init__(self, cache_dir: str = '.http_cache'):
+        super().__init__()
+        self.cache_dir = Path(cache_dir)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.cache_dir / 'index.json'
+        self._index_lock = threading.Lock()
+        
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                self.index = json.load(f)
+        except (FileNotFoundError, ValueError):
+            self.index = {}
+    
+    def request(self, method, url, *args, **kwargs):
+        """Make a request, revalidating GETs against the cache"""
+        if method.upper() != 'GET':
+            return super().request(method, url, *args, **kwargs)
+        
+        with self._index_lock:
+            entry = self.index.get(url)
+        
+        if entry:
+            headers = dict(kwargs.get('headers') or {})
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+            kwargs['headers'] = headers
+        
+        response = super().request(method, url, *args, **kwargs)
+        
+        if response.status_code == 304 and entry:
+            return self._replay(url, response, entry)
+        if response.status_code == 200:
+            self._store(url, response)
+        return response
+    
+    def _replay(self, url: str, response: requests.Response, entry: dict) -> requests.Response:
+        """Rewrite a 304 into the cached 200 response"""
+        try:
+            body = Path(entry['body_path']).read_bytes()
+        except OSError:
+            # Body file went missing; drop the entry and report the 304 as-is
+            with self._index_lock:
+                self.index.pop(url, None)
+            return response
+        
+        response.status_code = 200
+        response.headers.pop('Content-Length', None)
+        if entry.get('content_type'):
+            response.headers['Content-Type'] = entry['content_type']
+        response._content = body
+        response._content_consumed = True
+        response.from_cache = True
+        logger.debug("Served %s from HTTP cache", url)
+        return response
+    
+    def _store(self, url: str, response: requests.Response):
+        """Remember a 200 response that carries a validator"""
+        etag = response.headers.get('ETag')
+        last_modified = response.headers.get('Last-Modified')
+        if not etag and not last_modified:
+            return
+        
+        # Reading the body here would bypass the crawler's streaming checks,
+        # so only HTML whose declared size is within the cap is cached; any
+        # other response is left unread for the caller to stream or reject
+        content_type = response.headers.get('Content-Type', '')
+        if 'text/html' not in content_type and 'xml' not in content_type:
+            return
+        content_length = int(response.headers.get('Content-Length') or 0)
+        if not 0 < content_length <= MAX_RESPONSE_BYTES:
+            return
+        
+        body = response.content
+        if len(body) > MAX_RESPONSE_BYTES:
+            return
+        
+        body_path = self.cache_dir / (hashlib.blake2b(url.encode('utf-8'), digest_size=16).hexdigest() + '.body')
+        body_path.write_bytes(body)
+        
+        with self._index_lock:
+            self.index[url] = {
+                'etag': etag,
+                'last_modified': last_modified,
+                'content_type': response.headers.get('Content-Type'),
+                'body_path': str(body_path)
+            }
+    
+    def save(self):
+        """Persist the cache index"""
+        with self._index_lock:
+            tmp_path = self.index_path.with_suffix('.json.tmp')
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.index, f)
+            os.replace(tmp_path, self.index_path)
+    
+    def close(self):
+        """Persist the cache index and close pooled connections"""
+        try:
+            self.save()
+        except OSError as e:
+            logger.warning(f"Could not save HTTP cache index: {e}")
+        super().close()
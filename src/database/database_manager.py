@@ -9,13 +9,137 @@ import logging
 import os
 import hashlib
 import json
-from typing import List, Dict, Optional, Tuple
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from contextlib import contextmanager
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlparse
+from collections.abc import Sized
+from itertools import islice
+from typing import List, Dict, Iterable, Iterator, Optional, Tuple
 from datetime import datetime
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Prepared statements kept per connection; search builds a handful of variants
+CACHED_STATEMENTS = 256
+
+# Bumped whenever stored data needs a one-off migration (tracked in PRAGMA user_version)
+SCHEMA_VERSION = 4
+
+# Characters of page content returned with each search result
+CONTENT_PREVIEW_CHARS = 500
+
+# Non-unique indexes; store_crawl_results rebuilds these around large imports
+# instead of updating them row by row. Domain and status filters read rows
+# already in crawl_timestamp order for the default listing
+SECONDARY_INDEXES = {
+    'idx_websites_domain_ts': 'CREATE INDEX IF NOT EXISTS idx_websites_domain_ts ON websites(domain, crawl_timestamp DESC)',
+    'idx_websites_status_ts': '''
+        CREATE INDEX IF NOT EXISTS idx_websites_status_ts ON websites(status_code, crawl_timestamp DESC)
+        WHERE status_code >= 400
+    ''',
+    'idx_websites_depth': 'CREATE INDEX IF NOT EXISTS idx_websites_depth ON websites(depth)',
+    'idx_websites_timestamp': 'CREATE INDEX IF NOT EXISTS idx_websites_timestamp ON websites(crawl_timestamp)',
+    'idx_links_source': 'CREATE INDEX IF NOT EXISTS idx_links_source ON links(source_website_id)',
+}
+
+# Result count above which secondary indexes are dropped and rebuilt in bulk
+# (overridable with DATABASE_CONFIG['bulk_reindex_threshold']). A rebuild
+# rereads the whole table, so the batch must also be at least this share of
+# the rows already stored
+BULK_INSERT_THRESHOLD = 1000
+BULK_INSERT_TABLE_SHARE = 0.25
+
+# Results hashed, inserted and linked per step when storing a session, so
+# a streamed (generator) session never needs more than this many in memory
+INSERT_CHUNK_SIZE = 10000
+
+# The background writer commits once this many results are queued, or once
+# the oldest queued session has waited this long
+WRITE_BATCH_ROWS = 500
+WRITE_BATCH_SECONDS = 1.0
+
+# Websites removed per transaction by delete_old_data
+DELETE_CHUNK_SIZE = 10000
+
+# Statements run for every stored session. sqlite3 keeps a per-connection
+# cache of prepared statements keyed by SQL text (CACHED_STATEMENTS), so
+# sharing one string per statement means each is compiled once per connection
+INSERT_SESSION_SQL = '''
+    INSERT INTO crawl_sessions 
+    (session_name, base_url, max_depth, max_pages, pages_crawled, start_time, end_time, status)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+REFRESH_WEBSITE_SQL = '''
+    UPDATE websites SET 
+    crawl_time = ?, crawl_timestamp = ?, links_count = ?, metadata = json(?)
+    WHERE content_hash = ?
+'''
+
+UPSERT_WEBSITE_SQL = '''
+    INSERT INTO websites 
+    (url, title, content, content_hash, status_code, crawl_time, 
+     crawl_timestamp, domain, depth, links_count, metadata)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, json(?))
+    ON CONFLICT(content_hash) DO UPDATE SET
+        crawl_time = excluded.crawl_time,
+        crawl_timestamp = excluded.crawl_timestamp,
+        links_count = excluded.links_count,
+        metadata = excluded.metadata
+'''
+
+WEBSITE_IDS_SQL = '''
+    SELECT content_hash, id FROM websites
+    WHERE content_hash IN (SELECT value FROM json_each(?))
+'''
+
+INSERT_LINK_SQL = '''
+    INSERT INTO links (source_website_id, target_url, link_text)
+    VALUES (?, ?, ?)
+'''
+
+# Values reported for websites columns that are NULL or empty
+WEBSITE_DEFAULTS = {
+    'url': '',
+    'title': 'No Title',
+    'content': 'No content',
+    'content_hash': '',
+    'status_code': 0,
+    'crawl_time': 0.0,
+    'crawl_timestamp': '',
+    'domain': 'Unknown',
+    'depth': 0,
+    'links_count': 0,
+    'created_at': '',
+}
+
+
+def content_hash(content: str) -> str:
+    """
+    Fingerprint page content for deduplication. BLAKE2b is not used for
+    integrity here, only identity; a 128-bit digest keeps collisions
+    negligible while hashing faster than MD5 on 64-bit CPUs.
+    """
+    return hashlib.blake2b(content.encode('utf-8'), digest_size=16).hexdigest()
+
+
+@lru_cache(maxsize=100_000)
+def _extract_domain_cached(url: str) -> str:
+    """Extract domain from URL, memoized since re-crawls revisit the same URLs"""
+    try:
+        parsed = urlparse(url)
+        return parsed.netloc
+    except:
+        return url
+
+
 class DatabaseManager:
     """Manages SQLite database for storing crawled websites and search functionality"""
     
@@ -26,33 +150,128 @@ class DatabaseManager:
         Args:
             db_path: Path to the database file. If None, uses default from config.
         """
+        config = self._load_config()
         if db_path is None:
-            # Import config here to avoid circular imports
-            try:
-                from ..utils.config import DATABASE_CONFIG
-                db_path = DATABASE_CONFIG['database_path']
-            except ImportError:
-                # Fallback to absolute import
-                try:
-                    from src.utils.config import DATABASE_CONFIG
-                    db_path = DATABASE_CONFIG['database_path']
-                except ImportError:
-                    # Final fallback to data folder
-                    db_path = os.path.join('data', 'crawler_database.db')
+            db_path = config.get('database_path', os.path.join('data', 'crawler_database.db'))
         
         self.db_path = db_path
+        # PRAGMAs and pool size come from DATABASE_CONFIG alone; journal_mode
+        # is persistent and only set by init_database
+        self.pragmas = dict(config.get('pragmas', {}))
+        self.max_results = config.get('max_results', 1000)
+        self.bulk_reindex_threshold = config.get('bulk_reindex_threshold', BULK_INSERT_THRESHOLD)
+        self.insert_chunk_size = config.get('insert_batch_size', INSERT_CHUNK_SIZE)
         
         # Ensure data directory exists
-        os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        if self.db_path != ':memory:' and os.path.dirname(self.db_path):
+            os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
+        
+        # One long-lived writer connection keeps the page cache warm across
+        # calls; the lock serializes access to it from worker threads
+        self._lock = threading.RLock()
+        self._conn = self._connect()
+        
+        # Small pool of read-only connections so searches don't queue behind
+        # writes; extra readers opened under load are closed when returned
+        self._readers = queue.Queue(maxsize=max(1, config.get('pool_size', 1)))
+        
+        # Content hashes already stored, loaded lazily on the first write
+        self._seen_hashes: Optional[set] = None
+        
+        # Results handed off by enqueue_results; the writer thread starts on first use
+        self._write_q = queue.Queue(maxsize=10000)
+        self._write_thread = None
+        self._write_thread_lock = threading.Lock()
         
         self.init_database()
     
+    @staticmethod
+    def _load_config() -> Dict:
+        """Return DATABASE_CONFIG, or an empty dict if the config can't be imported"""
+        # Import config here to avoid circular imports
+        try:
+            from ..utils.config import DATABASE_CONFIG
+        except ImportError:
+            # Fallback to absolute import
+            try:
+                from src.utils.config import DATABASE_CONFIG
+            except ImportError:
+                return {}
+        return DATABASE_CONFIG
+    
+    def _configure_connection(self, conn: sqlite3.Connection):
+        """Apply per-connection PRAGMAs tuned for the crawler's write-heavy workload"""
+        conn.execute('PRAGMA foreign_keys=ON')          # Cascade deletes from websites to links
+        conn.row_factory = sqlite3.Row
+        
+        if self.db_path == ':memory:':
+            return
+        
+        for name, value in self.pragmas.items():
+            if name != 'journal_mode':
+                conn.execute(f'PRAGMA {name}={value}')
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open a configured connection to the database"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=CACHED_STATEMENTS, isolation_level=None)
+        self._configure_connection(conn)
+        return conn
+    
+    @contextmanager
+    def _writer(self):
+        """
+        Hold the shared connection; callers open their own transaction with
+        BEGIN, which is committed on success and rolled back on error
+        """
+        with self._lock, self._conn as conn:
+            yield conn
+    
+    @contextmanager
+    def _reader(self):
+        """Borrow a read-only connection from the pool"""
+        if self.db_path == ':memory:':
+            # A private in-memory database is only visible to its own connection
+            with self._lock:
+                yield self._conn
+            return
+        
+        try:
+            conn = self._readers.get_nowait()
+        except queue.Empty:
+            read_uri = Path(self.db_path).resolve().as_uri() + '?mode=ro'
+            conn = sqlite3.connect(read_uri, uri=True, check_same_thread=False,
+                                   cached_statements=CACHED_STATEMENTS, isolation_level=None)
+            self._configure_connection(conn)
+        
+        try:
+            yield conn
+        finally:
+            try:
+                self._readers.put_nowait(conn)
+            except queue.Full:
+                conn.close()
+    
     def init_database(self):
         """Initialize the database with required tables"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._writer() as conn:
                 cursor = conn.cursor()
                 
+                # WAL lets readers proceed while a crawl is writing; the mode
+                # is persistent, so it only needs to be set once per database
+                if self.db_path != ':memory:' and 'journal_mode' in self.pragmas:
+                    cursor.execute(f"PRAGMA journal_mode={self.pragmas['journal_mode']}")
+                
+                # Apply the schema and any migrations atomically
+                cursor.execute('BEGIN IMMEDIATE')
+                
+                # A database already at the current schema needs no DDL
+                cursor.execute('PRAGMA user_version')
+                version = cursor.fetchone()[0]
+                if version >= SCHEMA_VERSION:
+                    return
+                
                 # Create websites table
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS websites (
@@ -79,7 +298,7 @@ class DatabaseManager:
                         source_website_id INTEGER,
                         target_url TEXT,
                         link_text TEXT,
-                        FOREIGN KEY (source_website_id) REFERENCES websites (id)
+                        FOREIGN KEY (source_website_id) REFERENCES websites (id) ON DELETE CASCADE
                     )
                 ''')
                 
@@ -99,19 +318,86 @@ class DatabaseManager:
                     )
                 ''')
                 
-                # Create search_index table for full-text search
+                # Serves the newest-first session listing (added in SCHEMA_VERSION 4)
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_sessions_created ON crawl_sessions(created_at DESC)')
+                
+                # Databases written before SCHEMA_VERSION 1 hold MD5 content hashes
+                if version < 1:
+                    cursor.execute('SELECT id, content FROM websites')
+                    rehashed = [(content_hash(content or ''), website_id)
+                                for website_id, content in cursor.fetchall()]
+                    cursor.executemany('UPDATE websites SET content_hash = ? WHERE id = ?', rehashed)
+                    logger.info(f"Rehashed content of {len(rehashed)} websites")
+                
+                # Before SCHEMA_VERSION 2 the search index kept its own copy of
+                # every page; it is now an external-content index over websites
+                if version < 2:
+                    cursor.execute('DROP TABLE IF EXISTS search_index')
+                
+                # Create search_index table for full-text search, keyed by websites.id
                 cursor.execute('''
                     CREATE VIRTUAL TABLE IF NOT EXISTS search_index 
-                    USING fts5(url, title, content, domain)
+                    USING fts5(url UNINDEXED, title, content, domain,
+                               content='websites', content_rowid='id')
+                ''')
+                
+                if version < 2:
+                    cursor.execute("INSERT INTO search_index(search_index) VALUES('rebuild')")
+                    logger.info("Rebuilt full-text search index")
+                
+                # Keep the search index in sync with websites automatically
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS websites_fts_insert AFTER INSERT ON websites BEGIN
+                        INSERT INTO search_index (rowid, url, title, content, domain)
+                        VALUES (new.id, new.url, new.title, new.content, new.domain);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS websites_fts_delete AFTER DELETE ON websites BEGIN
+                        INSERT INTO search_index (search_index, rowid, url, title, content, domain)
+                        VALUES ('delete', old.id, old.url, old.title, old.content, old.domain);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS websites_fts_update
+                    AFTER UPDATE OF url, title, content, domain ON websites BEGIN
+                        INSERT INTO search_index (search_index, rowid, url, title, content, domain)
+                        VALUES ('delete', old.id, old.url, old.title, old.content, old.domain);
+                        INSERT INTO search_index (rowid, url, title, content, domain)
+                        VALUES (new.id, new.url, new.title, new.content, new.domain);
+                    END
                 ''')
                 
+                # Before SCHEMA_VERSION 3 links did not cascade; rebuild the table
+                # with the new foreign key, dropping links whose website is gone
+                if version < 3:
+                    cursor.execute('''
+                        CREATE TABLE links_new (
+                            id INTEGER PRIMARY KEY AUTOINCREMENT,
+                            source_website_id INTEGER,
+                            target_url TEXT,
+                            link_text TEXT,
+                            FOREIGN KEY (source_website_id) REFERENCES websites (id) ON DELETE CASCADE
+                        )
+                    ''')
+                    cursor.execute('''
+                        INSERT INTO links_new (id, source_website_id, target_url, link_text)
+                        SELECT id, source_website_id, target_url, link_text FROM links
+                        WHERE source_website_id IN (SELECT id FROM websites)
+                    ''')
+                    cursor.execute('DROP TABLE links')
+                    cursor.execute('ALTER TABLE links_new RENAME TO links')
+                
+                cursor.execute(f'PRAGMA user_version = {SCHEMA_VERSION}')
+                
                 # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_websites_domain ON websites(domain)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_websites_depth ON websites(depth)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_websites_timestamp ON websites(crawl_timestamp)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_links_source ON links(source_website_id)')
+                cursor.execute('DROP INDEX IF EXISTS idx_websites_domain')
+                for create_sql in SECONDARY_INDEXES.values():
+                    cursor.execute(create_sql)
+                
+                # Give the planner statistics for the indexes above
+                cursor.execute('ANALYZE')
                 
-                conn.commit()
                 logger.info("Database initialized successfully")
                 
         except Exception as e:
@@ -119,146 +405,238 @@ class DatabaseManager:
             raise
     
     def store_crawl_results(self, session_name: str, base_url: str, max_depth: int, 
-                           max_pages: int, results: List, start_time: datetime, 
+                           max_pages: int, results: Iterable, start_time: datetime, 
                            end_time: datetime, status: str = 'completed') -> int:
-        """Store crawl results in the database"""
+        """
+        Store crawl results in the database
+        
+        results may be any iterable, e.g. a generator yielding pages as a crawl
+        produces them; it is consumed in chunks of insert_chunk_size.
+        """
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Insert crawl session
-                cursor.execute('''
-                    INSERT INTO crawl_sessions 
-                    (session_name, base_url, max_depth, max_pages, pages_crawled, start_time, end_time, status)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                ''', (session_name, base_url, max_depth, max_pages, len(results), 
-                     start_time.isoformat(), end_time.isoformat(), status))
-                
-                session_id = cursor.lastrowid
-                
-                # Store each website
-                for result in results:
-                    # Generate content hash to avoid duplicates
-                    content_hash = hashlib.md5(result.content.encode('utf-8')).hexdigest()
-                    
-                    # Check if website already exists
-                    cursor.execute('SELECT id FROM websites WHERE content_hash = ?', (content_hash,))
-                    existing = cursor.fetchone()
-                    
-                    if existing:
-                        # Update existing record
-                        cursor.execute('''
-                            UPDATE websites SET 
-                            crawl_time = ?, crawl_timestamp = ?, links_count = ?, metadata = ?
-                            WHERE content_hash = ?
-                        ''', (result.crawl_time, result.timestamp.isoformat(), 
-                              len(result.links), json.dumps(result.metadata), content_hash))
-                        website_id = existing[0]
-                    else:
-                        # Insert new website
-                        cursor.execute('''
-                            INSERT INTO websites 
-                            (url, title, content, content_hash, status_code, crawl_time, 
-                             crawl_timestamp, domain, depth, links_count, metadata)
-                            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                        ''', (
-                            result.url, result.title, result.content, content_hash,
-                            result.status_code, result.crawl_time, result.timestamp.isoformat(),
-                            self._extract_domain(result.url), result.metadata.get('depth', 0),
-                            len(result.links), json.dumps(result.metadata)
-                        ))
-                        website_id = cursor.lastrowid
-                        
-                        # Insert into search index
-                        cursor.execute('''
-                            INSERT INTO search_index (url, title, content, domain)
-                            VALUES (?, ?, ?, ?)
-                        ''', (result.url, result.title, result.content, 
-                              self._extract_domain(result.url)))
-                    
-                    # Store links
-                    for link in result.links:
-                        cursor.execute('''
-                            INSERT INTO links (source_website_id, target_url, link_text)
-                            VALUES (?, ?, ?)
-                        ''', (website_id, link, ''))  # link_text could be extracted if needed
-                
-                conn.commit()
-                logger.info(f"Stored {len(results)} websites in database")
-                return session_id
-                
+            session = dict(session_name=session_name, base_url=base_url, max_depth=max_depth,
+                           max_pages=max_pages, results=results, start_time=start_time,
+                           end_time=end_time, status=status)
+            session_id = self._write_sessions([session])[0]
+            logger.info(f"Stored {session['stored']} websites in database")
+            return session_id
+            
         except Exception as e:
             logger.error(f"Error storing crawl results: {e}")
             raise
     
+    def enqueue_results(self, session_name: str, base_url: str, max_depth: int, 
+                        max_pages: int, results: List, start_time: datetime, 
+                        end_time: datetime, status: str = 'completed') -> Future:
+        """
+        Queue crawl results for the background writer thread and return at once.
+        
+        Sessions queued close together are written in a single transaction.
+        The returned Future resolves to the session ID once the batch commits.
+        """
+        future = Future()
+        # The writer sizes its batches by row count, so queued results are materialized
+        if not isinstance(results, Sized):
+            results = list(results)
+        session = dict(session_name=session_name, base_url=base_url, max_depth=max_depth,
+                       max_pages=max_pages, results=results, start_time=start_time,
+                       end_time=end_time, status=status)
+        
+        with self._write_thread_lock:
+            if self._write_thread is None:
+                self._write_thread = threading.Thread(target=self._drain_loop,
+                                                      name='db-writer', daemon=True)
+                self._write_thread.start()
+        
+        self._write_q.put((session, future))
+        return future
+    
+    def flush(self):
+        """Block until every queued session has been written"""
+        self._write_q.join()
+    
+    def _drain_loop(self):
+        """Write queued sessions in batches, one transaction per batch"""
+        while True:
+            batch = [self._write_q.get()]
+            deadline = time.monotonic() + WRITE_BATCH_SECONDS
+            pending_rows = len(batch[0][0]['results'])
+            
+            # Gather whatever else arrives within the batch window
+            while pending_rows < WRITE_BATCH_ROWS:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    item = self._write_q.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                batch.append(item)
+                pending_rows += len(item[0]['results'])
+            
+            try:
+                session_ids = self._write_sessions([session for session, _ in batch])
+                for (session, future), session_id in zip(batch, session_ids):
+                    future.set_result(session_id)
+                logger.info(f"Stored {pending_rows} websites from {len(batch)} queued sessions")
+            except Exception as e:
+                logger.error(f"Error storing queued crawl results: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self._write_q.task_done()
+    
+    def _write_sessions(self, sessions: List[Dict]) -> List[int]:
+        """Insert crawl sessions and their websites in one transaction"""
+        with self._writer() as conn:
+            cursor = conn.cursor()
+            
+            # Take the write lock up front and commit everything at once
+            cursor.execute('BEGIN IMMEDIATE')
+            
+            if self._seen_hashes is None:
+                cursor.execute('SELECT content_hash FROM websites')
+                self._seen_hashes = {row[0] for row in cursor}
+            
+            # Building an index once from sorted data beats updating it per
+            # row, unless the table is so large the rebuild costs more. The
+            # drops are part of this transaction, so a failed insert rolls
+            # them back along with everything else. Streamed results have no
+            # known size and keep the indexes in place
+            incoming = sum(len(session['results']) for session in sessions
+                           if isinstance(session['results'], Sized))
+            bulk = (incoming > self.bulk_reindex_threshold and
+                    incoming >= len(self._seen_hashes) * BULK_INSERT_TABLE_SHARE)
+            if bulk:
+                for index_name in SECONDARY_INDEXES:
+                    cursor.execute(f'DROP INDEX IF EXISTS {index_name}')
+            
+            session_ids = []
+            for session in sessions:
+                session_id, session['stored'] = self._insert_session(cursor, **session)
+                session_ids.append(session_id)
+            
+            if bulk:
+                for create_sql in SECONDARY_INDEXES.values():
+                    cursor.execute(create_sql)
+            
+            return session_ids
+    
+    def _insert_session(self, cursor: sqlite3.Cursor, session_name: str, base_url: str,
+                        max_depth: int, max_pages: int, results: Iterable, start_time: datetime,
+                        end_time: datetime, status: str) -> Tuple[int, int]:
+        """
+        Insert one crawl session with its websites and links
+        
+        Returns the session ID and the number of results stored.
+        """
+        # Insert crawl session; a streamed session's page count is filled in at the end
+        sized = isinstance(results, Sized)
+        cursor.execute(INSERT_SESSION_SQL, (
+            session_name, base_url, max_depth, max_pages, len(results) if sized else 0,
+            start_time.isoformat(), end_time.isoformat(), status
+        ))
+        
+        session_id = cursor.lastrowid
+        
+        stored = 0
+        pending = iter(results)
+        while chunk := list(islice(pending, self.insert_chunk_size)):
+            self._insert_websites(cursor, chunk)
+            stored += len(chunk)
+        
+        if not sized:
+            cursor.execute('UPDATE crawl_sessions SET pages_crawled = ? WHERE id = ?',
+                           (stored, session_id))
+        
+        return session_id, stored
+    
+    def _insert_websites(self, cursor: sqlite3.Cursor, results: List):
+        """Insert or refresh a chunk of websites and insert their links"""
+        # Generate content hashes to avoid duplicates
+        hashed = [(content_hash(result.content), result) for result in results]
+        
+        # Content seen before only needs its crawl details refreshed
+        seen = [(page_hash, result) for page_hash, result in hashed if page_hash in self._seen_hashes]
+        cursor.executemany(REFRESH_WEBSITE_SQL, [
+            (result.crawl_time, datetime.fromtimestamp(result.timestamp).isoformat(),
+             len(result.links), json.dumps(result.metadata), page_hash)
+            for page_hash, result in seen
+        ])
+        ids = self._website_ids(cursor, [page_hash for page_hash, _ in seen])
+        
+        # Insert new websites, or refresh existing rows with the same content;
+        # a stale seen entry (e.g. rolled back) falls through to the upsert too
+        fresh = [(page_hash, result) for page_hash, result in hashed if page_hash not in ids]
+        cursor.executemany(UPSERT_WEBSITE_SQL, [
+            (result.url, result.title, result.content, page_hash,
+             result.status_code, result.crawl_time,
+             datetime.fromtimestamp(result.timestamp).isoformat(),
+             self._extract_domain(result.url), result.metadata.get('depth', 0),
+             len(result.links), json.dumps(result.metadata))
+            for page_hash, result in fresh
+        ])
+        ids.update(self._website_ids(cursor, [page_hash for page_hash, _ in fresh]))
+        self._seen_hashes.update(page_hash for page_hash, _ in fresh)
+        
+        # Store links; link_text could be extracted if needed
+        cursor.executemany(INSERT_LINK_SQL, (
+            (ids[page_hash], link, '') for page_hash, result in hashed for link in result.links
+        ))
+    
+    def _website_ids(self, cursor: sqlite3.Cursor, hashes: List[str]) -> Dict[str, int]:
+        """Map content hashes to website IDs with a single lookup"""
+        if not hashes:
+            return {}
+        cursor.execute(WEBSITE_IDS_SQL, (json.dumps(hashes),))
+        return {row[0]: row[1] for row in cursor}
+    
     def search_websites(self, query: str, filters: Dict = None, 
                         limit: int = 50, offset: int = 0) -> Tuple[List[Dict], int]:
         """Search websites using full-text search with optional filters"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
-                # Build base query
-                base_sql = '''
-                    SELECT w.id, w.url, w.title, w.content, w.status_code, 
-                           w.crawl_time, w.crawl_timestamp, w.domain, w.depth, 
-                           w.links_count, w.metadata
-                    FROM websites w
-                '''
-                
-                where_conditions = []
-                params = []
-                
-                # Full-text search using FTS5
-                if query and query.strip():
-                    base_sql += ' JOIN search_index si ON w.url = si.url'
-                    where_conditions.append('si.search_index MATCH ?')
-                    params.append(query)
-                
-                # Apply filters
-                if filters:
-                    if 'domain' in filters and filters['domain']:
-                        where_conditions.append('w.domain = ?')
-                        params.append(filters['domain'])
-                    
-                    if 'depth' in filters and filters['depth'] is not None:
-                        where_conditions.append('w.depth = ?')
-                        params.append(filters['depth'])
-                    
-                    if 'status_code' in filters and filters['status_code']:
-                        where_conditions.append('w.status_code = ?')
-                        params.append(filters['status_code'])
-                
-                # Build WHERE clause
-                if where_conditions:
-                    base_sql += ' WHERE ' + ' AND '.join(where_conditions)
+                join_sql, where_sql, params = self._build_where(query, filters)
+                has_query = bool(join_sql)
                 
-                # Get total count
-                count_sql = f"SELECT COUNT(*) FROM ({base_sql})"
+                # Get total count; a bare FTS match can use the index on its own
+                if has_query and where_sql == ' WHERE search_index MATCH ?':
+                    count_sql = 'SELECT COUNT(*) FROM search_index' + where_sql
+                else:
+                    count_sql = 'SELECT COUNT(*) FROM websites w' + join_sql + where_sql
                 cursor.execute(count_sql, params)
                 total_count = cursor.fetchone()[0]
                 
-                # Add ordering and pagination
-                search_sql = base_sql + ' ORDER BY w.crawl_timestamp DESC LIMIT ? OFFSET ?'
-                params.extend([limit, offset])
+                # Only a preview of the content is returned: a highlighted window
+                # around the match when searching, otherwise the leading text
+                if has_query:
+                    preview_sql = "snippet(search_index, 2, '', '', '…', 20)"
+                else:
+                    preview_sql = f'substr(w.content, 1, {CONTENT_PREVIEW_CHARS + 1})'
+                
+                # Metadata is left out of result lists; get_website_details decodes it
+                base_sql = f'''
+                    SELECT w.id, w.url, w.title, {preview_sql} AS content, w.status_code, 
+                           w.crawl_time, w.crawl_timestamp, w.domain, w.depth, 
+                           w.links_count
+                    FROM websites w
+                ''' + join_sql + where_sql
+                
+                # Add ordering (by relevance when searching) and pagination
+                # Pages are capped at max_results so one request can't pull the whole corpus
+                order_sql = ' ORDER BY bm25(search_index)' if has_query else ' ORDER BY w.crawl_timestamp DESC'
+                search_sql = base_sql + order_sql + ' LIMIT ? OFFSET ?'
+                params.extend([max(1, min(limit, self.max_results)), max(0, offset)])
                 
                 cursor.execute(search_sql, params)
                 results = []
                 
-                for row in cursor.fetchall():
-                    website = {
-                        'id': row[0],
-                        'url': row[1] or '',
-                        'title': row[2] or 'No Title',
-                        'content': (row[3][:500] + '...') if row[3] and len(row[3]) > 500 else (row[3] or 'No content'),
-                        'status_code': row[4] or 0,
-                        'crawl_time': row[5] or 0.0,
-                        'crawl_timestamp': row[6] or '',
-                        'domain': row[7] or 'Unknown',
-                        'depth': row[8] or 0,
-                        'links_count': row[9] or 0,
-                        'metadata': json.loads(row[10]) if row[10] else {}
-                    }
+                for row in cursor:
+                    website = self._website_from_row(row)
+                    website['content'] = self._preview(row['content'])
                     results.append(website)
                 
                 return results, total_count
@@ -268,38 +646,76 @@ class DatabaseManager:
             # Return empty results on error instead of raising
             return [], 0
     
+    def _build_where(self, query: str, filters: Dict = None) -> Tuple[str, str, List]:
+        """Build the search JOIN and WHERE clauses shared by the count and data queries"""
+        join_sql = ''
+        where_conditions = []
+        params = []
+        
+        # Full-text search using FTS5
+        if query and query.strip():
+            join_sql = ' JOIN search_index ON search_index.rowid = w.id'
+            where_conditions.append('search_index MATCH ?')
+            params.append(self._fts_query(query))
+        
+        # Apply filters
+        if filters:
+            if 'domain' in filters and filters['domain']:
+                where_conditions.append('w.domain = ?')
+                params.append(filters['domain'])
+            
+            if 'depth' in filters and filters['depth'] is not None:
+                where_conditions.append('w.depth = ?')
+                params.append(filters['depth'])
+            
+            if 'status_code' in filters and filters['status_code']:
+                where_conditions.append('w.status_code = ?')
+                params.append(filters['status_code'])
+        
+        where_sql = ' WHERE ' + ' AND '.join(where_conditions) if where_conditions else ''
+        return join_sql, where_sql, params
+    
+    def _website_from_row(self, row: sqlite3.Row) -> Dict:
+        """Convert a websites row to a dict, filling in display defaults for empty columns"""
+        website = dict(row)
+        for key, default in WEBSITE_DEFAULTS.items():
+            if key in website:
+                website[key] = website[key] or default
+        return website
+    
+    def _preview(self, text: Optional[str]) -> str:
+        """Mark a leading-text preview that was cut at CONTENT_PREVIEW_CHARS"""
+        if not text:
+            return 'No content'
+        if len(text) > CONTENT_PREVIEW_CHARS:
+            return text[:CONTENT_PREVIEW_CHARS] + '...'
+        return text
+    
+    def _fts_query(self, query: str) -> str:
+        """Quote each search term so user input can't trip FTS5 query syntax"""
+        terms = query.split()
+        return ' '.join('"' + term.replace('"', '""') + '"' for term in terms)
+    
     def get_website_details(self, website_id: int) -> Optional[Dict]:
         """Get detailed information about a specific website"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
-                cursor.execute('''
-                    SELECT w.*, GROUP_CONCAT(l.target_url) as outgoing_links
-                    FROM websites w
-                    LEFT JOIN links l ON w.id = l.source_website_id
-                    WHERE w.id = ?
-                    GROUP BY w.id
-                ''', (website_id,))
+                cursor.execute('SELECT * FROM websites WHERE id = ?', (website_id,))
                 
                 row = cursor.fetchone()
                 if row:
-                    website = {
-                        'id': row[0],
-                        'url': row[1] or '',
-                        'title': row[2] or 'No Title',
-                        'content': row[3] or 'No content',
-                        'content_hash': row[4] or '',
-                        'status_code': row[5] or 0,
-                        'crawl_time': row[6] or 0.0,
-                        'crawl_timestamp': row[7] or '',
-                        'domain': row[8] or 'Unknown',
-                        'depth': row[9] or 0,
-                        'links_count': row[10] or 0,
-                        'metadata': json.loads(row[11]) if row[11] else {},
-                        'created_at': row[12] or '',
-                        'outgoing_links': row[13].split(',') if row[13] else []
-                    }
+                    cursor.execute('''
+                        SELECT target_url FROM links 
+                        WHERE source_website_id = ? 
+                        ORDER BY id
+                    ''', (website_id,))
+                    outgoing_links = [link_row[0] for link_row in cursor]
+                    
+                    website = self._website_from_row(row)
+                    website['metadata'] = json.loads(row['metadata']) if row['metadata'] else {}
+                    website['outgoing_links'] = outgoing_links
                     return website
                 return None
                 
@@ -307,37 +723,35 @@ class DatabaseManager:
             logger.error(f"Error getting website details: {e}")
             return None
     
+    def iter_domains(self) -> Iterator[str]:
+        """Yield each domain in the database, one row at a time"""
+        with self._reader() as conn:
+            for row in conn.execute('SELECT DISTINCT domain FROM websites ORDER BY domain'):
+                yield row[0]
+    
     def get_domains(self) -> List[str]:
         """Get list of all domains in the database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('SELECT DISTINCT domain FROM websites ORDER BY domain')
-                return [row[0] for row in cursor.fetchall()]
+            return list(self.iter_domains())
         except Exception as e:
             logger.error(f"Error getting domains: {e}")
             return []
     
+    def iter_crawl_sessions(self, limit: int = 50) -> Iterator[Dict]:
+        """Yield crawl sessions, newest first, one row at a time"""
+        with self._reader() as conn:
+            cursor = conn.execute('''
+                SELECT * FROM crawl_sessions 
+                ORDER BY created_at DESC 
+                LIMIT ?
+            ''', (limit,))
+            for row in cursor:
+                yield dict(row)
+    
     def get_crawl_sessions(self, limit: int = 50) -> List[Dict]:
         """Get list of crawl sessions"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                cursor.execute('''
-                    SELECT * FROM crawl_sessions 
-                    ORDER BY created_at DESC 
-                    LIMIT ?
-                ''', (limit,))
-                
-                columns = [description[0] for description in cursor.description]
-                sessions = []
-                
-                for row in cursor.fetchall():
-                    session = dict(zip(columns, row))
-                    sessions.append(session)
-                
-                return sessions
-                
+            return list(self.iter_crawl_sessions(limit))
         except Exception as e:
             logger.error(f"Error getting crawl sessions: {e}")
             return []
@@ -345,7 +759,7 @@ class DatabaseManager:
     def get_statistics(self) -> Dict:
         """Get database statistics"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._reader() as conn:
                 cursor = conn.cursor()
                 
                 stats = {}
@@ -385,51 +799,91 @@ class DatabaseManager:
     
     def delete_old_data(self, days_old: int = 30) -> int:
         """Delete websites older than specified days"""
+        deleted_count = 0
         try:
-            with sqlite3.connect(self.db_path) as conn:
-                cursor = conn.cursor()
-                
-                # Delete old websites
-                cursor.execute('''
-                    DELETE FROM websites 
-                    WHERE crawl_timestamp < datetime('now', '-{} days')
-                '''.format(days_old))
-                
-                deleted_count = cursor.rowcount
-                
-                # Clean up orphaned links
-                cursor.execute('''
-                    DELETE FROM links 
-                    WHERE source_website_id NOT IN (SELECT id FROM websites)
-                ''')
-                
-                # Clean up search index
-                cursor.execute('DELETE FROM search_index')
-                cursor.execute('''
-                    INSERT INTO search_index (url, title, content, domain)
-                    SELECT url, title, content, domain FROM websites
-                ''')
-                
-                conn.commit()
-                logger.info(f"Deleted {deleted_count} old websites")
-                return deleted_count
-                
+            # Purge in bounded transactions so the WAL stays small and readers
+            # and other writers get a turn between chunks
+            while True:
+                with self._writer() as conn:
+                    cursor = conn.cursor()
+                    cursor.execute('BEGIN IMMEDIATE')
+                    
+                    # Delete old websites; their links cascade and the websites_fts_delete
+                    # trigger drops their search index entries
+                    cursor.execute('''
+                        DELETE FROM websites WHERE id IN (
+                            SELECT id FROM websites
+                            WHERE crawl_timestamp < datetime('now', ? || ' days')
+                            LIMIT ?
+                        )
+                        RETURNING content_hash
+                    ''', (-int(days_old), DELETE_CHUNK_SIZE))
+                    purged_hashes = [row[0] for row in cursor]
+                    
+                    if self._seen_hashes is not None:
+                        self._seen_hashes.difference_update(purged_hashes)
+                
+                deleted_count += len(purged_hashes)
+                if self.db_path != ':memory:':
+                    with self._lock:
+                        self._conn.execute('PRAGMA wal_checkpoint(PASSIVE)')
+                
+                if len(purged_hashes) < DELETE_CHUNK_SIZE:
+                    break
+            
+            logger.info(f"Deleted {deleted_count} old websites")
+            return deleted_count
+            
         except Exception as e:
             logger.error(f"Error deleting old data: {e}")
-            return 0
+            return deleted_count
     
     def _extract_domain(self, url: str) -> str:
         """Extract domain from URL"""
-        try:
-            from urllib.parse import urlparse
-            parsed = urlparse(url)
-            return parsed.netloc
-        except:
-            return url
+        return _extract_domain_cached(url)
     
     def close(self):
-        """Close database connection"""
-        pass  # SQLite handles connections automatically
+        """Close the writer connection and any pooled readers"""
+        self.flush()
+        while True:
+            try:
+                self._readers.get_nowait().close()
+            except queue.Empty:
+                break
+        with self._lock:
+            # Refresh planner statistics that have drifted since they were gathered
+            self._conn.execute('PRAGMA optimize')
+            self._conn.close()
+    
+    def reopen(self):
+        """
+        Open fresh connections after close(), e.g. in a server worker forked
+        from a process that had the database open; SQLite connections and the
+        writer thread do not survive a fork
+        """
+        with self._lock:
+            self._conn = self._connect()
+        self._readers = queue.Queue(maxsize=self._readers.maxsize)
+        self._write_q = queue.Queue(maxsize=self._write_q.maxsize)
+        self._write_thread = None
+        self._write_thread_lock = threading.Lock()
+
+# Global database manager instance, created on first use so that importing
+# this module does not open the database
+_db_manager = None
+_db_manager_lock = threading.Lock()
+
+def get_db_manager() -> DatabaseManager:
+    """Return the shared DatabaseManager, creating it on first call"""
+    global _db_manager
+    if _db_manager is None:
+        with _db_manager_lock:
+            if _db_manager is None:
+                _db_manager = DatabaseManager()  # Will use default path from config (data/crawler_database.db)
+    return _db_manager
 
-# Global database manager instance
-db_manager = DatabaseManager()  # Will use default path from config (data/crawler_database.db)
+def __getattr__(name):
+    # Keep `from database_manager import db_manager` working
+    if name == 'db_manager':
+        return get_db_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
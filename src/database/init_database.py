@@ -12,10 +12,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     # Try relative imports first (when running as package)
-    from ..database.database_manager import db_manager
+    from ..database.database_manager import get_db_manager
 except ImportError:
     # Fall back to absolute imports (when running from project root)
-    from src.database.database_manager import db_manager
+    from src.database.database_manager import get_db_manager
 
 import logging
 
@@ -30,6 +30,7 @@ def test_database():
     
     try:
         # Test database initialization
+        db_manager = get_db_manager()
         print("✅ Database initialized successfully")
         
         # Test statistics
@@ -17,10 +17,12 @@ except ImportError:
     # Fall back to absolute imports (when running from project root)
     from src.crawler.alopecosa_crawler import AlopecosaCrawler
 
+import argparse
+import io
 import time
 import json
 
-def demo_spider_behavior():
+def demo_spider_behavior(no_delay=False):
     """Demonstrate the spider-like behavior with a content-rich site"""
     print("🕷️  Alopecosa Fabrilis Web Crawler - Live Demonstration")
     print("=" * 60)
@@ -35,7 +37,7 @@ def demo_spider_behavior():
         base_url="https://quotes.toscrape.com",
         max_depth=2,
         max_pages=10,
-        delay_range=(1, 2),
+        delay_range=(0, 0) if no_delay else (1, 2),
         respect_robots=True
     )
     
@@ -53,41 +55,47 @@ def demo_spider_behavior():
         print(f"🗺️  Territory mapped: {len(crawler.terrain_map)} areas")
         print(f"🎯 Rich hunting grounds found: {len(crawler.prey_scent)}")
         
+        # Build the report in memory and write it out once
+        buf = io.StringIO()
+        
         # Show what the spider discovered
         if results:
-            print("\n🔍 Spider's Discoveries:")
+            print("\n🔍 Spider's Discoveries:", file=buf)
             for i, result in enumerate(results[:5]):  # Show first 5 results
-                print(f"\n  📄 Discovery {i+1}:")
-                print(f"     🏷️  Title: {result.title}")
-                print(f"     🔗 URL: {result.url}")
-                print(f"     📊 Links found: {len(result.links)}")
-                print(f"     ⏱️  Crawl time: {result.crawl_time:.2f}s")
-                print(f"     📏 Content length: {len(result.content)} chars")
+                print(f"\n  📄 Discovery {i+1}:", file=buf)
+                print(f"     🏷️  Title: {result.title}", file=buf)
+                print(f"     🔗 URL: {result.url}", file=buf)
+                print(f"     📊 Links found: {len(result.links)}", file=buf)
+                print(f"     ⏱️  Crawl time: {result.crawl_time:.2f}s", file=buf)
+                print(f"     📏 Content length: {len(result.content)} chars", file=buf)
                 
                 # Show some sample links
                 if result.links:
-                    print(f"     🔗 Sample links:")
+                    print(f"     🔗 Sample links:", file=buf)
                     for link in result.links[:3]:
-                        print(f"        - {link}")
+                        print(f"        - {link}", file=buf)
         
         # Show terrain map insights
         if crawler.terrain_map:
-            print(f"\n🗺️  Spider's Mental Map:")
-            print(f"     Total areas explored: {len(crawler.terrain_map)}")
+            print(f"\n🗺️  Spider's Mental Map:", file=buf)
+            print(f"     Total areas explored: {len(crawler.terrain_map)}", file=buf)
             
             # Find the richest area (most links)
             richest_area = max(crawler.terrain_map.items(), 
                              key=lambda x: x[1]['link_count'])
-            print(f"     🎯 Richest hunting ground: {richest_area[1]['link_count']} links")
-            print(f"     📍 Location: {richest_area[0]}")
+            print(f"     🎯 Richest hunting ground: {richest_area[1]['link_count']} links", file=buf)
+            print(f"     📍 Location: {richest_area[0]}", file=buf)
         
         # Show statistics
         stats = crawler.get_crawl_statistics()
-        print(f"\n📊 Hunt Statistics:")
-        print(f"     🎯 Success rate: {stats.get('success_rate', 0):.1%}")
-        print(f"     🔗 Total links discovered: {stats.get('total_links_discovered', 0)}")
-        print(f"     📊 Average links per page: {stats.get('average_links_per_page', 0):.1f}")
-        print(f"     ⏱️  Average crawl time: {stats.get('average_crawl_time', 0):.2f}s")
+        print(f"\n📊 Hunt Statistics:", file=buf)
+        print(f"     🎯 Success rate: {stats.get('success_rate', 0):.1%}", file=buf)
+        print(f"     🔗 Total links discovered: {stats.get('total_links_discovered', 0)}", file=buf)
+        print(f"     📊 Average links per page: {stats.get('average_links_per_page', 0):.1f}", file=buf)
+        print(f"     ⏱️  Average crawl time: {stats.get('average_crawl_time', 0):.2f}s", file=buf)
+        
+        sys.stdout.write(buf.getvalue())
+        sys.stdout.flush()
         
         # Save the spider's findings
         filename = "spider_hunt_results.json"
@@ -131,6 +139,13 @@ def show_spider_insights():
 
 def main():
     """Main demonstration function"""
+    parser = argparse.ArgumentParser(description="Alopecosa Fabrilis Web Crawler demonstration")
+    parser.add_argument('--non-interactive', action='store_true',
+                        help="Don't wait for Enter before starting the demonstration")
+    parser.add_argument('--no-delay', action='store_true',
+                        help='Crawl without the polite delay between requests')
+    args = parser.parse_args()
+    
     print("🕷️  Welcome to the Alopecosa Fabrilis Web Crawler!")
     print("This crawler mimics the hunting behavior of a real spider.")
     print()
@@ -140,10 +155,11 @@ def main():
     
     print("\n" + "=" * 60)
     print("🚀 Ready to see the spider in action?")
-    input("Press Enter to start the demonstration...")
+    if not args.non_interactive:
+        input("Press Enter to start the demonstration...")
     
     # Run the demonstration
-    success = demo_spider_behavior()
+    success = demo_spider_behavior(no_delay=args.no_delay)
     
     if success:
         print("\n🎯 Demonstration completed successfully!")
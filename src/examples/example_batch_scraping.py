@@ -12,23 +12,41 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     # Try relative imports first (when running as package)
-    from ..batch_scraper.batch_url_scraper import BatchURLScraper
+    from ..batch_scraper.batch_url_scraper import BatchURLScraper, iter_microbatches
+    from ..database.database_manager import db_manager
     from ..utils.config import CRAWLER_CONFIG
 except ImportError:
     # Fall back to absolute imports (when running from project root)
-    from src.batch_scraper.batch_url_scraper import BatchURLScraper
+    from src.batch_scraper.batch_url_scraper import BatchURLScraper, iter_microbatches
+    from src.database.database_manager import db_manager
     from src.utils.config import CRAWLER_CONFIG
 
+import argparse
+import asyncio
 import time
+from concurrent.futures import FIRST_COMPLETED, wait
 import json
 import logging
 
+# Async HTTP client for the single-threaded batch example
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-def example_batch_scraping():
-    """Example of using the batch scraper programmatically"""
+def example_batch_scraping(no_delay=False):
+    """
+    Example of using the batch scraper programmatically
+    
+    Crawling is network-bound and threads release the GIL while waiting on
+    sockets, so the pool is sized well beyond the CPU count; the scraper's
+    per-host limit keeps each site from being hit too hard.
+    """
     
     print("🕷️  Example: Batch URL Scraping")
     print("=" * 50)
@@ -48,8 +66,9 @@ def example_batch_scraping():
         # Initialize the batch scraper
         print("\n🚀 Initializing batch scraper...")
         scraper = BatchURLScraper(
-            max_workers=2,  # Process 2 URLs concurrently
-            delay_between_crawls=3.0  # 3 second delay between crawls
+            max_workers=min(32, 4 * (os.cpu_count() or 1)),  # I/O-bound, so many more threads than cores
+            delay_between_crawls=0,  # Politeness comes from the per-host limit instead
+            per_host_limit=2
         )
         
         # Create custom configuration
@@ -57,7 +76,7 @@ def example_batch_scraping():
         config.update({
             'default_max_depth': 1,      # Only crawl 1 level deep
             'default_max_pages': 5,      # Maximum 5 pages per site
-            'default_delay_range': (2, 4)  # 2-4 second delays between requests
+            'default_delay_range': (0, 0) if no_delay else (2, 4)  # 2-4 second delays between requests
         })
         
         print(f"⚙️  Configuration: max_depth={config['default_max_depth']}, max_pages={config['default_max_pages']}")
@@ -91,29 +110,117 @@ def example_batch_scraping():
         print(f"❌ Error: {e}")
         return False
 
-def example_with_custom_urls():
-    """Example with custom URLs from a file"""
+async def fetch_page(session, semaphore, url: str) -> dict:
+    """Fetch one URL, holding a semaphore slot while the request is in flight"""
+    async with semaphore:
+        start = time.monotonic()
+        try:
+            async with session.get(url, timeout=aiohttp.ClientTimeout(total=30)) as response:
+                body = await response.text()
+                return {
+                    'url': url,
+                    'status': response.status,
+                    'bytes': len(body),
+                    'elapsed': time.monotonic() - start,
+                    'error': None
+                }
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            return {
+                'url': url,
+                'status': None,
+                'bytes': 0,
+                'elapsed': time.monotonic() - start,
+                'error': str(e) or type(e).__name__
+            }
+
+async def run_batch(urls, max_workers: int = 16) -> list:
+    """Fetch all URLs concurrently on one event loop"""
+    semaphore = asyncio.Semaphore(max_workers)
+    connector = aiohttp.TCPConnector(limit=64, limit_per_host=4)
+    headers = {'User-Agent': CRAWLER_CONFIG['user_agent']}
+    
+    async with aiohttp.ClientSession(connector=connector, headers=headers) as session:
+        return await asyncio.gather(*(fetch_page(session, semaphore, url) for url in urls))
+
+def example_async_batch_scraping():
+    """Example of fetching a batch of URLs concurrently with asyncio and aiohttp"""
+    
+    print("\n🕷️  Example: Async Batch Fetching")
+    print("=" * 50)
+    
+    if not AIOHTTP_AVAILABLE:
+        print("⚠️  aiohttp is not installed; run 'pip install aiohttp' to try this example")
+        return False
+    
+    # List of URLs to fetch
+    urls = [
+        "https://example.com",
+        "https://httpbin.org",
+        "https://jsonplaceholder.typicode.com"
+    ]
+    
+    print(f"📋 URLs to fetch: {len(urls)}")
+    
+    try:
+        # Every request overlaps on one thread; the semaphore and connector
+        # limits cap how many are in flight overall and per host
+        start = time.monotonic()
+        pages = asyncio.run(run_batch(urls))
+        elapsed = time.monotonic() - start
+        
+        for page in pages:
+            if page['error']:
+                print(f"   ❌ {page['url']}: {page['error']}")
+            else:
+                print(f"   ✅ {page['url']}: HTTP {page['status']}, {page['bytes']} chars in {page['elapsed']:.2f}s")
+        
+        print(f"\n⏱️  Fetched {len(pages)} URLs in {elapsed:.2f}s")
+        
+        return all(page['error'] is None for page in pages)
+        
+    except Exception as e:
+        logger.error(f"Async batch example failed: {e}")
+        print(f"❌ Error: {e}")
+        return False
+
+def example_with_custom_urls(no_delay=False):
+    """Example with custom URLs from a file, scraped in micro-batches"""
     
     print("\n🕷️  Example: Custom URLs from File")
     print("=" * 50)
     
     try:
         # Initialize scraper
-        scraper = BatchURLScraper(max_workers=1, delay_between_crawls=5.0)
+        scraper = BatchURLScraper(max_workers=1, delay_between_crawls=0 if no_delay else 5.0)
         
         # Load URLs from the sample text file
         urls = scraper.load_urls_from_file("sample_urls/sample_urls.txt", "txt")
         
         print(f"📂 Loaded {len(urls)} URLs from file")
         
-        # Use default configuration
+        # Keep the demo crawl shallow
         config = CRAWLER_CONFIG.copy()
+        config.update({
+            'default_max_depth': 1,
+            'default_max_pages': 5
+        })
+        if no_delay:
+            config['default_delay_range'] = (0, 0)
         
-        # Run with limited scope for demo
-        limited_urls = urls[:3]  # Only first 3 URLs for demo
-        print(f"🧪 Running demo with first {len(limited_urls)} URLs...")
+        # Submit small batches with a few in flight at once; each batch is
+        # reported (and already stored in the database) as soon as it finishes
+        batch_size = 4
+        max_in_flight = 2
+        print(f"🧪 Scraping in batches of {batch_size}, {max_in_flight} at a time...")
         
-        results = scraper.scrape_urls(limited_urls, config)
+        pending = set()
+        for batch in iter_microbatches(urls, batch_size):
+            if len(pending) >= max_in_flight:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                report_batches(done)
+            pending.add(scraper.scrape_urls_async(batch, config))
+        
+        report_batches(pending)
         
         # Print summary
         scraper.print_summary()
@@ -125,13 +232,27 @@ def example_with_custom_urls():
         print(f"❌ Error: {e}")
         return False
 
+def report_batches(futures):
+    """Print the outcome of each URL in the finished batches"""
+    for future in futures:
+        for url, result in future.result().items():
+            if result['success']:
+                print(f"   ✅ {url}: {result['pages_crawled']} pages")
+            else:
+                print(f"   ❌ {url}: {result.get('error', 'Unknown error')}")
+
 def main():
     """Main function"""
+    parser = argparse.ArgumentParser(description="Alopecosa Fabrilis batch scraper examples")
+    parser.add_argument('--no-delay', action='store_true',
+                        help='Skip the polite delays between crawls and requests')
+    args = parser.parse_args()
+    
     print("🚀 Alopecosa Fabrilis Batch Scraper Examples")
     print("=" * 60)
     
     # Example 1: Direct URL list
-    success1 = example_batch_scraping()
+    success1 = example_batch_scraping(no_delay=args.no_delay)
     
     if success1:
         print("\n✅ First example completed successfully!")
@@ -139,13 +260,21 @@ def main():
         print("\n❌ First example failed")
     
     # Example 2: URLs from file
-    success2 = example_with_custom_urls()
+    success2 = example_with_custom_urls(no_delay=args.no_delay)
     
     if success2:
         print("\n✅ Second example completed successfully!")
     else:
         print("\n❌ Second example failed")
     
+    # Example 3: Concurrent fetching on a single event loop
+    success3 = example_async_batch_scraping()
+    
+    if success3:
+        print("\n✅ Third example completed successfully!")
+    else:
+        print("\n❌ Third example failed")
+    
     print("\n🎯 Examples completed!")
     print("💡 You can now use the batch scraper with your own URL lists!")
 
@@ -13,15 +13,46 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 try:
     # Try relative imports first (when running as package)
     from ..crawler.alopecosa_crawler import AlopecosaCrawler
+    from ..crawler.http_cache import CachingSession
 except ImportError:
     # Fall back to absolute imports (when running from project root)
     from src.crawler.alopecosa_crawler import AlopecosaCrawler
+    from src.crawler.http_cache import CachingSession
 
-import json
+import io
+import re
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
-def basic_crawl_example():
+
+# Keywords that mark a link as interesting to custom_crawl_function, matched
+# in one case-insensitive pass
+LINK_KEYWORDS_PATTERN = re.compile(r'page|article|post|content', re.IGNORECASE)
+
+
+def create_shared_session() -> requests.Session:
+    """
+    Build one pooled session so every example reuses TCP/TLS connections.
+    Pages are revalidated against ./.http_cache, so unchanged pages are not
+    downloaded again on later runs.
+    """
+    session = CachingSession('.http_cache')
+    adapter = HTTPAdapter(
+        pool_connections=32,
+        pool_maxsize=64,
+        max_retries=Retry(total=3, backoff_factor=0.3)
+    )
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    return session
+
+
+def basic_crawl_example(session=None):
     """Basic example of using the crawler"""
     print("🕷️  Starting basic crawl example...")
     
@@ -30,7 +61,8 @@ def basic_crawl_example():
         base_url="https://example.com",
         max_depth=2,
         max_pages=10,
-        delay_range=(1, 2)
+        delay_range=(1, 2),
+        session=session
     )
     
     # Start crawling
@@ -48,7 +80,7 @@ def basic_crawl_example():
         print(f"  {key}: {value}")
 
 
-def advanced_crawl_example():
+def advanced_crawl_example(session=None):
     """Advanced example with custom settings"""
     print("\n🕷️  Starting advanced crawl example...")
     
@@ -59,7 +91,8 @@ def advanced_crawl_example():
         max_pages=20,
         delay_range=(0.5, 1.5),
         user_agent="My-Custom-Spider/1.0",
-        respect_robots=True
+        respect_robots=True,
+        session=session
     )
     
     # Start crawling
@@ -70,17 +103,19 @@ def advanced_crawl_example():
     # Save results with custom filename
     crawler.save_results("advanced_crawl_example.json")
     
-    # Show detailed results
-    print("\n🔍 Sample Results:")
+    # Show detailed results, written in one go so concurrent examples don't interleave
+    buf = io.StringIO()
+    print("\n🔍 Sample Results:", file=buf)
     for i, result in enumerate(results[:3]):  # Show first 3 results
-        print(f"\n  Result {i+1}:")
-        print(f"    URL: {result.url}")
-        print(f"    Title: {result.title}")
-        print(f"    Links found: {len(result.links)}")
-        print(f"    Crawl time: {result.crawl_time:.2f}s")
+        print(f"\n  Result {i+1}:", file=buf)
+        print(f"    URL: {result.url}", file=buf)
+        print(f"    Title: {result.title}", file=buf)
+        print(f"    Links found: {len(result.links)}", file=buf)
+        print(f"    Crawl time: {result.crawl_time:.2f}s", file=buf)
+    sys.stdout.write(buf.getvalue())
 
 
-def spider_behavior_demo():
+def spider_behavior_demo(session=None):
     """Demonstrate the spider-like behavior features"""
     print("\n🕷️  Demonstrating spider behavior...")
     
@@ -88,7 +123,8 @@ def spider_behavior_demo():
         base_url="https://quotes.toscrape.com",
         max_depth=2,
         max_pages=15,
-        delay_range=(1, 2)
+        delay_range=(1, 2),
+        session=session
     )
     
     # Start crawling
@@ -97,22 +133,24 @@ def spider_behavior_demo():
     print(f"✅ Crawled {len(results)} pages")
     
     # Show terrain map (spider's mental map of the web)
-    print("\n🗺️  Terrain Map (Spider's Mental Map):")
+    buf = io.StringIO()
+    print("\n🗺️  Terrain Map (Spider's Mental Map):", file=buf)
     for url, info in list(crawler.terrain_map.items())[:5]:
-        print(f"  {url}")
-        print(f"    Depth: {info['depth']}")
-        print(f"    Links: {info['link_count']}")
-        print(f"    Title: {info['title']}")
-        print()
+        print(f"  {url}", file=buf)
+        print(f"    Depth: {info['depth']}", file=buf)
+        print(f"    Links: {info['link_count']}", file=buf)
+        print(f"    Title: {info['title']}", file=buf)
+        print(file=buf)
     
     # Show prey scent (promising areas)
-    print(f"🎯 Prey Scent (Rich hunting grounds): {len(crawler.prey_scent)} areas detected")
+    print(f"🎯 Prey Scent (Rich hunting grounds): {len(crawler.prey_scent)} areas detected", file=buf)
+    sys.stdout.write(buf.getvalue())
     
     # Save results
     crawler.save_results("spider_behavior_demo.json")
 
 
-def custom_crawl_function():
+def custom_crawl_function(session=None):
     """Custom crawling function with specific requirements"""
     print("\n🕷️  Custom crawl function...")
     
@@ -124,15 +162,15 @@ def custom_crawl_function():
     def custom_link_filter(links):
         """Custom filter for links"""
         # Only keep links that contain certain keywords
-        keywords = ['page', 'article', 'post', 'content']
-        return [link for link in links if any(keyword in link.lower() for keyword in keywords)]
+        return [link for link in links if LINK_KEYWORDS_PATTERN.search(link)]
     
     # Create crawler
     crawler = AlopecosaCrawler(
         base_url="https://httpbin.org",
         max_depth=2,
         max_pages=10,
-        delay_range=(1, 2)
+        delay_range=(1, 2),
+        session=session
     )
     
     # Start crawling
@@ -144,14 +182,19 @@ def custom_crawl_function():
     print(f"✅ Original results: {len(results)}")
     print(f"✅ Filtered results: {len(filtered_results)}")
     
-    # Save filtered results
-    with open("custom_filtered_results.json", "w") as f:
-        json.dump([{
-            'url': r.url,
-            'title': r.title,
-            'content_length': len(r.content),
-            'links': custom_link_filter(r.links)
-        } for r in filtered_results], f, indent=2)
+    # Save filtered results, encoding one result at a time
+    with open("custom_filtered_results.json", "wb") as f:
+        f.write(b"[")
+        for i, r in enumerate(filtered_results):
+            if i:
+                f.write(b",")
+            f.write(orjson.dumps({
+                'url': r.url,
+                'title': r.title,
+                'content_length': len(r.content),
+                'links': custom_link_filter(r.links)
+            }, option=orjson.OPT_INDENT_2))
+        f.write(b"]")
     
     print("💾 Saved filtered results to custom_filtered_results.json")
 
@@ -162,11 +205,16 @@ def main():
     print("=" * 50)
     
     try:
-        # Run examples
-        basic_crawl_example()
-        advanced_crawl_example()
-        spider_behavior_demo()
-        custom_crawl_function()
+        # Run examples concurrently, sharing one connection pool across all
+        # of them; each crawls its own site, so they only wait on the network
+        session = create_shared_session()
+        examples = (basic_crawl_example, advanced_crawl_example,
+                    spider_behavior_demo, custom_crawl_function)
+        with ThreadPoolExecutor(max_workers=len(examples)) as executor:
+            futures = [executor.submit(example, session) for example in examples]
+            for future in as_completed(futures):
+                future.result()
+        session.close()
         
         print("\n🎉 All examples completed successfully!")
         print("\n📁 Generated files:")
@@ -28,8 +28,11 @@ def main():
             print("🏭 Running in production mode")
             socketio.run(app, host='0.0.0.0', port=5000, debug=False, allow_unsafe_werkzeug=True)
         else:
-            print("🔧 Running in development mode")
-            socketio.run(app, host='0.0.0.0', port=5000, debug=True)
+            # Debugger and reloader only with FLASK_DEBUG set
+            debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+            print(f"🔧 Running in development mode{' with debugger' if debug else ''}")
+            socketio.run(app, host='0.0.0.0', port=5000, debug=debug, use_reloader=debug,
+                         allow_unsafe_werkzeug=True)
         
     except KeyboardInterrupt:
         print("\n🛑 Web interface stopped by user")
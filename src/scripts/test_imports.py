@@ -1,60 +1,69 @@
 #!/usr/bin/env python3
 """
 Test script to verify all imports work correctly
+
+Each subsystem is imported only when it is tested, so passing e.g. --db
+checks the database package without paying for Flask and Socket.IO.
 """
 
 import sys
 import os
+import argparse
+
+def _import_crawler():
+    from crawler.alopecosa_crawler import AlopecosaCrawler, CrawlResult
+
+def _import_database():
+    from database.database_manager import DatabaseManager
+
+def _import_batch():
+    from batch_scraper.batch_url_scraper import BatchURLScraper
+
+def _import_utils():
+    from utils.config import CRAWLER_CONFIG, LOGGING_CONFIG
 
-# Add the src directory to the Python path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+def _import_web():
+    # Without starting server
+    from web_interface.web_interface import app, crawler_manager
 
-def test_imports():
-    """Test all package imports"""
+def _import_package():
+    from src import AlopecosaCrawler, DatabaseManager, BatchURLScraper, CRAWLER_CONFIG
+
+# Subsystem flag -> (label, import check)
+IMPORT_CHECKS = {
+    'crawler': ('crawler package', _import_crawler),
+    'db': ('database package', _import_database),
+    'batch': ('batch scraper package', _import_batch),
+    'utils': ('utils package', _import_utils),
+    'web': ('web interface package', _import_web),
+    'package': ('main package', _import_package),
+}
+
+def test_imports(subsystems=None):
+    """Test package imports, limited to the given subsystems if any"""
     print("🧪 Testing Alopecosa Fabrilis package imports...")
     print("=" * 50)
     
+    selected = subsystems or list(IMPORT_CHECKS)
+    
     try:
-        # Test crawler package
-        print("📦 Testing crawler package...")
-        from crawler.alopecosa_crawler import AlopecosaCrawler, CrawlResult
-        print("✅ Crawler package imported successfully")
-        
-        # Test database package
-        print("📦 Testing database package...")
-        from database.database_manager import DatabaseManager
-        print("✅ Database package imported successfully")
-        
-        # Test batch scraper package
-        print("📦 Testing batch scraper package...")
-        from batch_scraper.batch_url_scraper import BatchURLScraper
-        print("✅ Batch scraper package imported successfully")
-        
-        # Test utils package
-        print("📦 Testing utils package...")
-        from utils.config import CRAWLER_CONFIG, LOGGING_CONFIG
-        print("✅ Utils package imported successfully")
-        
-        # Test web interface package (without starting server)
-        print("📦 Testing web interface package...")
-        from web_interface.web_interface import app, crawler_manager
-        print("✅ Web interface package imported successfully")
-        
-        # Test main package
-        print("📦 Testing main package...")
-        from src import AlopecosaCrawler, DatabaseManager, BatchURLScraper, CRAWLER_CONFIG
-        print("✅ Main package imported successfully")
+        for name in selected:
+            label, check = IMPORT_CHECKS[name]
+            print(f"📦 Testing {label}...")
+            check()
+            print(f"✅ {label[0].upper() + label[1:]} imported successfully")
         
         print("\n🎉 All imports successful! The project structure is working correctly.")
-        print("\n📋 Available components:")
-        print("   • AlopecosaCrawler - Core crawling engine")
-        print("   • DatabaseManager - Database operations")
-        print("   • BatchURLScraper - Batch URL processing")
-        print("   • CRAWLER_CONFIG - Configuration settings")
-        print("   • Flask app - Web interface")
+        if not subsystems:
+            print("\n📋 Available components:")
+            print("   • AlopecosaCrawler - Core crawling engine")
+            print("   • DatabaseManager - Database operations")
+            print("   • BatchURLScraper - Batch URL processing")
+            print("   • CRAWLER_CONFIG - Configuration settings")
+            print("   • Flask app - Web interface")
         
         return True
-        
+    
     except ImportError as e:
         print(f"❌ Import error: {e}")
         return False
@@ -62,47 +71,61 @@ def test_imports():
         print(f"❌ Unexpected error: {e}")
         return False
 
-def test_basic_functionality():
+def test_basic_functionality(subsystems=None):
     """Test basic functionality without starting servers"""
     print("\n🧪 Testing basic functionality...")
     print("=" * 50)
     
+    selected = subsystems or list(IMPORT_CHECKS)
+    
     try:
-        # Test crawler creation
-        print("🕷️  Testing crawler creation...")
-        from crawler.alopecosa_crawler import AlopecosaCrawler
-        crawler = AlopecosaCrawler("https://example.com", max_depth=1, max_pages=1)
-        print("✅ Crawler created successfully")
+        if 'crawler' in selected:
+            # Test crawler creation
+            print("🕷️  Testing crawler creation...")
+            from crawler.alopecosa_crawler import AlopecosaCrawler
+            crawler = AlopecosaCrawler("https://example.com", max_depth=1, max_pages=1)
+            print("✅ Crawler created successfully")
         
-        # Test database manager
-        print("🗄️  Testing database manager...")
-        from database.database_manager import db_manager
-        print("✅ Database manager created successfully")
+        if 'db' in selected:
+            # Test database manager
+            print("🗄️  Testing database manager...")
+            from database.database_manager import db_manager
+            print("✅ Database manager created successfully")
         
-        # Test batch scraper
-        print("🔄 Testing batch scraper...")
-        from batch_scraper.batch_url_scraper import BatchURLScraper
-        scraper = BatchURLScraper(max_workers=1)
-        print("✅ Batch scraper created successfully")
+        if 'batch' in selected:
+            # Test batch scraper
+            print("🔄 Testing batch scraper...")
+            from batch_scraper.batch_url_scraper import BatchURLScraper
+            scraper = BatchURLScraper(max_workers=1)
+            print("✅ Batch scraper created successfully")
         
         print("\n🎉 Basic functionality tests passed!")
         return True
-        
+    
     except Exception as e:
         print(f"❌ Functionality test failed: {e}")
         return False
 
 def main():
     """Main test function"""
+    parser = argparse.ArgumentParser(
+        description="Check that the Alopecosa Fabrilis packages import and start"
+    )
+    for name, (label, _) in IMPORT_CHECKS.items():
+        parser.add_argument(f'--{name}', action='store_true', help=f'Test only the {label} (combinable)')
+    args = parser.parse_args()
+    
+    subsystems = [name for name in IMPORT_CHECKS if getattr(args, name)]
+    
     print("🚀 Alopecosa Fabrilis Import and Functionality Test")
     print("=" * 60)
     
     # Test imports
-    imports_ok = test_imports()
+    imports_ok = test_imports(subsystems)
     
     if imports_ok:
         # Test basic functionality
-        functionality_ok = test_basic_functionality()
+        functionality_ok = test_basic_functionality(subsystems)
         
         if functionality_ok:
             print("\n🎯 All tests passed! Your project is ready to use.")
@@ -119,4 +142,6 @@ def main():
         sys.exit(1)
 
 if __name__ == "__main__":
+    # Add the src directory to the Python path
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
     main()
@@ -4,6 +4,7 @@ Contains test scripts and testing utilities
 """
 
 __all__ = [
+    'test_bloom_filter',
     'test_database_storage',
     'test_crawler'
 ]
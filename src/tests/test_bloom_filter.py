@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Test Bloom filters for Alopecosa Fabrilis Web Crawler
+Checks that visited-URL filters never forget a URL and stay near their error rate
+"""
+
+import sys
+import os
+
+# Add the src directory to the Python path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+try:
+    # Try relative imports first (when running as package)
+    from ..crawler.bloom_filter import BloomFilter, ScalableBloomFilter
+except ImportError:
+    # Fall back to absolute imports (when running from project root)
+    from src.crawler.bloom_filter import BloomFilter, ScalableBloomFilter
+
+# Items added to each filter, and unseen items probed for false positives
+ADDED_COUNT = 20_000
+PROBE_COUNT = 20_000
+
+# Measured false-positive rates may exceed the target by this factor
+ERROR_RATE_SLACK = 2.0
+
+def _urls(prefix, count):
+    return [f"https://example.com/{prefix}/{i}" for i in range(count)]
+
+def _false_positive_rate(bloom):
+    probes = _urls("unseen", PROBE_COUNT)
+    return sum(url in bloom for url in probes) / len(probes)
+
+def test_bloom_filter():
+    """Test the fixed-capacity filter at full capacity"""
+    print("🧪 Testing BloomFilter...")
+    
+    bloom = BloomFilter(ADDED_COUNT, error_rate=0.01)
+    added = _urls("seen", ADDED_COUNT)
+    for url in added:
+        bloom.add(url)
+    
+    missing = [url for url in added if url not in bloom]
+    assert not missing, f"{len(missing)} added URLs reported absent"
+    assert not bloom.add(added[0]), "re-adding a URL should report it present"
+    
+    rate = _false_positive_rate(bloom)
+    assert rate <= bloom.error_rate * ERROR_RATE_SLACK, rate
+    
+    print(f"✅ No false negatives, false-positive rate {rate:.4f} (target {bloom.error_rate})")
+    return True
+
+def test_scalable_bloom_filter():
+    """Test that the scalable filter grows without losing earlier URLs"""
+    print("\n📈 Testing ScalableBloomFilter growth...")
+    
+    bloom = ScalableBloomFilter(initial_capacity=1_000, error_rate=0.01)
+    added = _urls("seen", ADDED_COUNT)
+    for url in added:
+        bloom.add(url)
+    
+    assert len(bloom.filters) > 1, "filter should have chained on larger filters"
+    assert len(bloom) <= ADDED_COUNT
+    
+    missing = [url for url in added if url not in bloom]
+    assert not missing, f"{len(missing)} added URLs reported absent after growth"
+    
+    rate = _false_positive_rate(bloom)
+    assert rate <= bloom.error_rate * ERROR_RATE_SLACK, rate
+    
+    print(f"✅ Grew to {len(bloom.filters)} filters, false-positive rate {rate:.4f} (target {bloom.error_rate})")
+    return True
+
+def main():
+    """Main test function"""
+    print("🕷️  Alopecosa Fabrilis Bloom Filters - Test Suite")
+    print("=" * 50)
+    
+    fixed_success = test_bloom_filter()
+    scalable_success = test_scalable_bloom_filter()
+    
+    print("\n" + "=" * 50)
+    print("📋 Test Summary:")
+    print(f"  BloomFilter: {'✅ PASS' if fixed_success else '❌ FAIL'}")
+    print(f"  ScalableBloomFilter: {'✅ PASS' if scalable_success else '❌ FAIL'}")
+
+if __name__ == "__main__":
+    main()
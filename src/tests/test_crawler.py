@@ -11,10 +11,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     # Try relative imports first (when running as package)
-    from ..crawler.alopecosa_crawler import AlopecosaCrawler
+    from ..crawler.alopecosa_crawler import AlopecosaCrawler, canonicalize_url
 except ImportError:
     # Fall back to absolute imports (when running from project root)
-    from src.crawler.alopecosa_crawler import AlopecosaCrawler
+    from src.crawler.alopecosa_crawler import AlopecosaCrawler, canonicalize_url
 
 import json
 
@@ -98,6 +98,76 @@ def test_spider_features():
         print(f"❌ Error testing spider features: {e}")
         return False
 
+def test_url_canonicalization():
+    """Test that equivalent URLs collapse to one canonical form"""
+    print("\n🔗 Testing URL canonicalization...")
+    
+    variants = [
+        "https://x.com/a",
+        "https://x.com/a/",
+        "https://x.com/a?utm_source=news#frag",
+        "https://X.com/a",
+    ]
+    canonical = {canonicalize_url(url) for url in variants}
+    assert canonical == {"https://x.com/a"}, canonical
+    
+    assert canonicalize_url("https://x.com/?b=2&a=1") == "https://x.com/?a=1&b=2"
+    assert canonicalize_url("https://x.com") == "https://x.com/"
+    
+    print("✅ Equivalent URLs collapse to a single key")
+    return True
+
+class _FakeResponse:
+    """Minimal streamed response for a page served at a redirected URL"""
+    
+    def __init__(self, url, body):
+        self.url = url
+        self.status_code = 200
+        self.headers = {'Content-Type': 'text/html; charset=utf-8'}
+        self._body = body
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        return False
+    
+    def iter_content(self, chunk_size=65536):
+        yield self._body
+
+
+class _FakeSession:
+    """Session that redirects https://x.com/a to the directory page /a/"""
+    
+    def get(self, url, **kwargs):
+        body = b'<html><body><a href="b.html">B</a></body></html>'
+        return _FakeResponse("https://x.com/a/", body)
+
+
+def test_relative_links_on_directory_page():
+    """Test that relative links resolve against the served directory URL"""
+    print("\n📂 Testing relative links on a directory page...")
+    
+    crawler = AlopecosaCrawler(
+        base_url="https://x.com/a/",
+        max_depth=1,
+        max_pages=1,
+        delay_range=(0, 0),
+        respect_robots=False,
+        session=_FakeSession()
+    )
+    
+    # The queue holds the canonical key, which has lost its trailing slash
+    url, depth = crawler.url_queue.popleft()
+    assert url == "https://x.com/a", url
+    
+    result = crawler._crawl_page(url, depth)
+    assert result is not None
+    assert result.links == ["https://x.com/a/b.html"], result.links
+    
+    print("✅ Relative links resolve against the directory page")
+    return True
+
 def main():
     """Main test function"""
     print("🕷️  Alopecosa Fabrilis Web Crawler - Test Suite")
@@ -109,13 +179,21 @@ def main():
     # Test spider features
     spider_success = test_spider_features()
     
+    # Test URL canonicalization
+    canonical_success = test_url_canonicalization()
+    
+    # Test relative link resolution
+    relative_success = test_relative_links_on_directory_page()
+    
     # Summary
     print("\n" + "=" * 50)
     print("📋 Test Summary:")
     print(f"  Basic functionality: {'✅ PASS' if basic_success else '❌ FAIL'}")
     print(f"  Spider features: {'✅ PASS' if spider_success else '❌ FAIL'}")
+    print(f"  URL canonicalization: {'✅ PASS' if canonical_success else '❌ FAIL'}")
+    print(f"  Relative links: {'✅ PASS' if relative_success else '❌ FAIL'}")
     
-    if basic_success and spider_success:
+    if basic_success and spider_success and canonical_success and relative_success:
         print("\n🎉 All tests passed! The crawler is working correctly.")
     else:
         print("\n⚠️  Some tests failed. Check the error messages above.")
@@ -12,47 +12,55 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
 
 try:
     # Try relative imports first (when running as package)
-    from ..database.database_manager import db_manager
+    from ..database.database_manager import DatabaseManager
 except ImportError:
     # Fall back to absolute imports (when running from project root)
-    from src.database.database_manager import db_manager
+    from src.database.database_manager import DatabaseManager
 
+from dataclasses import dataclass
 from datetime import datetime
 import logging
+import tempfile
+import time
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Generated pages stored in a single session by the bulk insert test
+MOCK_PAGE_COUNT = 10_000
+
 def test_database_storage():
     """Test database storage functionality"""
     print("🕷️  Testing Database Storage System")
     print("=" * 50)
     
+    # A throwaway database keeps the bulk insert out of data/crawler_database.db
+    temp_dir = tempfile.TemporaryDirectory()
+    db_manager = None
+    
     try:
         # Test basic database functionality
+        db_manager = DatabaseManager(os.path.join(temp_dir.name, 'test_crawler.db'))
         print("✅ Database manager initialized successfully")
         
-        # Get current statistics
-        stats = db_manager.get_statistics()
-        print(f"📊 Current database stats: {stats}")
-        
-        # Test storing a simple crawl session
-        print("\n🧪 Testing crawl session storage...")
+        # Test storing a bulk crawl session
+        print(f"\n🧪 Testing crawl session storage ({MOCK_PAGE_COUNT + 1} pages)...")
         
         # Create mock results (simplified version of what the crawler would produce)
+        @dataclass(slots=True)
         class MockResult:
-            def __init__(self, url, title, content, links, status_code, crawl_time, timestamp, metadata):
-                self.url = url
-                self.title = title
-                self.content = content
-                self.links = links
-                self.status_code = status_code
-                self.crawl_time = crawl_time
-                self.timestamp = timestamp
-                self.metadata = metadata
+            url: str
+            title: str
+            content: str
+            links: list
+            status_code: int
+            crawl_time: float
+            timestamp: float
+            metadata: dict
         
-        # Create mock results
+        # Create mock results: the example.com home page plus generated pages
+        now = time.time()
         mock_results = [
             MockResult(
                 url="https://example.com",
@@ -61,47 +69,57 @@ def test_database_storage():
                 links=["https://example.com/page1", "https://example.com/page2"],
                 status_code=200,
                 crawl_time=0.5,
-                timestamp=datetime.now(),
+                timestamp=now,
                 metadata={"depth": 0, "source": "test"}
-            ),
+            )
+        ]
+        mock_results.extend(
             MockResult(
-                url="https://example.com/page1",
-                title="Page 1",
-                content="This is page 1 content for testing.",
-                links=["https://example.com", "https://example.com/page2"],
+                url=f"https://example.com/page{i}",
+                title=f"Page {i}",
+                content=f"This is page {i} content for testing.",
+                links=["https://example.com", f"https://example.com/page{i + 1}"],
                 status_code=200,
                 crawl_time=0.3,
-                timestamp=datetime.now(),
+                timestamp=now,
                 metadata={"depth": 1, "source": "test"}
             )
-        ]
+            for i in range(1, MOCK_PAGE_COUNT + 1)
+        )
         
-        # Test storing results
+        # Test storing results in one call, timed so regressions show up
         start_time = datetime.now()
         end_time = datetime.now()
         
+        t0 = time.perf_counter()
         session_id = db_manager.store_crawl_results(
             session_name="Test Crawl Session",
             base_url="https://example.com",
             max_depth=2,
-            max_pages=10,
+            max_pages=len(mock_results),
             results=mock_results,
             start_time=start_time,
             end_time=end_time,
             status='completed'
         )
+        elapsed = time.perf_counter() - t0
         
-        print(f"✅ Successfully stored test crawl session with ID: {session_id}")
+        print(f"✅ Stored {len(mock_results)} results in {elapsed:.3f}s (session ID: {session_id})")
         
-        # Check updated statistics
-        new_stats = db_manager.get_statistics()
-        print(f"📊 Updated database stats: {new_stats}")
+        # Check statistics once, after the write
+        stats = db_manager.get_statistics()
+        print(f"📊 Database stats: {stats}")
+        assert stats['total_websites'] == len(mock_results), stats
         
         # Test search functionality
         print("\n🔍 Testing search functionality...")
         results, count = db_manager.search_websites("example")
+        assert count == len(mock_results), count
         print(f"✅ Search test successful: {count} results found")
         
+        results, count = db_manager.search_websites("Page 42")
+        assert any(result['url'] == "https://example.com/page42" for result in results), results
+        
         if results:
             print(f"📄 First result: {results[0]['title']}")
         
@@ -123,6 +141,11 @@ def test_database_storage():
         import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         return False
+    
+    finally:
+        if db_manager is not None:
+            db_manager.close()
+        temp_dir.cleanup()
 
 def main():
     """Main function"""
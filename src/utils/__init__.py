@@ -3,12 +3,18 @@ Utilities package for Alopecosa Fabrilis Web Crawler
 Contains configuration and utility functions
 """
 
-from .config import CRAWLER_CONFIG, LOGGING_CONFIG, OUTPUT_CONFIG, SPIDER_PATTERNS, DATABASE_CONFIG
+from .config import (
+    CRAWLER_CONFIG, LOGGING_CONFIG, OUTPUT_CONFIG, SPIDER_PATTERNS, DATABASE_CONFIG,
+    EXCLUDED_EXTENSIONS, EXCLUDED_EXTENSION_PATTERN, PREFERRED_CONTENT_TYPES
+)
 
 __all__ = [
     'CRAWLER_CONFIG', 
     'LOGGING_CONFIG', 
     'OUTPUT_CONFIG', 
     'SPIDER_PATTERNS',
-    'DATABASE_CONFIG'
+    'DATABASE_CONFIG',
+    'EXCLUDED_EXTENSIONS',
+    'EXCLUDED_EXTENSION_PATTERN',
+    'PREFERRED_CONTENT_TYPES'
 ]
@@ -3,11 +3,13 @@ AI Configuration and utilities for the enhanced crawler
 """
 
 import os
+import string
+from functools import lru_cache
 from typing import Dict, List, Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class AIConfig:
     """Configuration for AI-enhanced crawling"""
     openai_api_key: str
@@ -77,8 +79,14 @@ class AIPromptTemplates:
     """
 
 
+@lru_cache(maxsize=1)
 def load_ai_config() -> AIConfig:
-    """Load AI configuration from environment variables or defaults"""
+    """
+    Load AI configuration from environment variables or defaults
+    
+    The environment is read once; later calls return the same (immutable)
+    instance. Call load_ai_config.cache_clear() to pick up changes.
+    """
     return AIConfig(
         openai_api_key=os.getenv('OPENAI_API_KEY', ''),
         model=os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo'),
@@ -112,19 +120,49 @@ def validate_ai_config(config: AIConfig) -> List[str]:
     return issues
 
 
+# Rough cost estimates per 1K tokens (as of 2024)
+_COST_PER_1K = {
+    "gpt-3.5-turbo": 0.002,  # $0.002 per 1K tokens
+    "gpt-4": 0.03,           # $0.03 per 1K tokens
+    "text-embedding-ada-002": 0.0001  # $0.0001 per 1K tokens
+}
+
+
 def get_ai_cost_estimate(tokens_used: int, model: str = "gpt-3.5-turbo") -> float:
     """Estimate cost of AI API usage (approximate)"""
-    # Rough cost estimates per 1K tokens (as of 2024)
-    costs = {
-        "gpt-3.5-turbo": 0.002,  # $0.002 per 1K tokens
-        "gpt-4": 0.03,           # $0.03 per 1K tokens
-        "text-embedding-ada-002": 0.0001  # $0.0001 per 1K tokens
-    }
+    return (tokens_used / 1000) * _COST_PER_1K.get(model, 0.002)
+
+
+def get_ai_cost_estimate_array(tokens_used, model: str = "gpt-3.5-turbo"):
+    """Estimate the cost of many calls at once from a sequence/array of token counts"""
+    import numpy as np
     
-    cost_per_1k = costs.get(model, 0.002)
-    return (tokens_used / 1000) * cost_per_1k
+    return np.asarray(tokens_used, dtype=np.float64) * (_COST_PER_1K.get(model, 0.002) / 1000)
+
+
+@lru_cache(maxsize=None)
+def _parse_template(template: str) -> Optional[tuple]:
+    """
+    Split a template into (literal, field_name) pairs once, so building a
+    prompt is plain concatenation. Returns None for templates using anything
+    beyond plain {name} fields, which are left to str.format.
+    """
+    parts = []
+    for literal, field_name, format_spec, conversion in string.Formatter().parse(template):
+        if format_spec or conversion:
+            return None
+        if field_name is not None and not field_name.isidentifier():
+            return None
+        parts.append((literal, field_name))
+    return tuple(parts)
 
 
 def create_ai_prompt(template: str, **kwargs) -> str:
     """Create AI prompt from template with variables"""
-    return template.format(**kwargs)
+    parts = _parse_template(template)
+    if parts is None:
+        return template.format(**kwargs)
+    return ''.join(
+        literal + (str(kwargs[field_name]) if field_name is not None else '')
+        for literal, field_name in parts
+    )
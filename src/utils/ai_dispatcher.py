@@ -0,0 +1,157 @@
+"""
+Rate-limited OpenAI dispatcher for the AI-enhanced crawler
+Runs chat completion requests concurrently on one event loop while staying
+within AIConfig.requests_per_minute and max_concurrent_requests
+
+AIEnhancedCrawler sends its chat completions through call_openai_sync, so
+every crawler thread in the process shares one set of limits.
+"""
+
+import asyncio
+import atexit
+import threading
+import time
+from typing import List, Optional
+
+from .ai_config import AIConfig, load_ai_config
+
+# Async HTTP client (optional - only needed for the dispatcher)
+try:
+    import aiohttp
+    AIOHTTP_AVAILABLE = True
+except ImportError:
+    AIOHTTP_AVAILABLE = False
+
+OPENAI_CHAT_URL = 'https://api.openai.com/v1/chat/completions'
+
+
+class TokenBucket:
+    """Async token bucket refilled at a steady per-minute rate"""
+    
+    def __init__(self, rate_per_minute: int, capacity: int = 1):
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    async def acquire(self):
+        """Wait until a token is available and take it"""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+
+
+class AIDispatcher:
+    """
+    Sends chat completion requests with at most max_concurrent_requests in
+    flight and no more than requests_per_minute started per minute
+    
+    Use as an async context manager so the HTTP session is closed:
+        
+        async with AIDispatcher() as dispatcher:
+            answers = await dispatcher.complete_many(prompts)
+    """
+    
+    def __init__(self, config: AIConfig = None):
+        if not AIOHTTP_AVAILABLE:
+            raise ImportError("aiohttp is required for the AI dispatcher: pip install aiohttp")
+        
+        self.config = config or load_ai_config()
+        self._bucket = TokenBucket(self.config.requests_per_minute,
+                                   capacity=self.config.max_concurrent_requests)
+        self._semaphore = asyncio.Semaphore(self.config.max_concurrent_requests)
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def __aenter__(self):
+        self._session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.config.max_concurrent_requests),
+            headers={'Authorization': f'Bearer {self.config.openai_api_key}'}
+        )
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close()
+    
+    async def close(self):
+        """Close the underlying HTTP session"""
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+    
+    async def complete(self, prompt: str, model: str = None, max_tokens: int = None,
+                       temperature: float = None, api_key: str = None) -> str:
+        """
+        Send one chat completion request and return the reply text; api_key
+        overrides the configured key for this request only
+        """
+        if self._session is None:
+            raise RuntimeError("AIDispatcher must be used inside 'async with'")
+        
+        payload = {
+            'model': model or self.config.model,
+            'messages': [{'role': 'user', 'content': prompt}],
+            'max_tokens': max_tokens or self.config.max_tokens,
+            'temperature': self.config.temperature if temperature is None else temperature
+        }
+        
+        async with self._semaphore:
+            await self._bucket.acquire()
+            headers = {'Authorization': f'Bearer {api_key}'} if api_key else None
+            async with self._session.post(OPENAI_CHAT_URL, json=payload, headers=headers) as response:
+                response.raise_for_status()
+                data = await response.json()
+        
+        return data['choices'][0]['message']['content'].strip()
+    
+    async def complete_many(self, prompts: List[str], **kwargs) -> List[str]:
+        """Send several prompts concurrently; replies are returned in prompt order"""
+        return await asyncio.gather(*(self.complete(prompt, **kwargs) for prompt in prompts))
+
+
+# One dispatcher, on its own event loop thread, serves every call_openai and
+# call_openai_sync call, so they all share a single token bucket, semaphore
+# and HTTP session
+_shared_loop: Optional[asyncio.AbstractEventLoop] = None
+_shared_dispatcher: Optional[AIDispatcher] = None
+_shared_lock = threading.Lock()
+
+
+def _get_shared_dispatcher():
+    """Return the shared (loop, dispatcher), starting them on first use"""
+    global _shared_loop, _shared_dispatcher
+    with _shared_lock:
+        if _shared_dispatcher is None:
+            dispatcher = AIDispatcher()
+            loop = asyncio.new_event_loop()
+            threading.Thread(target=loop.run_forever, name='ai-dispatcher', daemon=True).start()
+            asyncio.run_coroutine_threadsafe(dispatcher.__aenter__(), loop).result()
+            atexit.register(_close_shared_dispatcher)
+            _shared_loop, _shared_dispatcher = loop, dispatcher
+        return _shared_loop, _shared_dispatcher
+
+
+def _close_shared_dispatcher():
+    """Close the shared dispatcher's HTTP session at interpreter exit"""
+    asyncio.run_coroutine_threadsafe(_shared_dispatcher.close(), _shared_loop).result(timeout=5)
+
+
+async def call_openai(prompt: str, **kwargs) -> str:
+    """Send a single prompt through the shared dispatcher"""
+    loop, dispatcher = _get_shared_dispatcher()
+    future = asyncio.run_coroutine_threadsafe(dispatcher.complete(prompt, **kwargs), loop)
+    return await asyncio.wrap_future(future)
+
+
+def call_openai_sync(prompt: str, **kwargs) -> str:
+    """Blocking call_openai for synchronous callers, under the same limits"""
+    loop, dispatcher = _get_shared_dispatcher()
+    return asyncio.run_coroutine_threadsafe(dispatcher.complete(prompt, **kwargs), loop).result()
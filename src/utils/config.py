@@ -3,13 +3,28 @@ Configuration file for the Alopecosa Fabrilis Web Crawler
 """
 
 import os
+import re
+from types import MappingProxyType
 
 # Database Configuration
 DATABASE_CONFIG = {
     'database_path': os.path.join('data', 'crawler_database.db'),
     'enable_fts': True,            # Enable full-text search
     'max_results': 1000,           # Maximum search results
-    'cleanup_interval': 86400      # Cleanup interval (seconds)
+    'cleanup_interval': 86400,     # Cleanup interval (seconds)
+    'pool_size': 5,                # Read-only connections kept open for searches
+    'bulk_reindex_threshold': 1000,  # Rows per write above which indexes are rebuilt in bulk
+    'insert_batch_size': 10000,    # Results inserted per step when storing a session
+    
+    # SQLite PRAGMAs applied to every connection (journal_mode once per database)
+    'pragmas': {
+        'journal_mode': 'WAL',         # Readers proceed while a crawl is writing
+        'synchronous': 'NORMAL',       # fsync at WAL checkpoints, not every commit
+        'temp_store': 'MEMORY',
+        'mmap_size': 268435456,        # Map up to 256 MiB of the file
+        'cache_size': -65536,          # 64 MiB page cache
+        'busy_timeout': 5000           # Retry instead of failing with SQLITE_BUSY
+    }
 }
 
 # Crawler Behavior Settings
@@ -30,6 +45,11 @@ CRAWLER_CONFIG = {
     'max_retries': 3,
     'concurrent_requests': 1,  # Keep at 1 for spider-like behavior
     
+    # Visited-URL tracking: set a capacity to use a Bloom filter instead of
+    # an exact set on very large crawls (a few bytes per URL, rare false skips)
+    'visited_bloom_capacity': None,
+    'visited_bloom_error_rate': 0.001,
+    
     # Content extraction settings
     'max_content_length': 1000,
     'extract_images': False,
@@ -40,20 +60,23 @@ CRAWLER_CONFIG = {
     'user_agent': 'Alopecosa-Fabrilis-Crawler/1.0 (Spider-inspired Web Crawler)',
     
     # File extensions to avoid
-    'excluded_extensions': {
+    'excluded_extensions': frozenset({
         '.pdf', '.jpg', '.jpeg', '.png', '.gif', '.bmp', '.svg',
         '.mp4', '.avi', '.mov', '.wmv', '.flv', '.webm',
         '.mp3', '.wav', '.flac', '.aac', '.ogg',
         '.zip', '.rar', '.7z', '.tar', '.gz',
         '.exe', '.msi', '.dmg', '.deb', '.rpm',
-        '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx'
-    },
+        '.doc', '.docx', '.xls', '.xlsx', '.ppt', '.pptx',
+        '.css', '.js'
+    }),
     
     # Content types to focus on
-    'preferred_content_types': {
+    'preferred_content_types': frozenset({
         'text/html',
-        'application/xhtml+xml'
-    }
+        'application/xhtml+xml',
+        'application/xml',
+        'text/xml'
+    })
 }
 
 # Logging Configuration
@@ -90,3 +113,20 @@ SPIDER_PATTERNS = {
     'success_threshold': 0.8,
     'failure_threshold': 0.3
 }
+
+# The settings above are shared read-only by every crawler and thread;
+# callers that need different values work on a .copy()
+DATABASE_CONFIG = MappingProxyType(DATABASE_CONFIG)
+CRAWLER_CONFIG = MappingProxyType(CRAWLER_CONFIG)
+LOGGING_CONFIG = MappingProxyType(LOGGING_CONFIG)
+OUTPUT_CONFIG = MappingProxyType(OUTPUT_CONFIG)
+SPIDER_PATTERNS = MappingProxyType(SPIDER_PATTERNS)
+
+# Derived once at import for per-URL checks: one regex search replaces a
+# loop of endswith calls and also catches extensions followed by ?query/#frag
+EXCLUDED_EXTENSIONS = CRAWLER_CONFIG['excluded_extensions']
+EXCLUDED_EXTENSION_PATTERN = re.compile(
+    r'\.(?:' + '|'.join(sorted(re.escape(ext.lstrip('.')) for ext in EXCLUDED_EXTENSIONS)) + r')(?:$|[?#])',
+    re.IGNORECASE
+)
+PREFERRED_CONTENT_TYPES = CRAWLER_CONFIG['preferred_content_types']
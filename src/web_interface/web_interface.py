@@ -4,30 +4,72 @@ Alopecosa Fabrilis Web Crawler - Web Interface
 A beautiful, modern web interface for controlling and monitoring the spider-inspired crawler
 """
 
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash
+from flask import Flask, Response, render_template, request, jsonify, stream_with_context
+from flask.json.provider import JSONProvider
 from flask_socketio import SocketIO, emit
+import orjson
+import asyncio
+import codecs
+import csv
+import functools
+import hashlib
+import itertools
 import threading
 import time
+import traceback
 import json
 import os
+import re
+from dataclasses import dataclass, field
+from operator import attrgetter
 from datetime import datetime
+from typing import Optional
+from collections import deque, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 import queue
 try:
     # Try relative imports first (when running as package)
     from ..crawler.alopecosa_crawler import AlopecosaCrawler
     from ..database.database_manager import db_manager
-    from ..batch_scraper.batch_url_scraper import BatchURLScraper
+    from ..batch_scraper.batch_url_scraper import BatchURLScraper, unique_urls
     from ..utils.config import CRAWLER_CONFIG
 except ImportError:
     # Fall back to absolute imports (when running from project root)
     from src.crawler.alopecosa_crawler import AlopecosaCrawler
     from src.database.database_manager import db_manager
-    from src.batch_scraper.batch_url_scraper import BatchURLScraper
+    from src.batch_scraper.batch_url_scraper import BatchURLScraper, unique_urls
     from src.utils.config import CRAWLER_CONFIG
+
+# Response compression (optional - JSON is served uncompressed without it)
+try:
+    from flask_compress import Compress
+    COMPRESS_AVAILABLE = True
+except ImportError:
+    COMPRESS_AVAILABLE = False
+
+import atexit
 import logging
+import logging.handlers
+
+# Configure logging; records are handed to a queue and written to the
+# configured handlers by a listener thread, so request handlers never block
+# on the console or the log file
+def _start_log_listener():
+    """Route root logging through a new queue and listener thread"""
+    global _log_listener
+    log_queue = queue.SimpleQueue()
+    _log_listener = logging.handlers.QueueListener(log_queue, *_log_handlers,
+                                                   respect_handler_level=True)
+    _root_logger.handlers = [logging.handlers.QueueHandler(log_queue)]
+    _log_listener.start()
 
-# Configure logging
 logging.basicConfig(level=logging.INFO)
+_root_logger = logging.getLogger()
+_log_handlers = list(_root_logger.handlers)
+_start_log_listener()
+# Forked server workers inherit the queue handler but not the thread
+os.register_at_fork(after_in_child=_start_log_listener)
+atexit.register(lambda: _log_listener.stop())
 logger = logging.getLogger(__name__)
 
 # Get the project root directory (where templates are located)
@@ -35,7 +77,247 @@ current_dir = os.path.dirname(os.path.abspath(__file__))
 project_root = os.path.dirname(os.path.dirname(current_dir))
 template_dir = os.path.join(project_root, 'templates')
 
+ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify and request.get_json"""
+    
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, option=ORJSON_OPTIONS).decode('utf-8')
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        """Build a jsonify response straight from orjson's bytes, skipping the str round trip"""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(orjson.dumps(obj, option=ORJSON_OPTIONS), mimetype='application/json')
+
+@dataclass(slots=True)
+class CrawlerStatusView:
+    """Fixed-shape body of GET /api/crawlers/<id>/status, encoded directly by orjson"""
+    name: str
+    base_url: str
+    status: str
+    progress: int
+    start_time: Optional[str]
+    end_time: Optional[str]
+    results_count: int
+    stats: dict
+    logs: list
+
+@dataclass(slots=True)
+class BatchJob:
+    """A batch scrape whose URLs are queued for the batch workers"""
+    batch_id: str
+    config: dict
+    total: int
+    remaining: int
+    results: dict = field(default_factory=dict)
+
+@dataclass(frozen=True, slots=True)
+class CreateCrawlerRequest:
+    """Validated body of POST /api/crawlers; invalid fields raise ValueError"""
+    base_url: str
+    name: str = 'Unnamed Crawler'
+    max_depth: int = 3
+    max_pages: int = 100
+    delay: float = 1.0
+    
+    def __post_init__(self):
+        if not self.name or not isinstance(self.name, str):
+            raise ValueError("Invalid crawler name")
+        if not self.base_url or not isinstance(self.base_url, str):
+            raise ValueError("Base URL is required")
+        if not 1 <= self.max_depth <= 10:
+            raise ValueError("Max depth must be between 1 and 10")
+        if not 1 <= self.max_pages <= 10000:
+            raise ValueError("Max pages must be between 1 and 10000")
+        if not 0.1 <= self.delay <= 60:
+            raise ValueError("Delay must be between 0.1 and 60 seconds")
+    
+    @classmethod
+    def from_json(cls, data):
+        """Build from a decoded JSON body, converting numeric fields"""
+        if not data or not isinstance(data, dict):
+            raise ValueError("No data provided")
+        
+        try:
+            max_depth = int(data.get('max_depth', 3))
+            max_pages = int(data.get('max_pages', 100))
+            delay = float(data.get('delay', 1.0))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid input: {e}") from e
+        
+        return cls(
+            base_url=data.get('base_url'),
+            name=data.get('name', 'Unnamed Crawler'),
+            max_depth=max_depth,
+            max_pages=max_pages,
+            delay=delay
+        )
+
+def json_body_too_large(limit=None):
+    """Whether the request declares a body over limit (MAX_JSON_BODY_BYTES by default)"""
+    return (request.content_length or 0) > (limit or MAX_JSON_BODY_BYTES)
+
+def iter_url_lines(stream):
+    """
+    URLs from a text upload, one per line, skipping blank lines and # comments
+    
+    Blocks of UPLOAD_READ_CHUNK bytes are cut at their last newline and
+    searched with one regex each, so lines are never looped over in Python.
+    """
+    tail = b''
+    while block := stream.read(UPLOAD_READ_CHUNK):
+        block = tail + block
+        cut = block.rfind(b'\n') + 1
+        block, tail = block[:cut], block[cut:]
+        yield from map(bytes.decode, URL_LINE_PATTERN.findall(block))
+    if tail:
+        yield from map(bytes.decode, URL_LINE_PATTERN.findall(tail))
+
+def iter_csv_urls(stream):
+    """URLs from the first column of a CSV upload, skipping blank cells"""
+    rows = csv.reader(codecs.iterdecode(stream, 'utf-8'))
+    return (row[0].strip() for row in rows if row and row[0].strip())
+
+def iter_json_urls(stream):
+    """
+    URLs from a JSON upload holding a list, or an object with a 'urls' list;
+    ValueError if it holds neither. JSON has to be parsed whole, so the raw
+    bytes go straight to orjson rather than through a decoded copy.
+    """
+    data = orjson.loads(stream.read())
+    if isinstance(data, dict) and 'urls' in data:
+        data = data['urls']
+    if not isinstance(data, list):
+        raise ValueError("expected a list of URLs")
+    return (str(url) for url in data if url)
+
+def read_json_body(limit=None):
+    """
+    Decode a small JSON request body with orjson, without keeping a copy
+    on the request; None if the body is empty, malformed or over limit
+    (MAX_JSON_BODY_BYTES by default)
+    """
+    limit = limit or MAX_JSON_BODY_BYTES
+    body = request.stream.read(limit + 1)
+    if not body or len(body) > limit:
+        return None
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
+
+# Cached response bodies keyed by request path and query string, and an
+# Event per key whose response is being built right now
+_response_cache = {}
+_response_inflight = {}
+_response_cache_lock = threading.Lock()
+
+def cached_response(ttl):
+    """
+    Reuse a view's successful JSON response bytes for ttl seconds
+    
+    Concurrent misses on the same key are coalesced: one request runs the
+    view while the rest wait for it and then serve what it cached. Responses
+    carry an ETag, so a client revalidating an unchanged body gets a 304.
+    """
+    def decorator(view):
+        @functools.wraps(view)
+        def wrapper(*args, **kwargs):
+            key = request.full_path
+            while True:
+                now = time.monotonic()
+                with _response_cache_lock:
+                    cached = _response_cache.get(key)
+                    if cached and cached[0] > now:
+                        return revalidated_json_response(cached[1], cached[2])
+                    
+                    pending = _response_inflight.get(key)
+                    if pending is None:
+                        pending = _response_inflight[key] = threading.Event()
+                        break
+                
+                # Another request is building this response; if it did not
+                # cache one (an error), the next waiter builds it instead
+                pending.wait()
+            
+            try:
+                response = app.make_response(view(*args, **kwargs))
+                if response.status_code != 200:
+                    return response
+                
+                body = response.get_data()
+                etag = json_etag(body)
+                with _response_cache_lock:
+                    # Arbitrary query strings must not grow the cache without bound
+                    if len(_response_cache) >= MAX_CACHED_RESPONSES:
+                        _response_cache.clear()
+                    _response_cache[key] = (now + ttl, body, etag)
+                return revalidated_json_response(body, etag)
+            finally:
+                with _response_cache_lock:
+                    del _response_inflight[key]
+                pending.set()
+        return wrapper
+    return decorator
+
+def clear_response_cache():
+    """Drop cached database responses after the database changes"""
+    with _response_cache_lock:
+        _response_cache.clear()
+
+def json_etag(body):
+    """ETag for a JSON response body"""
+    return hashlib.blake2b(body, digest_size=16).hexdigest()
+
+def conditional_json_response(body, etag):
+    """JSON response that becomes 304 Not Modified when If-None-Match matches etag"""
+    # Compressed responses go out tagged "<etag>:<encoding>", which is what
+    # clients send back
+    if COMPRESS_AVAILABLE and any(request.if_none_match.contains_weak(f'{etag}:{encoding}')
+                                  for encoding in app.config['COMPRESS_ALGORITHM']):
+        response = Response(status=304)
+        response.set_etag(etag)
+        return response
+    
+    response = Response(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response.make_conditional(request)
+
+def revalidated_json_response(body, etag):
+    """Conditional JSON response that clients must revalidate before reusing"""
+    response = conditional_json_response(body, etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+# JSON field name -> getter on a CrawlResult, in serialization order
+RESULT_FIELD_GETTERS = {
+    'url': attrgetter('url'),
+    'title': attrgetter('title'),
+    'content': attrgetter('content'),
+    'links': attrgetter('links'),
+    'status_code': attrgetter('status_code'),
+    'crawl_time': attrgetter('crawl_time'),
+    'timestamp': attrgetter('iso_timestamp'),
+    'metadata': attrgetter('metadata')
+}
+
+def iter_result_rows(results, fields=None):
+    """
+    Yield one JSON-ready dict per CrawlResult with the requested fields (all
+    by default). Rows are built as they are serialized, so a finished crawl
+    holds its results once rather than alongside a per-field copy
+    """
+    getters = [(name, getter) for name, getter in RESULT_FIELD_GETTERS.items()
+               if fields is None or name in fields]
+    for result in results:
+        yield {name: getter(result) for name, getter in getters}
+
 app = Flask(__name__, template_folder=template_dir)
+app.json = OrjsonProvider(app)
 app.config['SECRET_KEY'] = 'alopecosa-fabrilis-spider-2024'
 
 # Flask configuration to prevent response conflicts
@@ -44,6 +326,19 @@ app.config['PRESERVE_CONTEXT_ON_EXCEPTION'] = False
 app.config['TESTING'] = False
 app.config['DEBUG'] = False
 
+# Brotli or gzip for JSON and pages over 1 KiB; the NDJSON results stream is
+# left alone so rows still reach the browser as they are produced
+if COMPRESS_AVAILABLE:
+    app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+    app.config['COMPRESS_MIN_SIZE'] = 1024
+    app.config['COMPRESS_LEVEL'] = 4
+    app.config['COMPRESS_BR_LEVEL'] = 4
+    Compress(app)
+
+# Optional pub/sub queue (e.g. redis://localhost:6379/0) so emits fan out
+# across several server processes; unset keeps emits in-process
+SOCKETIO_MESSAGE_QUEUE = os.environ.get('SOCKETIO_MESSAGE_QUEUE') or None
+
 # SocketIO configuration for production
 try:
     # Try gevent async mode first (for production)
@@ -60,7 +355,8 @@ try:
         transports=['polling', 'websocket'],  # Try polling first
         always_connect=True,
         manage_session=False,
-        json=json
+        json=json,
+        message_queue=SOCKETIO_MESSAGE_QUEUE
     )
     logger.info("SocketIO initialized with gevent async mode")
 except Exception as e:
@@ -79,14 +375,69 @@ except Exception as e:
         transports=['polling', 'websocket'],  # Try polling first
         always_connect=True,
         manage_session=False,
-        json=json
+        json=json,
+        message_queue=SOCKETIO_MESSAGE_QUEUE
     )
     logger.info("SocketIO initialized with threading async mode")
 
-# Global variables for crawler management
-active_crawlers = {}
-crawler_queue = queue.Queue()
-crawler_results = {}
+# Per-crawler events are coalesced and sent to clients as one
+# 'crawler_status_batch' message per interval instead of one emit each
+EMIT_INTERVAL = 0.075
+MAX_EVENTS_PER_FLUSH = 128
+
+# Events where only a crawler's latest unsent payload matters
+COALESCED_EVENTS = ('crawler_status', 'crawler_progress')
+
+# Minimum seconds between progress updates from one running crawler
+PROGRESS_EMIT_INTERVAL = 0.1
+
+# Result list views return these fields, with content cut to a preview,
+# unless ?fields= and ?preview_chars= say otherwise
+DEFAULT_RESULT_FIELDS = 'url,title,status_code,crawl_time'
+DEFAULT_PREVIEW_CHARS = 500
+
+# Largest body accepted by the small JSON config endpoints
+MAX_JSON_BODY_BYTES = 64 * 1024
+
+# Most URLs accepted for one batch scrape, posted or uploaded, and the
+# largest JSON body accepted by the batch scrape endpoint
+MAX_BATCH_URLS = 100000
+MAX_BATCH_BODY_BYTES = 10 * 1024 * 1024
+UPLOAD_READ_CHUNK = 1024 * 1024
+
+# A non-blank, non-comment line of a .txt URL file, without its surrounding
+# whitespace
+URL_LINE_PATTERN = re.compile(rb'(?m)^[ \t]*([^#\s](?:[^\r\n]*[^\s])?)')
+
+# Upload parsers by file extension; each yields URLs from the upload stream
+# and raises ValueError on malformed content
+URL_FILE_PARSERS = {
+    '.txt': iter_url_lines,
+    '.csv': iter_csv_urls,
+    '.json': iter_json_urls
+}
+
+# Seconds a read-only database endpoint's response is reused
+DB_RESPONSE_CACHE_TTL = 30
+MAX_CACHED_RESPONSES = 256
+
+# Crawlers not running and untouched for CRAWLER_IDLE_TTL seconds are
+# dropped by a sweep every CRAWLER_SWEEP_INTERVAL seconds
+CRAWLER_IDLE_TTL = 3600
+CRAWLER_SWEEP_INTERVAL = 300
+FINISHED_STATUSES = ('completed', 'error')
+ACTIVE_STATUSES = ('queued', 'running')
+
+# Started crawlers wait in a bounded queue for one of a fixed number of
+# workers, so at most MAX_CONCURRENT_CRAWLS crawls share the database and
+# the outbound bandwidth
+MAX_CONCURRENT_CRAWLS = 3
+CRAWL_QUEUE_SIZE = 16
+
+# Batch scrape URLs wait in one queue on the batch event loop, drained by
+# BATCH_SCRAPE_CONCURRENCY workers shared by every batch
+BATCH_SCRAPE_CONCURRENCY = 50
+BATCH_QUEUE_SIZE = 10000
 
 # SocketIO event handlers
 @socketio.on('connect')
@@ -158,29 +509,83 @@ class WebCrawlerManager:
     """Manages crawler instances and provides web interface functionality"""
     
     def __init__(self):
-        self.crawlers = {}
+        # Oldest first; at most max_history finished crawlers are kept
+        self.crawlers = OrderedDict()
         self.crawl_history = []
         self.max_history = 50
+        self._last_access = {}
+        self._sweeper_started = False
+        
+        # Makes IDs unique even for same-named crawlers created together
+        self._id_counter = itertools.count()
+        
+        # Crawler IDs waiting for a crawl worker; workers start on first use
+        self._crawl_queue = queue.Queue(maxsize=CRAWL_QUEUE_SIZE)
+        self._crawl_workers_started = False
+        self._crawl_workers_lock = threading.Lock()
+        
+        # Created on first use and shared by all batch scrapes, whose URLs
+        # are scraped by worker tasks on one event loop in its own thread
+        self._batch_scraper = None
+        self._batch_loop = None
+        self._batch_queue = None
+        self._batch_workers = []
+        self._batch_scraper_lock = threading.Lock()
+        
+        # Pending socket events; a crawler's unsent status or progress event
+        # is updated in place rather than queued again
+        self._emit_queue = deque()
+        self._pending_updates = {}
+        self._emit_lock = threading.Lock()
+        self._emitter_started = False
+        
+        # Serialized GET /api/crawlers body and its ETag, rebuilt only after
+        # a crawler is created, deleted or changes state; likewise for
+        # /api/history, which changes only when a crawler finishes
+        self._serialized_cache = None
+        self._cache_dirty = True
+        self._history_cache = None
+        self._cache_lock = threading.Lock()
     
-    def create_crawler(self, name, base_url, max_depth=3, max_pages=100, delay_range=(1, 3)):
-        """Create a new crawler instance"""
-        try:
-            # Validate inputs
-            if not name or not isinstance(name, str):
-                return None, "Invalid crawler name"
-            
-            if not base_url or not isinstance(base_url, str):
-                return None, "Invalid base URL"
-            
-            if not isinstance(max_depth, int) or max_depth < 1 or max_depth > 10:
-                return None, "Max depth must be between 1 and 10"
-            
-            if not isinstance(max_pages, int) or max_pages < 1 or max_pages > 10000:
-                return None, "Max pages must be between 1 and 10000"
+    def _queue_emit(self, crawler_id, event, payload):
+        """Queue a crawler event for the next batched emit"""
+        with self._emit_lock:
+            key = (crawler_id, event)
+            if key in self._pending_updates:
+                self._pending_updates[key]['data'] = payload
+            else:
+                entry = {'event': event, 'data': payload}
+                self._emit_queue.append(entry)
+                if event in COALESCED_EVENTS:
+                    self._pending_updates[key] = entry
+                else:
+                    # Later updates must follow this event, not merge before it
+                    for coalesced in COALESCED_EVENTS:
+                        self._pending_updates.pop((crawler_id, coalesced), None)
             
-            if not isinstance(delay_range, (tuple, list)) or len(delay_range) != 2:
-                return None, "Delay range must be a tuple of two numbers"
+            if not self._emitter_started:
+                self._emitter_started = True
+                socketio.start_background_task(self._emitter_loop)
+    
+    def _emitter_loop(self):
+        """Send queued crawler events in batches every EMIT_INTERVAL seconds"""
+        while True:
+            socketio.sleep(EMIT_INTERVAL)
             
+            while self._emit_queue:
+                with self._emit_lock:
+                    count = min(len(self._emit_queue), MAX_EVENTS_PER_FLUSH)
+                    batch = [self._emit_queue.popleft() for _ in range(count)]
+                    self._pending_updates.clear()
+                
+                try:
+                    socketio.emit('crawler_status_batch', batch)
+                except Exception as e:
+                    logger.error(f"Error emitting crawler_status_batch: {e}")
+    
+    def create_crawler(self, name, base_url, max_depth=3, max_pages=100, delay_range=(1, 3)):
+        """Create a new crawler instance (arguments are validated by CreateCrawlerRequest)"""
+        try:
             crawler = AlopecosaCrawler(
                 base_url=base_url,
                 max_depth=max_depth,
@@ -189,19 +594,33 @@ class WebCrawlerManager:
                 allow_external_links=True  # Allow external links for better crawling
             )
             
-            crawler_id = f"crawler_{int(time.time())}_{name}"
+            crawler_id = f"crawler_{time.monotonic_ns()}_{next(self._id_counter)}_{name}"
             self.crawlers[crawler_id] = {
                 'instance': crawler,
                 'name': name,
                 'base_url': base_url,
+                'config': {
+                    'max_depth': max_depth,
+                    'max_pages': max_pages,
+                    'delay_range': delay_range
+                },
                 'status': 'ready',
                 'progress': 0,
                 'start_time': None,
                 'end_time': None,
+                'start_time_iso': None,
+                'end_time_iso': None,
                 'results': [],
                 'stats': {},
                 'logs': []
             }
+            self._cache_dirty = True
+            self._last_access[crawler_id] = time.monotonic()
+            self._queue_emit(crawler_id, 'crawlers_changed', {'crawler_id': crawler_id})
+            
+            if not self._sweeper_started:
+                self._sweeper_started = True
+                socketio.start_background_task(self._sweep_loop)
             
             return crawler_id, "Crawler created successfully"
         except Exception as e:
@@ -209,7 +628,7 @@ class WebCrawlerManager:
             return None, f"Error creating crawler: {str(e)}"
     
     def start_crawler(self, crawler_id):
-        """Start a crawler in a separate thread"""
+        """Queue a crawler to run in the background"""
         try:
             if not crawler_id or not isinstance(crawler_id, str):
                 return False, "Invalid crawler ID"
@@ -218,22 +637,54 @@ class WebCrawlerManager:
                 return False, "Crawler not found"
             
             crawler_info = self.crawlers[crawler_id]
-            if crawler_info['status'] in ['running', 'completed']:
-                return False, "Crawler already running or completed"
+            if crawler_info['status'] in ('queued', 'running', 'completed'):
+                return False, "Crawler already queued, running or completed"
             
-            # Start crawler in background thread
-            thread = threading.Thread(
-                target=self._run_crawler,
-                args=(crawler_id,),
-                daemon=True
-            )
-            thread.start()
+            try:
+                self._crawl_queue.put_nowait(crawler_id)
+            except queue.Full:
+                return False, "Too many crawlers waiting to start; try again later"
+            
+            crawler_info['status'] = 'queued'
+            self._cache_dirty = True
+            self._queue_emit(crawler_id, 'crawler_status', {
+                'crawler_id': crawler_id,
+                'status': 'queued',
+                'progress': 0
+            })
+            self._start_crawl_workers()
             
             return True, "Crawler started successfully"
         except Exception as e:
             logger.error(f"Error starting crawler {crawler_id}: {e}")
             return False, f"Error starting crawler: {str(e)}"
     
+    def _start_crawl_workers(self):
+        """Start the crawl workers if they are not running yet"""
+        with self._crawl_workers_lock:
+            if self._crawl_workers_started:
+                return
+            self._crawl_workers_started = True
+        
+        # Workers run as background tasks of the Socket.IO async mode, so
+        # under gevent their emits interleave with the server's greenlets
+        for _ in range(MAX_CONCURRENT_CRAWLS):
+            socketio.start_background_task(self._crawl_worker)
+    
+    def _crawl_worker(self):
+        """Run queued crawlers one after another"""
+        while True:
+            crawler_id = self._crawl_queue.get()
+            
+            # The crawler may have been deleted while it waited
+            if crawler_id not in self.crawlers:
+                continue
+            
+            try:
+                self._run_crawler(crawler_id)
+            except Exception as e:
+                logger.error(f"Crawl worker failed on {crawler_id}: {e}")
+    
     def _run_crawler(self, crawler_id):
         """Run the crawler and update status"""
         crawler_info = self.crawlers[crawler_id]
@@ -243,17 +694,39 @@ class WebCrawlerManager:
             # Update status
             crawler_info['status'] = 'running'
             crawler_info['start_time'] = datetime.now()
+            crawler_info['start_time_iso'] = crawler_info['start_time'].isoformat()
             crawler_info['progress'] = 0
+            self._cache_dirty = True
             
             # Emit status update
-            try:
-                socketio.emit('crawler_status', {
-                    'crawler_id': crawler_id,
-                    'status': 'running',
-                    'progress': 0
+            self._queue_emit(crawler_id, 'crawler_status', {
+                'crawler_id': crawler_id,
+                'status': 'running',
+                'progress': 0
+            })
+            # Yield to the server's other greenlets before the crawl takes over
+            socketio.sleep(0)
+            
+            # Report progress as pages complete, at most once per PROGRESS_EMIT_INTERVAL
+            last_progress = 0.0
+            
+            def report_progress(pages_done, total):
+                nonlocal last_progress
+                now = time.monotonic()
+                if now - last_progress < PROGRESS_EMIT_INTERVAL and pages_done < total:
+                    return
+                last_progress = now
+                
+                crawler_info['progress'] = min(99, pages_done * 100 // total)
+                self._cache_dirty = True
+                self._queue_emit(crawler_id, 'crawler_progress', {
+                    'id': crawler_id,
+                    'done': pages_done,
+                    'total': total
                 })
-            except Exception as e:
-                logger.error(f"Error emitting crawler_status: {e}")
+                socketio.sleep(0)
+            
+            crawler.on_page_done = report_progress
             
             # Start crawling
             logger.info(f"Starting crawler for {crawler.base_url} with max_depth={crawler.max_depth}, max_pages={crawler.max_pages}")
@@ -266,31 +739,31 @@ class WebCrawlerManager:
             crawler_info['stats'] = crawler.get_crawl_statistics()
             crawler_info['status'] = 'completed'
             crawler_info['end_time'] = datetime.now()
+            crawler_info['end_time_iso'] = crawler_info['end_time'].isoformat()
             crawler_info['progress'] = 100
+            self._cache_dirty = True
             
             # Store results in database
             try:
                 logger.info(f"Attempting to store {len(results)} results in database for crawler {crawler_id}")
-                logger.info(f"Results type: {type(results)}")
-                if results:
-                    logger.info(f"First result type: {type(results[0])}")
-                    logger.info(f"First result attributes: {dir(results[0])}")
+                if results and logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("First result type: %s, attributes: %s", type(results[0]), dir(results[0]))
                 
                 session_id = db_manager.store_crawl_results(
                     session_name=crawler_info['name'],
                     base_url=crawler_info['base_url'],
-                    max_depth=crawler.max_depth,
-                    max_pages=crawler.max_pages,
+                    max_depth=crawler_info['config']['max_depth'],
+                    max_pages=crawler_info['config']['max_pages'],
                     results=results,
                     start_time=crawler_info['start_time'],
                     end_time=crawler_info['end_time'],
                     status='completed'
                 )
                 crawler_info['session_id'] = session_id
+                clear_response_cache()
                 logger.info(f"Successfully stored crawl results in database with session ID: {session_id}")
             except Exception as e:
                 logger.error(f"Error storing results in database: {e}")
-                import traceback
                 logger.error(f"Database storage traceback: {traceback.format_exc()}")
                 crawler_info['session_id'] = None
             
@@ -298,27 +771,24 @@ class WebCrawlerManager:
             self._add_to_history(crawler_id)
             
             # Emit completion
-            try:
-                socketio.emit('crawler_completed', {
-                    'crawler_id': crawler_id,
-                    'results_count': len(results),
-                    'stats': crawler_info['stats']
-                })
-            except Exception as e:
-                logger.error(f"Error emitting crawler_completed: {e}")
+            self._queue_emit(crawler_id, 'crawler_completed', {
+                'crawler_id': crawler_id,
+                'results_count': len(results),
+                'stats': crawler_info['stats']
+            })
             
         except Exception as e:
             crawler_info['status'] = 'error'
             crawler_info['end_time'] = datetime.now()
+            crawler_info['end_time_iso'] = crawler_info['end_time'].isoformat()
             crawler_info['logs'].append(f"Error: {str(e)}")
+            self._cache_dirty = True
+            self._evict_finished_crawlers()
             
-            try:
-                socketio.emit('crawler_error', {
-                    'crawler_id': crawler_id,
-                    'error': str(e)
-                })
-            except Exception as emit_error:
-                logger.error(f"Error emitting crawler_error: {emit_error}")
+            self._queue_emit(crawler_id, 'crawler_error', {
+                'crawler_id': crawler_id,
+                'error': str(e)
+            })
     
     def _add_to_history(self, crawler_id):
         """Add completed crawler to history"""
@@ -328,18 +798,48 @@ class WebCrawlerManager:
             'id': crawler_id,
             'name': crawler_info['name'],
             'base_url': crawler_info['base_url'],
-            'start_time': crawler_info['start_time'],
-            'end_time': crawler_info['end_time'],
+            'start_time': crawler_info['start_time_iso'],
+            'end_time': crawler_info['end_time_iso'],
             'status': crawler_info['status'],
             'results_count': len(crawler_info['results']),
             'stats': crawler_info['stats']
         }
         
-        self.crawl_history.insert(0, history_entry)
+        with self._cache_lock:
+            self.crawl_history.insert(0, history_entry)
+            
+            # Keep only recent history
+            if len(self.crawl_history) > self.max_history:
+                self.crawl_history = self.crawl_history[:self.max_history]
+            self._history_cache = None
         
-        # Keep only recent history
-        if len(self.crawl_history) > self.max_history:
-            self.crawl_history = self.crawl_history[:self.max_history]
+        self.crawlers.move_to_end(crawler_id)
+        self._last_access[crawler_id] = time.monotonic()
+        self._evict_finished_crawlers()
+    
+    def _forget_crawler(self, crawler_id):
+        """Drop a crawler and its bookkeeping"""
+        self.crawlers.pop(crawler_id, None)
+        self._last_access.pop(crawler_id, None)
+        self._cache_dirty = True
+        self._queue_emit(crawler_id, 'crawlers_changed', {'crawler_id': crawler_id})
+    
+    def _evict_finished_crawlers(self):
+        """Drop the oldest finished crawlers beyond max_history"""
+        finished = [crawler_id for crawler_id, crawler_info in list(self.crawlers.items())
+                    if crawler_info['status'] in FINISHED_STATUSES]
+        for crawler_id in finished[:max(0, len(finished) - self.max_history)]:
+            self._forget_crawler(crawler_id)
+    
+    def _sweep_loop(self):
+        """Periodically drop crawlers that are not running and have sat idle"""
+        while True:
+            socketio.sleep(CRAWLER_SWEEP_INTERVAL)
+            
+            cutoff = time.monotonic() - CRAWLER_IDLE_TTL
+            for crawler_id, crawler_info in list(self.crawlers.items()):
+                if crawler_info['status'] not in ACTIVE_STATUSES and self._last_access.get(crawler_id, 0) < cutoff:
+                    self._forget_crawler(crawler_id)
     
     def get_crawler_status(self, crawler_id):
         """Get current status of a crawler"""
@@ -349,6 +849,7 @@ class WebCrawlerManager:
             
             if crawler_id not in self.crawlers:
                 return None
+            self._last_access[crawler_id] = time.monotonic()
             return self.crawlers[crawler_id]
         except Exception as e:
             logger.error(f"Error getting crawler status {crawler_id}: {e}")
@@ -358,10 +859,48 @@ class WebCrawlerManager:
         """Get all crawler instances"""
         return self.crawlers
     
+    def get_serialized_crawlers(self):
+        """Get all crawlers as (JSON bytes, ETag), cached until a crawler changes"""
+        with self._cache_lock:
+            if self._cache_dirty or self._serialized_cache is None:
+                # Cleared before building so a change made meanwhile forces another rebuild
+                self._cache_dirty = False
+                serializable_crawlers = {}
+                for crawler_id, crawler_info in list(self.crawlers.items()):
+                    serializable_crawlers[crawler_id] = {
+                        'name': crawler_info['name'],
+                        'base_url': crawler_info['base_url'],
+                        'status': crawler_info['status'],
+                        'progress': crawler_info['progress'],
+                        'start_time': crawler_info['start_time_iso'],
+                        'end_time': crawler_info['end_time_iso'],
+                        'results_count': len(crawler_info['results']),
+                        'stats': crawler_info['stats'],
+                        'logs': crawler_info['logs'],
+                        'config': crawler_info['config']
+                    }
+                body = orjson.dumps(serializable_crawlers)
+                self._serialized_cache = (body, json_etag(body))
+            
+            return self._serialized_cache
+    
+    def get_crawler_snapshot(self):
+        """Get all crawlers in the GET /api/crawlers shape, for socket subscribers"""
+        return orjson.loads(self.get_serialized_crawlers()[0])
+    
     def get_crawl_history(self):
         """Get crawl history"""
         return self.crawl_history
     
+    def get_serialized_history(self):
+        """Get crawl history as (JSON bytes, ETag), cached until a crawler finishes"""
+        with self._cache_lock:
+            if self._history_cache is None:
+                body = orjson.dumps(self.crawl_history)
+                self._history_cache = (body, json_etag(body))
+            
+            return self._history_cache
+    
     def delete_crawler(self, crawler_id):
         """Delete a crawler instance"""
         try:
@@ -369,7 +908,7 @@ class WebCrawlerManager:
                 return False
             
             if crawler_id in self.crawlers:
-                del self.crawlers[crawler_id]
+                self._forget_crawler(crawler_id)
                 return True
             return False
         except Exception as e:
@@ -412,71 +951,58 @@ class WebCrawlerManager:
                     session_id = db_manager.store_crawl_results(
                         session_name=crawler_info['name'],
                         base_url=crawler_info['base_url'],
-                        max_depth=crawler_info['instance'].max_depth,
-                        max_pages=crawler_info['instance'].max_pages,
+                        max_depth=crawler_info['config']['max_depth'],
+                        max_pages=crawler_info['config']['max_pages'],
                         results=crawler_info['results'],
                         start_time=crawler_info['start_time'],
                         end_time=crawler_info['end_time'],
                         status='completed'
                     )
                     crawler_info['session_id'] = session_id
+                    clear_response_cache()
                     logger.info(f"Fallback database storage successful with session ID: {session_id}")
                     return True, f"Results saved to database (Session ID: {session_id})"
                 except Exception as fallback_error:
                     logger.error(f"Fallback database storage failed: {fallback_error}")
-                    # As a last resort, save to JSON file
-                    return self._save_to_json_fallback(crawler_id, crawler_info)
+                    # As a last resort, save to JSON file without holding up the request
+                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+                    filename = f"fallback_crawl_{crawler_info['name']}_{timestamp}.json"
+                    socketio.start_background_task(self._save_to_json_fallback, crawler_id, crawler_info, filename)
+                    return True, f"Saving results to JSON file as fallback: {filename}"
             
         except Exception as e:
             logger.error(f"Error checking database for crawler {crawler_id}: {e}")
             return False, f"Error checking database: {str(e)}"
     
-    def _save_to_json_fallback(self, crawler_id, crawler_info):
+    def _save_to_json_fallback(self, crawler_id, crawler_info, filename):
         """Fallback method to save results to JSON file if database fails"""
         try:
-            import os
-            import json
-            
             # Create results directory
             results_dir = "crawl_results"
-            if not os.path.exists(results_dir):
-                os.makedirs(results_dir)
-            
-            # Generate filename
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"fallback_crawl_{crawler_info['name']}_{timestamp}.json"
+            os.makedirs(results_dir, exist_ok=True)
             filepath = os.path.join(results_dir, filename)
             
-            # Convert results to serializable format
-            serializable_results = []
-            for result in crawler_info['results']:
-                serializable_results.append({
-                    'url': result.url,
-                    'title': result.title,
-                    'content': result.content,
-                    'links': result.links,
-                    'status_code': result.status_code,
-                    'crawl_time': result.crawl_time,
-                    'timestamp': result.timestamp.isoformat(),
-                    'metadata': result.metadata
-                })
+            crawl_info = {
+                'name': crawler_info['name'],
+                'base_url': crawler_info['base_url'],
+                'max_depth': crawler_info['config']['max_depth'],
+                'max_pages': crawler_info['config']['max_pages'],
+                'pages_crawled': len(crawler_info['results']),
+                'crawl_timestamp': crawler_info['end_time_iso'] or datetime.now().isoformat(),
+                'status': crawler_info['status'],
+                'note': 'Saved as fallback due to database storage failure'
+            }
             
-            # Save to file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump({
-                    'crawl_info': {
-                        'name': crawler_info['name'],
-                        'base_url': crawler_info['base_url'],
-                        'max_depth': crawler_info['instance'].max_depth,
-                        'max_pages': crawler_info['instance'].max_pages,
-                        'pages_crawled': len(crawler_info['results']),
-                        'crawl_timestamp': crawler_info['end_time'].isoformat() if crawler_info['end_time'] else datetime.now().isoformat(),
-                        'status': crawler_info['status'],
-                        'note': 'Saved as fallback due to database storage failure'
-                    },
-                    'statistics': crawler_info['stats'],
-                    'results': serializable_results
-                }, f, indent=2, ensure_ascii=False)
+            # Save to file, encoding one result at a time
+            with open(filepath, 'wb') as f:
+                f.write(b'{"crawl_info":' + orjson.dumps(crawl_info))
+                f.write(b',"statistics":' + orjson.dumps(crawler_info['stats']))
+                f.write(b',"results":[')
+                for i, row in enumerate(iter_result_rows(crawler_info['results'])):
+                    if i:
+                        f.write(b',')
+                    f.write(orjson.dumps(row))
+                f.write(b']}')
             
             logger.info(f"Fallback JSON save successful: {filepath}")
             return True, f"Results saved to JSON file as fallback: {filename}"
@@ -494,47 +1020,100 @@ class WebCrawlerManager:
             if len(urls) == 0:
                 return None, "URLs list is empty"
             
-            # Create batch scraper
-            batch_scraper = BatchURLScraper(
-                max_workers=3,
-                delay_between_crawls=2.0
-            )
-            
-            # Start batch scrape in background thread
-            thread = threading.Thread(
-                target=self._run_batch_scrape,
-                args=(batch_scraper, urls, config),
-                daemon=True
+            urls = unique_urls(urls)
+            batch_id = f"batch_{time.monotonic_ns()}_{next(self._id_counter)}"
+            batch = BatchJob(
+                batch_id=batch_id,
+                config=CRAWLER_CONFIG.copy() if config is None else config,
+                total=len(urls),
+                remaining=len(urls)
             )
-            thread.start()
             
-            batch_id = f"batch_{int(time.time())}"
+            # Hand the URLs to the batch workers; queuing happens on the
+            # batch loop, so a long list never holds up this request
+            logger.info(f"Queuing batch scrape {batch_id} of {len(urls)} URLs")
+            asyncio.run_coroutine_threadsafe(self._enqueue_batch(batch, urls), self._get_batch_loop())
             return batch_id, "Batch scrape started successfully"
             
         except Exception as e:
             logger.error(f"Error starting batch scrape: {e}")
             return None, f"Error starting batch scrape: {str(e)}"
     
-    def _run_batch_scrape(self, batch_scraper, urls, config):
-        """Run the batch scrape operation"""
-        try:
-            logger.info(f"Starting batch scrape of {len(urls)} URLs")
+    def _get_batch_scraper(self):
+        """Get the batch scraper shared by all batch scrapes"""
+        with self._batch_scraper_lock:
+            if self._batch_scraper is None:
+                self._batch_scraper = BatchURLScraper(
+                    max_workers=3,
+                    delay_between_crawls=2.0
+                )
+            return self._batch_scraper
+    
+    def _get_batch_loop(self):
+        """Get the event loop batch scrapes run on, starting it and its workers on first use"""
+        batch_scraper = self._get_batch_scraper()
+        with self._batch_scraper_lock:
+            if self._batch_loop is None:
+                loop = asyncio.new_event_loop()
+                loop.set_default_executor(ThreadPoolExecutor(
+                    max_workers=BATCH_SCRAPE_CONCURRENCY,
+                    thread_name_prefix='batch-url'
+                ))
+                threading.Thread(target=loop.run_forever, name='batch-loop', daemon=True).start()
+                asyncio.run_coroutine_threadsafe(self._start_batch_workers(batch_scraper), loop).result()
+                self._batch_loop = loop
+            return self._batch_loop
+    
+    async def _start_batch_workers(self, batch_scraper):
+        """Create the URL queue and its workers on the batch loop"""
+        self._batch_queue = asyncio.Queue(maxsize=BATCH_QUEUE_SIZE)
+        self._batch_workers = [asyncio.create_task(self._batch_worker(batch_scraper))
+                               for _ in range(BATCH_SCRAPE_CONCURRENCY)]
+    
+    async def _enqueue_batch(self, batch, urls):
+        """Queue a batch's URLs, waiting for room when the queue is full"""
+        for url in urls:
+            await self._batch_queue.put((batch, url))
+    
+    async def _batch_worker(self, batch_scraper):
+        """Scrape queued URLs one at a time, for as long as the server runs"""
+        while True:
+            batch, url = await self._batch_queue.get()
+            try:
+                result = await asyncio.to_thread(batch_scraper.scrape_single_url, url, batch.config)
+            except Exception as e:
+                result = e
             
-            # Run batch scrape
-            results = batch_scraper.scrape_urls(urls, config)
+            # The scraper lives as long as the server, so outcomes are kept
+            # only on the batch; workers share one loop thread, so the count
+            # needs no lock
+            batch_scraper.record_outcome(url, result, batch.results, keep_pages=False,
+                                         remember=False)
+            batch.remaining -= 1
+            if batch.remaining == 0:
+                self._finish_batch(batch_scraper, batch)
+            self._batch_queue.task_done()
+    
+    def _finish_batch(self, batch_scraper, batch):
+        """Announce a batch whose URLs have all been scraped"""
+        try:
+            summary = batch_scraper.summarize_batch(batch.results)
             
             # Store results in database (already handled by batch scraper)
-            logger.info(f"Batch scrape completed: {results['summary']['successful']} successful, {results['summary']['failed']} failed")
+            clear_response_cache()
+            logger.info(f"Batch scrape {batch.batch_id} completed: {summary['successful']} successful, {summary['failed']} failed")
             
             # Emit completion event
             socketio.emit('batch_scrape_completed', {
-                'summary': results['summary'],
-                'total_urls': len(urls)
+                'batch_id': batch.batch_id,
+                'summary': summary,
+                'total_urls': batch.total
             })
             
         except Exception as e:
-            logger.error(f"Batch scrape failed: {e}")
+            logger.error(f"Batch scrape {batch.batch_id} failed: {e}")
             socketio.emit('batch_scrape_error', {
+                'batch_id': batch.batch_id,
                 'error': str(e)
             })
     
@@ -542,7 +1121,7 @@ class WebCrawlerManager:
         """Get list of saved crawl sessions from database"""
         try:
             # Get crawl sessions from database instead of JSON files
-            sessions = db_manager.get_crawl_sessions(limit=100)
+            sessions = db_manager.iter_crawl_sessions(limit=100)
             
             files = []
             for session in sessions:
@@ -550,6 +1129,7 @@ class WebCrawlerManager:
                     'filename': f"Session: {session['session_name']}",
                     'size': session['pages_crawled'],
                     'modified': session['created_at'],
+                    'created_at': session['created_at'],
                     'session_id': session['id'],
                     'base_url': session['base_url'],
                     'status': session['status'],
@@ -557,8 +1137,7 @@ class WebCrawlerManager:
                     'max_pages': session['max_pages']
                 })
             
-            # Sort by creation time (newest first)
-            files.sort(key=lambda x: x['created_at'], reverse=True)
+            # Sessions already come newest first from the database
             return files
         except Exception as e:
             logger.error(f"Error getting saved sessions from database: {e}")
@@ -567,10 +1146,22 @@ class WebCrawlerManager:
 # Initialize crawler manager
 crawler_manager = WebCrawlerManager()
 
+# The page templates take no context, so each is rendered once and served
+# as bytes (re-rendered per request in debug mode, to pick up edits)
+_rendered_pages = {}
+
+def render_static_page(template_name):
+    """Response for a context-free page template, rendered on first use"""
+    page = _rendered_pages.get(template_name)
+    if page is None or app.debug:
+        page = render_template(template_name).encode('utf-8')
+        _rendered_pages[template_name] = page
+    return Response(page, mimetype='text/html')
+
 @app.route('/')
 def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    return render_static_page('index.html')
 
 @app.route('/api/health')
 def health_check():
@@ -584,78 +1175,41 @@ def health_check():
 @app.route('/database')
 def database():
     """Database search interface page"""
-    return render_template('database.html')
+    return render_static_page('database.html')
 
 @app.route('/search')
 def search():
     """Search interface page"""
-    return render_template('search.html')
+    return render_static_page('search.html')
 
 @app.route('/batch')
 def batch():
     """Batch processing interface page"""
-    return render_template('batch.html')
+    return render_static_page('batch.html')
 
 @app.route('/api/crawlers', methods=['GET'])
 def get_crawlers():
     """API endpoint to get all crawlers"""
-    crawlers = crawler_manager.get_all_crawlers()
-    
-    # Convert crawler objects to serializable format
-    serializable_crawlers = {}
-    for crawler_id, crawler_info in crawlers.items():
-        serializable_crawlers[crawler_id] = {
-            'name': crawler_info['name'],
-            'base_url': crawler_info['base_url'],
-            'status': crawler_info['status'],
-            'progress': crawler_info['progress'],
-            'start_time': crawler_info['start_time'].isoformat() if crawler_info['start_time'] else None,
-            'end_time': crawler_info['end_time'].isoformat() if crawler_info['end_time'] else None,
-            'results_count': len(crawler_info['results']),
-            'stats': crawler_info['stats'],
-            'logs': crawler_info['logs'],
-            'config': {
-                'max_depth': crawler_info['instance'].max_depth,
-                'max_pages': crawler_info['instance'].max_pages,
-                'delay_range': crawler_info['instance'].delay_range
-            }
-        }
-    
-    return jsonify(serializable_crawlers)
+    return conditional_json_response(*crawler_manager.get_serialized_crawlers())
 
 @app.route('/api/crawlers', methods=['POST'])
 def create_crawler():
     """API endpoint to create a new crawler"""
     try:
-        data = request.get_json()
-        if not data:
-            return jsonify({'success': False, 'error': 'No data provided'}), 400
+        if json_body_too_large():
+            return jsonify({'success': False, 'error': 'Request body too large'}), 413
         
-        name = data.get('name', 'Unnamed Crawler')
-        base_url = data.get('base_url')
-        max_depth = int(data.get('max_depth', 3))
-        max_pages = int(data.get('max_pages', 100))
-        delay = float(data.get('delay', 1.0))
-        
-        if not base_url:
-            return jsonify({'success': False, 'error': 'Base URL is required'}), 400
-        
-        # Validate inputs
-        if max_depth < 1 or max_depth > 10:
-            return jsonify({'success': False, 'error': 'Max depth must be between 1 and 10'}), 400
-        
-        if max_pages < 1 or max_pages > 10000:
-            return jsonify({'success': False, 'error': 'Max pages must be between 1 and 10000'}), 400
-        
-        if delay < 0.1 or delay > 60:
-            return jsonify({'success': False, 'error': 'Delay must be between 0.1 and 60 seconds'}), 400
+        try:
+            spec = CreateCrawlerRequest.from_json(read_json_body())
+        except ValueError as e:
+            return jsonify({'success': False, 'error': str(e)}), 400
         
         crawler_id, message = crawler_manager.create_crawler(
-            name=name,
-            base_url=base_url,
-            max_depth=max_depth,
-            max_pages=max_pages,
-            delay_range=(delay, delay * 2)
+            name=spec.name,
+            base_url=spec.base_url,
+            max_depth=spec.max_depth,
+            max_pages=spec.max_pages,
+            delay_range=(spec.delay, spec.delay * 2)
         )
         
         if crawler_id:
@@ -667,8 +1221,6 @@ def create_crawler():
         else:
             return jsonify({'success': False, 'error': message}), 400
             
-    except (ValueError, TypeError) as e:
-        return jsonify({'success': False, 'error': f'Invalid input: {str(e)}'}), 400
     except Exception as e:
         logger.error(f"Error creating crawler: {e}")
         return jsonify({'success': False, 'error': 'Internal server error'}), 500
@@ -695,19 +1247,18 @@ def get_crawler_status(crawler_id):
         status = crawler_manager.get_crawler_status(crawler_id)
         
         if status:
-            # Convert to serializable format
-            serializable_status = {
-                'name': status['name'],
-                'base_url': status['base_url'],
-                'status': status['status'],
-                'progress': status['progress'],
-                'start_time': status['start_time'].isoformat() if status['start_time'] else None,
-                'end_time': status['end_time'].isoformat() if status['end_time'] else None,
-                'results_count': len(status['results']),
-                'stats': status['stats'],
-                'logs': status['logs']
-            }
-            return jsonify(serializable_status)
+            view = CrawlerStatusView(
+                name=status['name'],
+                base_url=status['base_url'],
+                status=status['status'],
+                progress=status['progress'],
+                start_time=status['start_time_iso'],
+                end_time=status['end_time_iso'],
+                results_count=len(status['results']),
+                stats=status['stats'],
+                logs=status['logs']
+            )
+            return Response(orjson.dumps(view), mimetype='application/json')
         else:
             return jsonify({'error': 'Crawler not found'}), 404
             
@@ -717,7 +1268,13 @@ def get_crawler_status(crawler_id):
 
 @app.route('/api/crawlers/<crawler_id>/results', methods=['GET'])
 def get_crawler_results(crawler_id):
-    """API endpoint to get crawler results"""
+    """
+    API endpoint to get crawler results
+    
+    ?fields= picks the result fields (comma-separated) and ?preview_chars=
+    caps content length (0 for full content); use /results/<index> for a
+    single full page.
+    """
     try:
         status = crawler_manager.get_crawler_status(crawler_id)
         
@@ -727,29 +1284,50 @@ def get_crawler_results(crawler_id):
         if status['status'] != 'completed':
             return jsonify({'error': 'Crawler not completed'}), 400
         
-        # Convert results to serializable format
-        serializable_results = []
-        for result in status['results']:
-            serializable_results.append({
-                'url': result.url,
-                'title': result.title,
-                'content': result.content,
-                'links': result.links,
-                'status_code': result.status_code,
-                'crawl_time': result.crawl_time,
-                'timestamp': result.timestamp.isoformat(),
-                'metadata': result.metadata
-            })
+        fields = request.args.get('fields', DEFAULT_RESULT_FIELDS).split(',')
+        preview_chars = request.args.get('preview_chars', DEFAULT_PREVIEW_CHARS, type=int)
         
-        return jsonify({
-            'results': serializable_results,
-            'stats': status['stats']
-        })
+        truncate_content = 'content' in fields and preview_chars > 0
+        results = status['results']
+        stats = status['stats']
+        
+        # Stream JSON Lines: the crawl statistics, then one line per result
+        def generate():
+            yield orjson.dumps({'stats': stats}) + b'\n'
+            for row in iter_result_rows(results, fields):
+                if truncate_content:
+                    row['content'] = row['content'][:preview_chars]
+                yield orjson.dumps(row) + b'\n'
+        
+        return Response(stream_with_context(generate()), mimetype='application/x-ndjson')
         
     except Exception as e:
         logger.error(f"Error getting crawler results {crawler_id}: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/crawlers/<crawler_id>/results/<int:index>', methods=['GET'])
+def get_crawler_result(crawler_id, index):
+    """API endpoint to get one full crawler result"""
+    try:
+        status = crawler_manager.get_crawler_status(crawler_id)
+        
+        if not status:
+            return jsonify({'error': 'Crawler not found'}), 404
+        
+        if status['status'] != 'completed':
+            return jsonify({'error': 'Crawler not completed'}), 400
+        
+        results = status['results']
+        if index >= len(results):
+            return jsonify({'error': 'Result not found'}), 404
+        
+        row = next(iter_result_rows(results[index:index + 1]))
+        return Response(orjson.dumps(row), mimetype='application/json')
+        
+    except Exception as e:
+        logger.error(f"Error getting crawler result {crawler_id}/{index}: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/crawlers/<crawler_id>/save', methods=['GET', 'POST'])
 def save_crawler_results(crawler_id):
     """API endpoint to check crawler results in database"""
@@ -783,21 +1361,12 @@ def save_crawler_results(crawler_id):
         if success:
             logger.info(f"Successfully confirmed results in database for crawler {crawler_id}: {message}")
             return jsonify({'success': True, 'message': message})
-        
-        # If we get here, the save failed, so try to force a save
-        logger.info(f"Attempting to force save for crawler {crawler_id}")
-        success, message = crawler_manager.save_results(crawler_id)
-        
-        if success:
-            logger.info(f"Force save successful for crawler {crawler_id}: {message}")
-            return jsonify({'success': True, 'message': message})
         else:
-            logger.error(f"Force save failed for crawler {crawler_id}: {message}")
+            logger.error(f"Saving results failed for crawler {crawler_id}: {message}")
             return jsonify({'success': False, 'error': message}), 400
             
     except Exception as e:
         logger.error(f"Error checking crawler results in database {crawler_id}: {e}")
-        import traceback
         logger.error(f"Traceback: {traceback.format_exc()}")
         return jsonify({'success': False, 'error': f'Internal server error: {str(e)}'}), 500
 
@@ -805,8 +1374,7 @@ def save_crawler_results(crawler_id):
 def get_crawl_history():
     """API endpoint to get crawl history"""
     try:
-        history = crawler_manager.get_crawl_history()
-        return jsonify(history)
+        return conditional_json_response(*crawler_manager.get_serialized_history())
     except Exception as e:
         logger.error(f"Error getting crawl history: {e}")
         return jsonify({'error': 'Internal server error'}), 500
@@ -846,6 +1414,10 @@ def search_websites():
         if status_code:
             filters['status_code'] = status_code
         
+        # Clamp here as well as in the query so offset, total_pages and the
+        # echoed limit describe the page that was actually returned
+        limit = max(1, min(limit, db_manager.max_results))
+        page = max(1, page)
         offset = (page - 1) * limit
         results, total_count = db_manager.search_websites(query, filters, limit, offset)
         
@@ -877,6 +1449,7 @@ def get_website_details(website_id):
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/database/domains', methods=['GET'])
+@cached_response(DB_RESPONSE_CACHE_TTL)
 def get_domains():
     """API endpoint to get all domains"""
     try:
@@ -888,6 +1461,7 @@ def get_domains():
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/database/sessions', methods=['GET'])
+@cached_response(DB_RESPONSE_CACHE_TTL)
 def get_crawl_sessions():
     """API endpoint to get crawl sessions"""
     try:
@@ -900,6 +1474,7 @@ def get_crawl_sessions():
         return jsonify({'error': 'Internal server error'}), 500
 
 @app.route('/api/database/statistics', methods=['GET'])
+@cached_response(DB_RESPONSE_CACHE_TTL)
 def get_database_statistics():
     """API endpoint to get database statistics"""
     try:
@@ -910,14 +1485,34 @@ def get_database_statistics():
         logger.error(f"Error getting database statistics: {e}")
         return jsonify({'error': 'Internal server error'}), 500
 
+@app.route('/api/database/bootstrap', methods=['GET'])
+@cached_response(DB_RESPONSE_CACHE_TTL)
+def get_database_bootstrap():
+    """API endpoint to get domains, crawl sessions and statistics in one response"""
+    try:
+        limit = request.args.get('limit', 50, type=int)
+        return jsonify({
+            'domains': db_manager.get_domains(),
+            'sessions': db_manager.get_crawl_sessions(limit),
+            'statistics': db_manager.get_statistics()
+        })
+        
+    except Exception as e:
+        logger.error(f"Error getting database bootstrap data: {e}")
+        return jsonify({'error': 'Internal server error'}), 500
+
 @app.route('/api/database/cleanup', methods=['POST'])
 def cleanup_old_data():
     """API endpoint to clean up old data"""
     try:
-        data = request.get_json()
-        days_old = data.get('days_old', 30) if data else 30
+        if json_body_too_large():
+            return jsonify({'success': False, 'error': 'Request body too large'}), 413
+        
+        data = read_json_body()
+        days_old = data.get('days_old', 30) if isinstance(data, dict) else 30
         
         deleted_count = db_manager.delete_old_data(days_old)
+        clear_response_cache()
         
         return jsonify({
             'success': True,
@@ -944,8 +1539,10 @@ def get_saved_files():
 def debug_crawlers():
     """Debug endpoint to show current crawler state"""
     try:
+        # Snapshot the registry; crawl workers and the idle sweep add and
+        # drop crawlers while this runs
         debug_info = {}
-        for crawler_id, crawler_info in crawler_manager.crawlers.items():
+        for crawler_id, crawler_info in list(crawler_manager.crawlers.items()):
             debug_info[crawler_id] = {
                 'name': crawler_info['name'],
                 'status': crawler_info['status'],
@@ -970,8 +1567,12 @@ def debug_crawlers():
 def start_batch_scrape():
     """API endpoint to start batch scraping"""
     try:
-        data = request.get_json()
-        if not data:
+        # Refuse oversized batches before reading them, not after parsing
+        if json_body_too_large(MAX_BATCH_BODY_BYTES):
+            return jsonify({'success': False, 'error': 'Request body too large'}), 413
+        
+        data = read_json_body(MAX_BATCH_BODY_BYTES)
+        if not isinstance(data, dict):
             return jsonify({'success': False, 'error': 'No data provided'}), 400
         
         urls = data.get('urls', [])
@@ -979,6 +1580,8 @@ def start_batch_scrape():
         
         if not urls or not isinstance(urls, list):
             return jsonify({'success': False, 'error': 'URLs must be a non-empty list'}), 400
+        if len(urls) > MAX_BATCH_URLS:
+            return jsonify({'success': False, 'error': f'Too many URLs; the limit is {MAX_BATCH_URLS}'}), 413
         
         # Start batch scrape
         batch_id, message = crawler_manager.start_batch_scrape(urls, config)
@@ -1008,31 +1611,21 @@ def upload_url_file():
         if file.filename == '':
             return jsonify({'success': False, 'error': 'No file selected'}), 400
         
-        # Check file type
-        allowed_extensions = {'txt', 'csv', 'json'}
-        if not file.filename.lower().endswith(tuple('.' + ext for ext in allowed_extensions)):
+        # Pick the parser by extension
+        extension = os.path.splitext(file.filename)[1].lower()
+        parse_urls = URL_FILE_PARSERS.get(extension)
+        if parse_urls is None:
             return jsonify({'success': False, 'error': 'Invalid file type. Use .txt, .csv, or .json'}), 400
         
-        # Read and parse file
-        content = file.read().decode('utf-8')
-        urls = []
-        
-        if file.filename.lower().endswith('.txt'):
-            urls = [line.strip() for line in content.split('\n') if line.strip() and not line.startswith('#')]
-        elif file.filename.lower().endswith('.csv'):
-            import csv
-            from io import StringIO
-            csv_reader = csv.reader(StringIO(content))
-            urls = [row[0].strip() for row in csv_reader if row and row[0].strip()]
-        elif file.filename.lower().endswith('.json'):
-            import json
-            data = json.loads(content)
-            if isinstance(data, list):
-                urls = [str(url) for url in data if url]
-            elif isinstance(data, dict) and 'urls' in data:
-                urls = [str(url) for url in data['urls'] if url]
-            else:
-                return jsonify({'success': False, 'error': 'Invalid JSON format'}), 400
+        # Parse the file as it streams in, so a long URL list never exists
+        # as one decoded string; stop reading once it runs past the cap
+        try:
+            urls = list(itertools.islice(parse_urls(file.stream), MAX_BATCH_URLS + 1))
+        except ValueError:
+            return jsonify({'success': False, 'error': f'Invalid {extension[1:].upper()} format'}), 400
+        
+        if len(urls) > MAX_BATCH_URLS:
+            return jsonify({'success': False, 'error': f'Too many URLs; the limit is {MAX_BATCH_URLS}'}), 413
         
         if not urls:
             return jsonify({'success': False, 'error': 'No valid URLs found in file'}), 400
@@ -1080,6 +1673,14 @@ def handle_connect():
     except Exception as e:
         logger.error(f"Error handling client connection: {e}")
 
+@socketio.on('subscribe_crawlers')
+def handle_subscribe_crawlers():
+    """Send the requesting client a snapshot of all crawlers; later changes are pushed"""
+    try:
+        emit('crawlers_snapshot', crawler_manager.get_crawler_snapshot())
+    except Exception as e:
+        logger.error(f"Error sending crawler snapshot: {e}")
+
 @socketio.on('disconnect')
 def handle_disconnect():
     """Handle client disconnection"""
@@ -1093,4 +1694,8 @@ if __name__ == '__main__':
     print("🌐 Open your browser to: http://localhost:5000")
     print("🕸️  The spider is ready to crawl the web!")
     
-    socketio.run(app, debug=True, host='0.0.0.0', port=5000)
+    # Debugger and reloader only when asked for; the reloader runs the whole
+    # app a second time in a child process and polls every source file
+    debug = os.environ.get('FLASK_DEBUG', '').lower() in ('1', 'true')
+    socketio.run(app, debug=debug, use_reloader=debug, host='0.0.0.0', port=5000,
+                 allow_unsafe_werkzeug=True)
@@ -7,6 +7,16 @@ Production-ready configuration for deployment
 import os
 import sys
 
+# Patch the standard library before anything else imports it, so sockets,
+# threads and sleeps in the crawler cooperate with the gevent hub that
+# Socket.IO runs on. Gunicorn's gevent workers patch on their own; this
+# covers running this file directly.
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    pass
+
 # Add the src directory to the Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 